@@ -1,59 +1,81 @@
 import math
 import random
 
-from game.constants import ARENA_CENTER_X, ARENA_CENTER_Y, ARENA_RADIUS
+from game.constants import ARENA_CENTER_X, ARENA_CENTER_Y, PLAYER_DASH_SPEED
+from game.ai_search import DIRECTIONS, SearchAI
+from game.threats import evaluate_threats, new_threat_table
+
+
+# 回避方向の候補 (8方向) と、危険度を調べる移動先までの距離
+DODGE_DIRECTIONS = DIRECTIONS[1:]
+DODGE_PROBE_DISTANCES = (PLAYER_DASH_SPEED * 3, PLAYER_DASH_SPEED * 6)
+# 移動スタイルの重み (接近/離脱, 周回, 中央へ戻る, ランダム)
+MOVEMENT_STYLE_WEIGHTS = (6, 2, 1, 2)
+# AI が出力するキー (Player.key_states と同じ並び) と、移動方針として保持するキー
+AI_KEYS = ("up", "down", "left", "right", "weapon_a", "weapon_b", "hyper", "dash", "special", "shield")
+MOVE_KEYS = ("up", "down", "left", "right", "dash")
+_RANDOM_VERTICAL = ("up", "down", "none")
+_RANDOM_HORIZONTAL = ("left", "right", "none")
+_RANDOM_DIRECTION = ("up", "down", "left", "right")
+
+
+class AIIntent:
+    """1プレイヤー分の AI の出力バッファ。
+
+    keys はそのまま player.key_states に渡す入力、movement は次の方針転換まで続ける移動方針、
+    threats は思考ごとの敵弾の着弾予測。
+    どれも最初に1度だけ作り、以降は毎フレーム中身を書き換えて使い回す。
+    """
+
+    __slots__ = ("keys", "movement", "threats")
+
+    def __init__(self):
+        self.keys = dict.fromkeys(AI_KEYS, False)
+        self.movement = dict.fromkeys(MOVE_KEYS, False)
+        self.threats = new_threat_table()
+
+    def clear_keys(self):
+        keys = self.keys
+        for key in AI_KEYS:
+            keys[key] = False
+        return keys
+
+    def clear_movement(self):
+        movement = self.movement
+        for key in MOVE_KEYS:
+            movement[key] = False
+        return movement
 
 
 class AIController:
     """AI-related controls extracted from Game."""
 
-    def __init__(self, game):
+    def __init__(self, game, movement_weights=MOVEMENT_STYLE_WEIGHTS):
         self.game = game
+        # decide_movement_style で各移動スタイルを選ぶ重み (接近/離脱, 周回, 中央, ランダム)
+        self.movement_weights = movement_weights
+        # 難易度 hard 用の先読み探索 (初回使用時に生成)
+        self.search_ai = None
+        # プレイヤーごとの出力バッファ (キーは is_player1)。Game.ai_move_direction1/2 の実体も兼ねる
+        self.intents = {True: AIIntent(), False: AIIntent()}
+
+    def intent_for(self, player):
+        return self.intents[player is self.game.player1]
 
     def auto_test_ai_control(self, player, opponent, is_player1=True):
-        ai_keys = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-            "weapon_a": False,
-            "weapon_b": False,
-            "hyper": False,
-            "dash": False,
-            "special": False,
-            "shield": False,
-        }
+        intent = self.intents[is_player1]
+        ai_keys = intent.clear_keys()
+        ai_direction = intent.movement
 
         ai_timer = self.game.ai_move_timer1 if is_player1 else self.game.ai_move_timer2
-        ai_direction = (
-            self.game.ai_move_direction1 if is_player1 else self.game.ai_move_direction2
-        )
 
-        projectile_data = self.predict_projectile_collision(player)
+        # 敵弾の走査はこの1回だけにし、回避判定とシールド判定で使い回す
+        threats = self.evaluate_threats(player)
+        projectile_data = self.predict_projectile_collision(player, threats)
         if projectile_data:
             proj, time_to_hit, _, _ = projectile_data
 
-            proj_dir_x = math.cos(proj.angle)
-            proj_dir_y = math.sin(proj.angle)
-
-            perp_x = -proj_dir_y
-            perp_y = proj_dir_x
-
-            arena_dx = ARENA_CENTER_X - player.x
-            arena_dy = ARENA_CENTER_Y - player.y
-            arena_distance = (arena_dx**2 + arena_dy**2) ** 0.5
-
-            if arena_distance > ARENA_RADIUS * 0.7:
-                to_center_x = arena_dx / (arena_distance or 1)
-                to_center_y = arena_dy / (arena_distance or 1)
-
-                dot_product = to_center_x * perp_x + to_center_y * perp_y
-                if dot_product < 0:
-                    perp_x = -perp_x
-                    perp_y = -perp_y
-            elif random.random() < 0.5:
-                perp_x = -perp_x
-                perp_y = -perp_y
+            perp_x, perp_y = self.choose_dodge_direction(player, proj)
 
             ai_keys["right"] = perp_x > 0
             ai_keys["left"] = perp_x < 0
@@ -66,22 +88,10 @@ class AIController:
 
             if is_player1:
                 self.game.ai_move_timer1 = 0
-                self.game.ai_move_direction1 = {
-                    "up": ai_keys["up"],
-                    "down": ai_keys["down"],
-                    "left": ai_keys["left"],
-                    "right": ai_keys["right"],
-                    "dash": ai_keys["dash"],
-                }
             else:
                 self.game.ai_move_timer2 = 0
-                self.game.ai_move_direction2 = {
-                    "up": ai_keys["up"],
-                    "down": ai_keys["down"],
-                    "left": ai_keys["left"],
-                    "right": ai_keys["right"],
-                    "dash": ai_keys["dash"],
-                }
+            for key in MOVE_KEYS:
+                ai_direction[key] = ai_keys[key]
 
             return ai_keys
 
@@ -92,11 +102,8 @@ class AIController:
             else:
                 self.game.ai_move_timer2 = 0
 
-        ai_keys["up"] = ai_direction["up"]
-        ai_keys["down"] = ai_direction["down"]
-        ai_keys["left"] = ai_direction["left"]
-        ai_keys["right"] = ai_direction["right"]
-        ai_keys["dash"] = ai_direction["dash"]
+        for key in MOVE_KEYS:
+            ai_keys[key] = ai_direction[key]
 
         if random.random() < 0.4:
             ai_keys["weapon_a"] = True
@@ -106,7 +113,7 @@ class AIController:
             ai_keys["special"] = True
 
         shield_chance = 0.1
-        if self.is_projectile_nearby(player, 70):
+        if self.is_projectile_nearby(player, 70, threats):
             shield_chance = 0.7
         ai_keys["shield"] = random.random() < shield_chance
 
@@ -115,6 +122,25 @@ class AIController:
 
         return ai_keys
 
+    def choose_dodge_direction(self, player, proj):
+        """危険度グリッドを引いて、移動先が最も安全な方向 (8方向) を選ぶ"""
+        field = self.game.danger_field
+        proj_dir_x = math.cos(proj.angle)
+        proj_dir_y = math.sin(proj.angle)
+
+        best_danger = None
+        best_direction = None
+        for dir_x, dir_y in DODGE_DIRECTIONS:
+            danger = 0.0
+            for distance in DODGE_PROBE_DISTANCES:
+                danger += field.danger_at(player.x + dir_x * distance, player.y + dir_y * distance, player)
+            # 同じ危険度なら弾の進路と直交する向きを優先する
+            danger += abs(dir_x * proj_dir_x + dir_y * proj_dir_y) * 0.01
+            if best_danger is None or danger < best_danger:
+                best_danger = danger
+                best_direction = (dir_x, dir_y)
+        return best_direction
+
     def decide_movement_style(self, player, opponent, is_player1):
         dx = opponent.x - player.x
         dy = opponent.y - player.y
@@ -123,17 +149,13 @@ class AIController:
         arena_dx = ARENA_CENTER_X - player.x
         arena_dy = ARENA_CENTER_Y - player.y
 
-        movement = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-            "dash": random.random() < 0.4,
-        }
+        movement = self.intents[is_player1].clear_movement()
+        movement["dash"] = random.random() < 0.4
 
-        move_style = random.randint(0, 10)
+        approach, orbit, center, _ = self.movement_weights
+        move_style = random.randint(0, sum(self.movement_weights) - 1)
 
-        if move_style <= 5:
+        if move_style < approach:
             if distance > 150:
                 movement["right"] = dx > 0
                 movement["left"] = dx < 0
@@ -144,7 +166,7 @@ class AIController:
                 movement["right"] = dx < 0
                 movement["up"] = dy > 0
                 movement["down"] = dy < 0
-        elif move_style <= 7:
+        elif move_style < approach + orbit:
             clockwise = random.random() < 0.5
             if clockwise:
                 movement["left"] = dy > 0
@@ -156,93 +178,44 @@ class AIController:
                 movement["right"] = dy > 0
                 movement["up"] = dx < 0
                 movement["down"] = dx > 0
-        elif move_style <= 8:
+        elif move_style < approach + orbit + center:
             movement["right"] = arena_dx > 0
             movement["left"] = arena_dx < 0
             movement["down"] = arena_dy > 0
             movement["up"] = arena_dy < 0
         else:
-            vertical = random.choice(["up", "down", "none"])
-            horizontal = random.choice(["left", "right", "none"])
+            vertical = random.choice(_RANDOM_VERTICAL)
+            horizontal = random.choice(_RANDOM_HORIZONTAL)
             if vertical != "none":
                 movement[vertical] = True
             if horizontal != "none":
                 movement[horizontal] = True
-            if not any([movement["up"], movement["down"], movement["left"], movement["right"]]):
-                movement[random.choice(["up", "down", "left", "right"])] = True
+            if not (movement["up"] or movement["down"] or movement["left"] or movement["right"]):
+                movement[random.choice(_RANDOM_DIRECTION)] = True
+
+    def evaluate_threats(self, player):
+        """player に対する敵弾の着弾予測表 (ThreatTable)。表は player ごとに使い回す"""
+        return evaluate_threats(player, self.game.projectiles, table=self.intent_for(player).threats)
+
+    def predict_projectile_collision(self, player, threats=None):
+        """最も早く当たる敵弾を (弾, 着弾時間, 着弾x, 着弾y) で返す。なければ None"""
+        if threats is None:
+            threats = self.evaluate_threats(player)
+        return threats.earliest()
+
+    def is_projectile_nearby(self, player, distance_threshold, threats=None):
+        if threats is None:
+            threats = self.evaluate_threats(player)
+        return threats.any_within(distance_threshold)
+
+    def simple_ai_control(self, player=None, opponent=None):
+        """対戦モードの相手 AI (デフォルトはプレイヤー2を操作する)"""
+        player = player or self.game.player2
+        opponent = opponent or self.game.player1
+        ai_keys = self.intent_for(player).clear_keys()
 
-        if is_player1:
-            self.game.ai_move_direction1 = movement
-        else:
-            self.game.ai_move_direction2 = movement
-
-    def predict_projectile_collision(self, player):
-        closest_hit_time = float("inf")
-        closest_projectile = None
-        hit_position = None
-
-        for proj in self.game.projectiles:
-            if proj.owner == player:
-                continue
-
-            proj_vx = math.cos(proj.angle) * proj.speed
-            proj_vy = math.sin(proj.angle) * proj.speed
-
-            dx = player.x - proj.x
-            dy = player.y - proj.y
-
-            a = proj_vx * proj_vx + proj_vy * proj_vy
-            b = 2 * (proj_vx * dx + proj_vy * dy)
-            c = dx * dx + dy * dy - (player.radius + proj.radius) * (player.radius + proj.radius)
-
-            discriminant = b * b - 4 * a * c
-            if discriminant < 0 or a <= 0:
-                continue
-
-            t1 = (-b - math.sqrt(discriminant)) / (2 * a)
-            t2 = (-b + math.sqrt(discriminant)) / (2 * a)
-
-            hit_time = None
-            if t1 > 0:
-                hit_time = t1
-            elif t2 > 0:
-                hit_time = t2
-
-            if hit_time is not None and hit_time < closest_hit_time and hit_time < 60:
-                closest_hit_time = hit_time
-                closest_projectile = proj
-                hit_position = (proj.x + proj_vx * hit_time, proj.y + proj_vy * hit_time)
-
-        if closest_projectile and hit_position:
-            return (closest_projectile, closest_hit_time, hit_position[0], hit_position[1])
-        return None
-
-    def is_projectile_nearby(self, player, distance_threshold):
-        for proj in self.game.projectiles:
-            if proj.owner == player:
-                continue
-            dx = player.x - proj.x
-            dy = player.y - proj.y
-            if (dx**2 + dy**2) ** 0.5 < distance_threshold:
-                return True
-        return False
-
-    def simple_ai_control(self):
-        ai_keys = {
-            "up": False,
-            "down": False,
-            "left": False,
-            "right": False,
-            "weapon_a": False,
-            "weapon_b": False,
-            "hyper": False,
-            "dash": False,
-            "special": False,
-            "shield": False,
-        }
-
-        dx = self.game.player1.x - self.game.player2.x
-        dy = self.game.player1.y - self.game.player2.y
+        dx = opponent.x - player.x
+        dy = opponent.y - player.y
         distance = (dx**2 + dy**2) ** 0.5
 
         if distance > 150:
@@ -263,7 +236,17 @@ class AIController:
                 ai_keys["weapon_b"] = True
             if self.game.current_time % 120 == 0:
                 ai_keys["dash"] = True
-            if self.game.player2.hyper_gauge >= 100 and self.game.current_time % 180 == 0:
+            if player.hyper_gauge >= 100 and self.game.current_time % 180 == 0:
                 ai_keys["hyper"] = True
 
-        return ai_keys
+        return ai_keys
+
+    def search_ai_control(self):
+        """難易度 hard: プレイヤー2を先読み探索で操作する"""
+        if self.search_ai is None:
+            self.search_ai = SearchAI()
+        player = self.game.player2
+        return self.search_ai.control(
+            player, self.game.player1, self.game.projectiles, hyper_ready=player.hyper_gauge >= 100,
+            keys=self.intent_for(player).keys,
+        )
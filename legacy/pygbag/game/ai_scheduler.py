@@ -0,0 +1,69 @@
+from game.constants import AI_THINK_INTERVAL, AI_THINK_TRIGGER_DISTANCE
+
+
+class _ThinkSlot:
+    """1プレイヤー分の思考スケジュールと前回の思考結果"""
+
+    def __init__(self, phase):
+        # 初回の思考後、次の思考までのフレーム数をこの分だけ縮めて位相をずらす
+        self.phase = phase
+        self.countdown = 0
+        self.keys = None
+        self.known_projectiles = set()
+
+
+class AIScheduler:
+    """自動テスト AI の思考 (敵弾の予測・距離判定・移動方針) を数フレームに1回に間引く。
+
+    思考しないフレームは前回の入力をそのまま繰り返す。
+    ただし新しい敵弾が trigger_distance 内に入ったら、周期を待たずにすぐ思考し直す。
+    2人の思考フレームは半周期ずらし、同じフレームに重ならないようにする。
+    """
+
+    def __init__(self, controller, think_interval=AI_THINK_INTERVAL,
+                 trigger_distance=AI_THINK_TRIGGER_DISTANCE):
+        self.controller = controller
+        self.think_interval = max(1, int(think_interval))
+        self.trigger_distance = trigger_distance
+        self.think_count = 0
+        self.reset()
+
+    def reset(self):
+        """思考結果を捨てて次のフレームから思考し直す (試合の開始時など)"""
+        self.slots = {
+            True: _ThinkSlot(0),
+            False: _ThinkSlot(self.think_interval // 2),
+        }
+
+    def control(self, player, opponent, is_player1=True):
+        """このフレームの AI 入力を返す (必要なときだけ AIController で思考する)"""
+        slot = self.slots[is_player1]
+        if slot.keys is None or slot.countdown <= 0 or self._new_threat_in_range(player, slot):
+            first_think = slot.keys is None
+            slot.keys = self.controller.auto_test_ai_control(player, opponent, is_player1)
+            if self.think_interval > 1:
+                slot.known_projectiles = self._projectiles_in_range(player)
+            slot.countdown = slot.phase if first_think and slot.phase else self.think_interval
+            self.think_count += 1
+        slot.countdown -= 1
+        return slot.keys
+
+    def _projectiles_in_range(self, player):
+        limit = self.trigger_distance * self.trigger_distance
+        return {
+            id(proj)
+            for proj in self.controller.game.projectiles
+            if proj.owner != player
+            and (proj.x - player.x) ** 2 + (proj.y - player.y) ** 2 < limit
+        }
+
+    def _new_threat_in_range(self, player, slot):
+        if self.think_interval == 1:
+            return False
+        limit = self.trigger_distance * self.trigger_distance
+        for proj in self.controller.game.projectiles:
+            if proj.owner == player or id(proj) in slot.known_projectiles:
+                continue
+            if (proj.x - player.x) ** 2 + (proj.y - player.y) ** 2 < limit:
+                return True
+        return False
@@ -0,0 +1,206 @@
+import math
+import time
+
+from game.constants import (
+    AI_SEARCH_HORIZON,
+    AI_SEARCH_TIME_BUDGET_MS,
+    ARENA_CENTER_X,
+    ARENA_CENTER_Y,
+    ARENA_RADIUS,
+    ARENA_WARNING_RADIUS,
+    PLAYER_DASH_SPEED,
+    PLAYER_SPEED,
+)
+
+# 候補の移動方向 (停止 + 8方向、斜めは正規化済み)
+_DIAGONAL = 1 / math.sqrt(2)
+DIRECTIONS = (
+    (0.0, 0.0),
+    (1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.0, -1.0),
+    (_DIAGONAL, _DIAGONAL), (_DIAGONAL, -_DIAGONAL),
+    (-_DIAGONAL, _DIAGONAL), (-_DIAGONAL, -_DIAGONAL),
+)
+
+# 評価の重み
+DAMAGE_WEIGHT = 10.0  # 被ダメージ1あたり
+BORDER_WEIGHT = 1.0  # 警告リングの外にいる1フレームあたり
+RANGE_WEIGHT = 0.02  # 相手との距離が PREFERRED_RANGE からずれている1pxあたり
+DASH_WEIGHT = 0.05  # ダッシュ1フレームあたり (ヒートの消費)
+PREFERRED_RANGE = 200
+SHIELD_REACTION_FRAMES = 15  # 最善手でもこのフレーム数以内に被弾するならシールドを張る
+
+
+class SearchSnapshot:
+    """先読み用に切り出した対戦状態。
+
+    弾は (x, y, vx, vy, 当たり判定距離の2乗, ダメージ, 残り寿命) の不変タプルで持ち、
+    t フレーム後の位置は x + vx * t で求める (ホーミングは無視する)。
+    状態の分岐で変わるのはプレイヤー位置と当たった弾だけなので、コピーは数個の float で済む。
+    """
+
+    __slots__ = ("x", "y", "opponent_x", "opponent_y", "projectiles")
+
+    def __init__(self, x, y, opponent_x, opponent_y, projectiles):
+        self.x = x
+        self.y = y
+        self.opponent_x = opponent_x
+        self.opponent_y = opponent_y
+        self.projectiles = projectiles
+
+    @classmethod
+    def capture(cls, player, opponent, projectiles):
+        """現在の対戦状態から player 視点のスナップショットを作る"""
+        hostile = []
+        for proj in projectiles:
+            if proj.owner == player or proj.speed <= 0:
+                continue
+            vx = math.cos(proj.angle) * proj.speed
+            vy = math.sin(proj.angle) * proj.speed
+            reach = player.radius + proj.radius
+            hostile.append((proj.x, proj.y, vx, vy, reach * reach, proj.damage, proj.lifetime))
+        return cls(player.x, player.y, opponent.x, opponent.y, tuple(hostile))
+
+
+def rollout(snapshot, plan, horizon):
+    """plan = ((方向, ダッシュ, フレーム数), ...) を horizon フレーム実行したときの評価値を返す。
+
+    戻り値は (コスト, 最初に被弾したフレーム or None, シミュレーションしたフレーム数)。
+    """
+    x = snapshot.x
+    y = snapshot.y
+    projectiles = snapshot.projectiles
+    alive = [True] * len(projectiles)
+    limit = ARENA_RADIUS - 1
+    warning_sq = ARENA_WARNING_RADIUS * ARENA_WARNING_RADIUS
+
+    cost = 0.0
+    first_hit = None
+    frame = 0
+    for (dir_x, dir_y), dash, frames in plan:
+        speed = PLAYER_DASH_SPEED if dash else PLAYER_SPEED
+        step_x = dir_x * speed
+        step_y = dir_y * speed
+        for _ in range(frames):
+            if frame >= horizon:
+                break
+            frame += 1
+            x += step_x
+            y += step_y
+            # アリーナ内に制約 (Arena.constrain_position と同じ)
+            cx = x - ARENA_CENTER_X
+            cy = y - ARENA_CENTER_Y
+            center_sq = cx * cx + cy * cy
+            if center_sq >= limit * limit:
+                scale = limit / math.sqrt(center_sq)
+                x = ARENA_CENTER_X + cx * scale
+                y = ARENA_CENTER_Y + cy * scale
+            elif center_sq > warning_sq:
+                cost += BORDER_WEIGHT
+            if dash:
+                cost += DASH_WEIGHT
+
+            for i, (px, py, vx, vy, reach_sq, damage, lifetime) in enumerate(projectiles):
+                if not alive[i] or frame > lifetime:
+                    continue
+                dx = x - (px + vx * frame)
+                dy = y - (py + vy * frame)
+                if dx * dx + dy * dy < reach_sq:
+                    alive[i] = False
+                    cost += damage * DAMAGE_WEIGHT
+                    if first_hit is None:
+                        first_hit = frame
+
+    dx = snapshot.opponent_x - x
+    dy = snapshot.opponent_y - y
+    cost += abs(math.sqrt(dx * dx + dy * dy) - PREFERRED_RANGE) * RANGE_WEIGHT
+    return cost, first_hit, frame
+
+
+def candidate_plans(horizon):
+    """評価する行動列を有望な順に返す。
+
+    まず「1方向を押し続ける」単純な手を全て試し、残り時間で
+    「前半をダッシュで逃げてから別方向へ動く」2段の手を評価する。
+    """
+    plans = []
+    for direction in DIRECTIONS:
+        plans.append(((direction, False, horizon),))
+    for direction in DIRECTIONS[1:]:
+        plans.append(((direction, True, horizon),))
+    first = max(1, horizon // 3)
+    for direction in DIRECTIONS[1:]:
+        for follow in DIRECTIONS:
+            if follow != direction:
+                plans.append(((direction, True, first), (follow, False, horizon - first)))
+    return tuple(plans)
+
+
+class SearchAI:
+    """難易度 hard の対戦相手 AI。
+
+    毎フレーム対戦状態を SearchSnapshot に切り出し、候補の行動列を
+    horizon フレーム先まで前向きシミュレーションして最もコストの低い手を選ぶ。
+    探索は time_budget_ms で打ち切るので、弾が多いフレームでも時間は一定以内に収まる。
+    """
+
+    def __init__(self, horizon=AI_SEARCH_HORIZON, time_budget_ms=AI_SEARCH_TIME_BUDGET_MS):
+        self.horizon = horizon
+        self.time_budget = time_budget_ms / 1000.0
+        self.plans = candidate_plans(horizon)
+        self.total_nodes = 0
+        self.total_time = 0.0
+        self.last_nodes = 0
+        self.last_plans = 0
+
+    @property
+    def nodes_per_second(self):
+        """これまでの探索でシミュレーションしたフレーム数 / 秒"""
+        return self.total_nodes / self.total_time if self.total_time > 0 else 0.0
+
+    def search(self, snapshot):
+        """時間内に評価できた中で最善の (行動列, コスト, 最初の被弾フレーム) を返す"""
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        best = None
+        nodes = 0
+        evaluated = 0
+        for plan in self.plans:
+            cost, first_hit, frames = rollout(snapshot, plan, self.horizon)
+            nodes += frames
+            evaluated += 1
+            if best is None or cost < best[1]:
+                best = (plan, cost, first_hit)
+            if time.perf_counter() >= deadline:
+                break
+        self.last_nodes = nodes
+        self.last_plans = evaluated
+        self.total_nodes += nodes
+        self.total_time += time.perf_counter() - start
+        return best
+
+    def control(self, player, opponent, projectiles, hyper_ready=False, keys=None):
+        """player のこのフレームの入力 (key_states と同じ形の辞書) を返す。
+
+        keys を渡すと新しい辞書は作らず、その中身を書き換えて返す。
+        """
+        snapshot = SearchSnapshot.capture(player, opponent, projectiles)
+        plan, _, first_hit = self.search(snapshot)
+        (dir_x, dir_y), dash, _ = plan[0]
+
+        dx = opponent.x - player.x
+        dy = opponent.y - player.y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if keys is None:
+            keys = {}
+        keys["up"] = dir_y < 0
+        keys["down"] = dir_y > 0
+        keys["left"] = dir_x < 0
+        keys["right"] = dir_x > 0
+        keys["weapon_a"] = True
+        keys["weapon_b"] = distance < 250
+        keys["hyper"] = hyper_ready
+        keys["dash"] = dash
+        keys["special"] = False
+        # 最善手でも避けきれない弾が迫っているときだけシールド
+        keys["shield"] = first_hit is not None and first_hit <= SHIELD_REACTION_FRAMES
+        return keys
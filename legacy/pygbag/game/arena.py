@@ -1,9 +1,31 @@
 import pygame
 import math
+from collections import OrderedDict
+from game.camera import IDENTITY_CAMERA
 from game.constants import ARENA_RADIUS, ARENA_WARNING_RADIUS, ARENA_CENTER_X, ARENA_CENTER_Y, ORANGE, RED
 
 class Arena:
     """円形アリーナを管理するクラス"""
+
+    # 境界線の点滅範囲
+    BORDER_ALPHA_MIN = 100
+    BORDER_ALPHA_MAX = 255
+    # 警告リングの色付け済みフレーム数
+    RING_TINT_STEPS = 8
+    # ダーティ矩形描画で警告リングを覆う矩形の分割数
+    RING_DIRTY_SEGMENTS = 32
+    # 静的レイヤーの透過色（アリーナ内で黒は使わない）
+    LAYER_COLORKEY = (0, 0, 0)
+    # ズーム刻みごとに保持する拡大済み静的レイヤーの数
+    SCALED_LAYER_CACHE_SIZE = 4
+
+    # 描画レイヤーは形状が同じなら全インスタンスで共有する
+    # (タイトル背景用の Game も同じレイヤーを使い回す)
+    _static_layers = {}
+    _ring_frames = {}
+    _ring_dirty_rects = {}
+    _scaled_static_layers = OrderedDict()
+
     def __init__(self):
         self.radius = ARENA_RADIUS
         self.warning_radius = ARENA_WARNING_RADIUS
@@ -11,45 +33,148 @@ class Arena:
         self.center_y = ARENA_CENTER_Y
         
         # アリーナ境界の点滅用
-        self.border_alpha = 255
+        self.border_alpha = self.BORDER_ALPHA_MAX
         self.border_alpha_direction = -1
         self.border_alpha_speed = 5
+        # 直前に描画した警告リングの段階 (ダーティ矩形描画用)
+        self._drawn_ring_step = None
+        self.ring_changed = True
         
     def update(self):
         """アリーナの状態を更新"""
         # 境界線のアルファ値を更新（点滅効果）
         self.border_alpha += self.border_alpha_direction * self.border_alpha_speed
-        if self.border_alpha <= 100:
-            self.border_alpha = 100
+        if self.border_alpha <= self.BORDER_ALPHA_MIN:
+            self.border_alpha = self.BORDER_ALPHA_MIN
             self.border_alpha_direction = 1
-        elif self.border_alpha >= 255:
-            self.border_alpha = 255
+        elif self.border_alpha >= self.BORDER_ALPHA_MAX:
+            self.border_alpha = self.BORDER_ALPHA_MAX
             self.border_alpha_direction = -1
             
-    def draw(self, screen):
-        """アリーナを描画"""
-        # 背景を描画
-        pygame.draw.circle(screen, (20, 20, 40), (self.center_x, self.center_y), self.radius)
-        
-        # 水分補給エリア（中央）
-        water_color = (50, 100, 200, 100) # 半透明の青
-        # Pygameのdraw.circleはRGBAタプルを直接サポートしていない場合があるため、サーフェスを使用
-        overlay = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(overlay, water_color, (self.radius, self.radius), 100)
-        screen.blit(overlay, (self.center_x - self.radius, self.center_y - self.radius))
-
-        # 警告リングを描画（点滅効果）
+    def draw(self, screen, camera=IDENTITY_CAMERA):
+        """アリーナを描画
+
+        床・水分補給エリア・外周リングは静的レイヤーとして一度だけ合成し、
+        点滅する警告リングは border_alpha ごとに色付け済みのフレームを blit する。
+        毎フレームの SRCALPHA Surface 確保と円の再描画を避けるため (pygbag 対策)。
+        ズーム中はズーム刻みごとに拡縮済みの静的レイヤーを使う。
+        """
+        step = self._ring_step(self.border_alpha)
+        self.ring_changed = step != self._drawn_ring_step
+        self._drawn_ring_step = step
+
+        if camera.is_identity:
+            origin = (self.center_x - self.radius, self.center_y - self.radius)
+            screen.blit(self._get_static_layer(), origin)
+            screen.blit(self._get_ring_frame(self.border_alpha), origin)
+            return
+
+        left, top = camera.world_to_screen(self.center_x - self.radius, self.center_y - self.radius)
+        screen.blit(self._get_scaled_static_layer(camera.pixel_scale), (int(left), int(top)))
+        center_x, center_y = camera.world_to_screen(self.center_x, self.center_y)
+        pygame.draw.circle(
+            screen, self._ring_color(step), (int(center_x), int(center_y)),
+            camera.scale(self.warning_radius), camera.scale_width(2)
+        )
+
+    def get_dirty_rects(self):
+        """直前の draw() で描き変わった領域を返す。
+
+        静的レイヤーは変化しないので、警告リングの色段階が変わったフレームだけ
+        リングに沿った小さな矩形群を返す。
+        """
+        if not self.ring_changed:
+            return []
+        key = self._layer_key()
+        rects = Arena._ring_dirty_rects.get(key)
+        if rects is None:
+            rects = []
+            margin = 5  # 弧の膨らみとリングの線幅ぶん
+            for i in range(self.RING_DIRTY_SEGMENTS):
+                a0 = 2 * math.pi * i / self.RING_DIRTY_SEGMENTS
+                a1 = 2 * math.pi * (i + 1) / self.RING_DIRTY_SEGMENTS
+                xs = [self.center_x + math.cos(a) * self.warning_radius for a in (a0, a1)]
+                ys = [self.center_y + math.sin(a) * self.warning_radius for a in (a0, a1)]
+                left, top = int(min(xs)) - margin, int(min(ys)) - margin
+                right, bottom = int(max(xs)) + margin, int(max(ys)) + margin
+                rects.append(pygame.Rect(left, top, right - left, bottom - top))
+            Arena._ring_dirty_rects[key] = rects
+        return rects
+
+    def _layer_key(self):
+        return (self.radius, self.warning_radius)
+
+    def _new_layer(self):
+        """黒をカラーキーにした (radius*2, radius*2) の透過レイヤーを作る"""
+        layer = pygame.Surface((self.radius * 2, self.radius * 2))
+        layer.fill(self.LAYER_COLORKEY)
+        layer.set_colorkey(self.LAYER_COLORKEY, pygame.RLEACCEL)
+        return layer
+
+    def _get_static_layer(self):
+        """床・水分補給エリア・外周リングを焼き込んだレイヤーを返す"""
+        key = self._layer_key()
+        layer = Arena._static_layers.get(key)
+        if layer is None:
+            layer = self._new_layer()
+            # 背景
+            pygame.draw.circle(layer, (20, 20, 40), (self.radius, self.radius), self.radius)
+
+            # 水分補給エリア（中央）: 半透明の青を床色と事前にブレンドしておく
+            water_color = (50, 100, 200, 100)
+            overlay = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(overlay, water_color, (self.radius, self.radius), 100)
+            layer.blit(overlay, (0, 0))
+
+            # 外側のリング
+            pygame.draw.rect(layer, RED, (0, 0, self.radius * 2, self.radius * 2), 3, border_radius=self.radius)
+            Arena._static_layers[key] = layer
+        return layer
+
+    def _get_scaled_static_layer(self, scale):
+        """カメラ倍率 (ズーム刻み済み) に合わせて拡縮した静的レイヤーを返す (LRU で数枚だけ保持)"""
+        key = self._layer_key() + (scale,)
+        cache = Arena._scaled_static_layers
+        layer = cache.get(key)
+        if layer is not None:
+            cache.move_to_end(key)
+            return layer
+        size = int(round(self.radius * 2 * scale))
+        layer = pygame.transform.scale(self._get_static_layer(), (size, size))
+        layer.set_colorkey(self.LAYER_COLORKEY, pygame.RLEACCEL)
+        cache[key] = layer
+        if len(cache) > self.SCALED_LAYER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return layer
+
+    def _ring_step(self, border_alpha):
+        """border_alpha を RING_TINT_STEPS 段階のインデックスに量子化する"""
+        span = self.BORDER_ALPHA_MAX - self.BORDER_ALPHA_MIN
+        ratio = (min(max(border_alpha, self.BORDER_ALPHA_MIN), self.BORDER_ALPHA_MAX) - self.BORDER_ALPHA_MIN) / span
+        return int(round(ratio * (self.RING_TINT_STEPS - 1)))
+
+    def _get_ring_frame(self, border_alpha):
+        """警告リングの色付け済みフレームを返す（無ければ生成してキャッシュ）"""
+        step = self._ring_step(border_alpha)
+        key = self._layer_key() + (step,)
+        frame = Arena._ring_frames.get(key)
+        if frame is None:
+            frame = self._new_layer()
+            pygame.draw.circle(frame, self._ring_color(step), (self.radius, self.radius), self.warning_radius, 2)
+            Arena._ring_frames[key] = frame
+        return frame
+
+    def _ring_color(self, step):
+        """警告リングの段階に対応する色"""
         # アルファ値の計算はRGBタプルにはできないので、明度を変更する方法を使用
-        alpha_ratio = self.border_alpha / 255.0
-        warning_color = (
+        span = self.BORDER_ALPHA_MAX - self.BORDER_ALPHA_MIN
+        alpha = self.BORDER_ALPHA_MIN + span * step / (self.RING_TINT_STEPS - 1)
+        alpha_ratio = alpha / 255.0
+        return (
             int(ORANGE[0] * alpha_ratio),
             int(ORANGE[1] * alpha_ratio),
             int(ORANGE[2] * alpha_ratio)
         )
-        pygame.draw.circle(screen, warning_color, (self.center_x, self.center_y), self.warning_radius, 2)
-        
-        # 外側のリングを描画
-        pygame.draw.rect(screen, RED, (self.center_x - self.radius, self.center_y - self.radius, self.radius * 2, self.radius * 2), 3, border_radius=self.radius)
         
     def is_inside(self, x, y):
         """座標がアリーナ内にあるかチェック"""
@@ -0,0 +1,182 @@
+import asyncio
+import os
+import sys
+import threading
+from collections import deque
+
+import pygame
+
+
+class LazySound:
+    """読み込みが終わるまでは無音の代役になる Sound。
+
+    pygame.mixer.Sound と同じ play/stop/set_volume を持ち、読み込み後は実体に処理を渡す。
+    呼び出し側は読み込みの完了を待たずにこのオブジェクトを持っておける。
+    読み込み前に play(-1) されたループ音は、読み込みが終わった時点で鳴らし始める。
+    bundle にファイル名 (拡張子なし) の PCM があれば、デコードせずにそれを使う。
+    channel (チャンネル番号) を渡すと、空きチャンネルではなくそのチャンネルで鳴らす (BGM 用の予約チャンネル)。
+    """
+
+    def __init__(self, name, path, volume=None, bundle=None, channel=None):
+        self.name = name
+        self.path = path
+        self.volume = volume
+        self.bundle = bundle
+        self.channel = channel
+        self.key = os.path.splitext(os.path.basename(path))[0]  # バンドル内の名前
+        self.sound = None
+        self.failed = False
+        self._pending_loops = None  # 読み込み前に要求されたループ再生
+
+    @property
+    def ready(self):
+        return self.sound is not None
+
+    def load(self):
+        """バンドルの PCM から、なければファイルをデコードして Sound を作る (読み込みスレッド・タスクから呼ばれる)"""
+        try:
+            if self.bundle is not None and self.bundle.playable(self.key):
+                sound = self.bundle.sound(self.key)
+            else:
+                sound = pygame.mixer.Sound(self.path)
+        except Exception:
+            self.failed = True
+            return False
+        if self.volume is not None:
+            sound.set_volume(self.volume)
+        self.sound = sound
+        return True
+
+    def play(self, loops=0, maxtime=0, fade_ms=0):
+        if self.sound is not None:
+            return self._play(loops, maxtime, fade_ms)
+        # 効果音は後から鳴らしても意味がないので捨て、ループ (BGM) だけ覚えておく
+        if loops != 0:
+            self._pending_loops = loops
+        return None
+
+    def stop(self):
+        self._pending_loops = None
+        if self.sound is not None:
+            self.sound.stop()
+
+    def set_volume(self, volume):
+        self.volume = volume
+        if self.sound is not None:
+            self.sound.set_volume(volume)
+
+    def get_volume(self):
+        if self.sound is not None:
+            return self.sound.get_volume()
+        return 1.0 if self.volume is None else self.volume
+
+    def get_length(self):
+        return self.sound.get_length() if self.sound is not None else 0.0
+
+    def start_pending(self):
+        """読み込み前に要求されていたループ再生を始める (メインスレッドから呼ぶ)"""
+        if self.sound is not None and self._pending_loops is not None:
+            loops, self._pending_loops = self._pending_loops, None
+            self._play(loops)
+
+    def _play(self, loops, *args):
+        if self.channel is None:
+            return self.sound.play(loops, *args)
+        channel = pygame.mixer.Channel(self.channel)
+        channel.play(self.sound, loops, *args)
+        return channel
+
+
+class AudioAssets:
+    """音声ファイルを優先度順に裏で読み込む。
+
+    register() した時点で LazySound を返すので、起動処理はデコードを待たずに進める。
+    デスクトップではデーモンスレッド、pygbag (WASM) ではイベントループのタスクで
+    1ファイルずつデコードする (WASM ではスレッドが使えないため、1フレームに1ファイルまで)。
+    bundle (SoundBundle) を渡すと、そこに入っている音はファイルを開かずにバンドルから作る。
+    持ち主 (Game) を捨てるときは stop() で読み込みをやめる。
+    """
+
+    def __init__(self, bundle=None):
+        self.bundle = bundle
+        self.assets = {}  # 名前 -> LazySound
+        self._queue = []
+        self._lock = threading.Lock()  # _queue は読み込みスレッドとメインスレッドの両方から触る
+        self._loaded = deque()  # 読み込みが終わった LazySound (poll で拾う)
+        self._thread = None
+        self._task = None
+
+    def register(self, name, path, priority=0, volume=None, channel=None):
+        """読み込む音声を登録する。バンドルにもファイルにもなければ None"""
+        key = os.path.splitext(os.path.basename(path))[0]
+        bundle = self.bundle if self.bundle is not None and key in self.bundle else None
+        if bundle is None and not os.path.exists(path):
+            return None
+        sound = LazySound(name, path, volume, bundle, channel)
+        with self._lock:
+            self._queue.append((priority, len(self._queue), sound))
+            self._queue.sort(key=lambda entry: entry[:2])
+        self.assets[name] = sound
+        return sound
+
+    @property
+    def pending(self):
+        """まだ読み込んでいない音声の数"""
+        return len(self._queue)
+
+    def start(self):
+        """裏での読み込みを始める"""
+        if not self._queue or self._thread is not None or self._task is not None:
+            return
+        if sys.platform != "emscripten":
+            self._thread = threading.Thread(target=self.load_all, name="audio-assets", daemon=True)
+            self._thread.start()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.load_all()
+            return
+        self._task = loop.create_task(self._load_async())
+
+    def load_next(self):
+        """優先度の最も高い音声を1つ読み込む。残りがなければ False"""
+        with self._lock:
+            if not self._queue:
+                return False
+            _, _, sound = self._queue.pop(0)
+        if pygame.mixer.get_init() and sound.load():
+            self._loaded.append(sound)
+        return True
+
+    def load_all(self):
+        while self.load_next():
+            pass
+
+    def stop(self, timeout=None):
+        """裏での読み込みをやめる。読み込み中の1ファイルが終わるのを待ってスレッドを終える
+
+        まだ読み込んでいない音声は読み込まず、無音のままになる。
+        """
+        with self._lock:
+            self._queue.clear()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def wait(self, timeout=None):
+        """裏での読み込みが終わるまで待つ (スレッドで読み込んでいるときのみ)"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    async def _load_async(self):
+        while self.load_next():
+            await asyncio.sleep(0)
+
+    def poll(self):
+        """メインループから毎フレーム呼ぶ。読み込みが終わった音声のうち再生待ちのものを鳴らす"""
+        while self._loaded:
+            self._loaded.popleft().start_pending()
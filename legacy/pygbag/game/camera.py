@@ -0,0 +1,100 @@
+import math
+
+import pygame
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# ズーム率はこの刻みに丸める (拡大済みスプライトのキャッシュ単位)
+ZOOM_BUCKET_STEP = 0.025
+
+# プレイヤー間距離に応じたズーム (アドバタイズモード用)
+FOLLOW_MIN_DISTANCE = 150
+FOLLOW_MAX_DISTANCE = 400
+FOLLOW_MAX_ZOOM = 1.5
+FOLLOW_MIN_ZOOM = 1.0
+
+
+def quantize_zoom(zoom):
+    """ズーム率を ZOOM_BUCKET_STEP 刻みに丸める"""
+    return round(zoom / ZOOM_BUCKET_STEP) * ZOOM_BUCKET_STEP
+
+
+class Camera:
+    """ワールド座標 → 画面座標の変換 (ズームと注視点)。
+
+    各エンティティは draw(screen, camera) でこの変換を通して直接描画する。
+    ワールド全体を一旦バッファに描いてから拡大縮小するのではないので、
+    ズーム中でも等倍フレームと同じコストで描ける。
+    ビューはワールド (0, 0)-(world_width, world_height) の外へはみ出さない。
+
+    resolution_scale は出力先の解像度倍率 (画面より小さいバッファに描く場合 < 1)。
+    zoom はゲーム的なズーム率で、実際の1ワールド単位あたりの画素数は pixel_scale。
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT,
+                 world_width=SCREEN_WIDTH, world_height=SCREEN_HEIGHT, resolution_scale=1.0):
+        self.width = width
+        self.height = height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.resolution_scale = resolution_scale
+        self.zoom = 1.0
+        self.pixel_scale = resolution_scale
+        self.offset_x = 0.0  # 画面左上に映るワールド座標
+        self.offset_y = 0.0
+        # ワールド座標での可視範囲
+        self.view_rect = pygame.Rect(0, 0, int(width / resolution_scale), int(height / resolution_scale))
+
+    @property
+    def is_identity(self):
+        """等倍かつ原点ずれなし (画面座標 == ワールド座標) か"""
+        return self.pixel_scale == 1.0 and self.offset_x == 0 and self.offset_y == 0
+
+    def look_at(self, center_x, center_y, zoom=1.0):
+        """注視点とズーム率を設定する (ズーム率は刻みに丸める)"""
+        self.zoom = max(quantize_zoom(zoom), ZOOM_BUCKET_STEP)
+        self.pixel_scale = self.zoom * self.resolution_scale
+        view_width = self.width / self.pixel_scale
+        view_height = self.height / self.pixel_scale
+        self.offset_x = min(max(center_x - view_width / 2, 0), max(0, self.world_width - view_width))
+        self.offset_y = min(max(center_y - view_height / 2, 0), max(0, self.world_height - view_height))
+        self.view_rect = pygame.Rect(
+            int(self.offset_x), int(self.offset_y),
+            int(math.ceil(view_width)) + 1, int(math.ceil(view_height)) + 1
+        )
+
+    def follow(self, player1, player2):
+        """2人の中点を注視し、近いほど寄るズームを設定する"""
+        dx = player1.x - player2.x
+        dy = player1.y - player2.y
+        distance = math.sqrt(dx * dx + dy * dy)
+
+        if distance <= FOLLOW_MIN_DISTANCE:
+            zoom = FOLLOW_MAX_ZOOM
+        elif distance >= FOLLOW_MAX_DISTANCE:
+            zoom = FOLLOW_MIN_ZOOM
+        else:
+            ratio = (distance - FOLLOW_MIN_DISTANCE) / (FOLLOW_MAX_DISTANCE - FOLLOW_MIN_DISTANCE)
+            zoom = FOLLOW_MAX_ZOOM - ratio * (FOLLOW_MAX_ZOOM - FOLLOW_MIN_ZOOM)
+
+        self.look_at((player1.x + player2.x) / 2, (player1.y + player2.y) / 2, zoom)
+
+    def world_to_screen(self, x, y):
+        """ワールド座標を画面座標に変換する"""
+        return ((x - self.offset_x) * self.pixel_scale, (y - self.offset_y) * self.pixel_scale)
+
+    def scale(self, length):
+        """ワールドでの長さを画面での長さに変換する"""
+        return length * self.pixel_scale
+
+    def scale_width(self, width):
+        """線幅の変換 (1px 未満にはしない)"""
+        return max(1, int(round(width * self.pixel_scale)))
+
+    def is_visible(self, world_rect):
+        """ワールド座標の矩形が画面に映るか (カリング用)"""
+        return self.view_rect.colliderect(world_rect)
+
+
+# camera を渡されなかった draw() が使う等倍カメラ
+IDENTITY_CAMERA = Camera()
@@ -13,6 +13,15 @@ ARENA_CENTER_X = SCREEN_WIDTH // 2
 ARENA_CENTER_Y = SCREEN_HEIGHT // 2
 ARENA_WARNING_RADIUS = ARENA_RADIUS - 20  # 警告リングの半径
 
+# タイトル画面の背景デモ設定
+TITLE_DEMO_UPDATE_INTERVAL = 2  # 何フレームに1回シミュレーションを進めるか (2 = 30Hz)
+TITLE_DEMO_RESOLUTION_SCALE = 0.5  # 背景デモを描く解像度の倍率 (描画後に一度だけ拡大)
+TITLE_DEMO_RESTART_SECONDS = 10  # デモをリスタートするまでの秒数
+
+# ポーズ画面の背景 (ポーズ直前のゲーム画面を一度だけ加工して使い回す)
+PAUSE_DIM_ALPHA = 128  # 暗くする半透明黒の濃さ (0 で暗くしない)
+PAUSE_BLUR_FACTOR = 1  # 縮小→拡大でぼかす倍率 (1 でぼかさない)
+
 # フォント設定
 # WASM(pygbag)ではSysFontのフォント名検索が効かないため、同梱TTFを直接ロードする。
 JAPANESE_FONT_NAMES = ['Yu Gothic', 'Yu Gothic UI', 'MS Gothic', 'Meiryo', 'IPAGothic', 'Noto Sans CJK JP', 'MS UI Gothic', 'MS Mincho', 'BIZ UDゴシック', 'BIZ UDPゴシック']
@@ -173,6 +182,19 @@ GAME_MODES = {
     "AUTO_TEST": 3  # 自動テストモード
 }
 
+# AI の思考頻度 (自動テストモード)
+AI_THINK_INTERVAL = 2  # 何フレームに1回思考するか (間のフレームは前回の入力を繰り返す)
+AI_THINK_TRIGGER_DISTANCE = 150  # この距離内に新しい敵弾が入ったら周期を待たずに思考する
+
+# 対戦相手 AI の難易度 ("normal" = 従来の反射的な AI, "hard" = 先読み探索 AI)
+AI_DIFFICULTY = "normal"
+AI_SEARCH_TIME_BUDGET_MS = 2.0  # 探索 AI が1フレームに使ってよい時間
+AI_SEARCH_HORIZON = 24  # 探索 AI が何フレーム先まで先読みするか
+
+# AI の回避に使う危険度グリッド
+DANGER_GRID_SIZE = 32  # アリーナを覆う正方グリッドの1辺のセル数
+DANGER_SWEEP_FRAMES = 30  # 敵弾の軌跡を何フレーム先まで危険とみなすか
+
 # サウンド設定
 SOUND_EFFECTS = {
     # BGM
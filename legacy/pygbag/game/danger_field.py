@@ -0,0 +1,170 @@
+import math
+from collections import deque
+
+from game.constants import (
+    ARENA_CENTER_X,
+    ARENA_CENTER_Y,
+    ARENA_RADIUS,
+    ARENA_WARNING_RADIUS,
+    DANGER_GRID_SIZE,
+    DANGER_SWEEP_FRAMES,
+)
+
+# 危険度の重み
+PROJECTILE_DANGER = 1.0  # 敵弾が1フレーム通過するセルあたり
+BORDER_DANGER = 2.0  # 警告リング上 (アリーナ境界に近づくほど線形に増える)
+OUTSIDE_DANGER = 10.0  # アリーナの外
+
+
+class _Stamp:
+    """1発の弾がグリッドに書き込んだ軌跡 (掃引した各フレームのセル)"""
+
+    __slots__ = ("proj", "owner", "x", "y", "angle", "speed", "cells")
+
+    def __init__(self, proj, cells):
+        self.proj = proj
+        self.owner = proj.owner
+        self.x = proj.x
+        self.y = proj.y
+        self.angle = proj.angle
+        self.speed = proj.speed
+        self.cells = cells
+
+
+class DangerField:
+    """アリーナを覆う粗い危険度グリッド。
+
+    各敵弾を速度方向に sweep_frames フレーム分掃引して通過セルに加算し、
+    アリーナ境界への近さ (固定) と合わせて危険度とする。
+    弾は毎フレーム1フレーム分進むだけなので、直進している弾は軌跡の先頭セルを1つ外して
+    末尾に1つ足すだけで更新する (向きが変わった弾・新しい弾だけ掃引し直す)。
+    危険度は弾の持ち主ごとの層に分けて持ち、danger_at() はどの AI からも O(1) で引ける。
+    """
+
+    def __init__(self, size=DANGER_GRID_SIZE, sweep_frames=DANGER_SWEEP_FRAMES):
+        self.size = size
+        self.sweep_frames = sweep_frames
+        self.origin_x = ARENA_CENTER_X - ARENA_RADIUS
+        self.origin_y = ARENA_CENTER_Y - ARENA_RADIUS
+        self.cell_size = ARENA_RADIUS * 2 / size
+        self.border = self._build_border()
+        self.layers = {}  # 弾の持ち主 -> セルごとの通過フレーム数
+        self._stamps = {}  # id(弾) -> _Stamp
+
+    def _build_border(self):
+        border = [0.0] * (self.size * self.size)
+        band = ARENA_RADIUS - ARENA_WARNING_RADIUS
+        for row in range(self.size):
+            for col in range(self.size):
+                x, y = self.cell_center(col, row)
+                distance = ((x - ARENA_CENTER_X) ** 2 + (y - ARENA_CENTER_Y) ** 2) ** 0.5
+                if distance >= ARENA_RADIUS:
+                    border[row * self.size + col] = OUTSIDE_DANGER
+                elif distance > ARENA_WARNING_RADIUS:
+                    border[row * self.size + col] = BORDER_DANGER * (distance - ARENA_WARNING_RADIUS) / band
+        return border
+
+    def cell_center(self, col, row):
+        return (
+            self.origin_x + (col + 0.5) * self.cell_size,
+            self.origin_y + (row + 0.5) * self.cell_size,
+        )
+
+    def cell_index(self, x, y):
+        """座標を含むセルの番号。グリッド外なら -1"""
+        col = int((x - self.origin_x) // self.cell_size)
+        row = int((y - self.origin_y) // self.cell_size)
+        if 0 <= col < self.size and 0 <= row < self.size:
+            return row * self.size + col
+        return -1
+
+    def danger_at(self, x, y, player=None):
+        """(x, y) の危険度。player 自身の弾は数えない"""
+        index = self.cell_index(x, y)
+        if index < 0:
+            return OUTSIDE_DANGER
+        danger = self.border[index]
+        for owner, layer in self.layers.items():
+            if owner is not player:
+                danger += layer[index] * PROJECTILE_DANGER
+        return danger
+
+    def refresh(self, projectiles):
+        """今フレームの弾の一覧に合わせて軌跡を更新する (毎フレーム1回)"""
+        live = set()
+        for proj in projectiles:
+            if proj.speed <= 0:
+                continue
+            key = id(proj)
+            live.add(key)
+            stamp = self._stamps.get(key)
+            if stamp is not None and stamp.proj is proj and self._advanced_straight(stamp, proj):
+                self._advance(stamp, proj)
+            else:
+                if stamp is not None:
+                    self._erase(stamp)
+                self._stamps[key] = self._stamp(proj)
+
+        for key in [key for key in self._stamps if key not in live]:
+            self._erase(self._stamps.pop(key))
+
+    def clear(self):
+        self.layers.clear()
+        self._stamps.clear()
+
+    def _layer(self, owner):
+        layer = self.layers.get(owner)
+        if layer is None:
+            layer = self.layers[owner] = [0] * (self.size * self.size)
+        return layer
+
+    def _sweep_length(self, proj):
+        return max(0, min(self.sweep_frames, int(getattr(proj, "lifetime", self.sweep_frames))))
+
+    def _stamp(self, proj):
+        layer = self._layer(proj.owner)
+        vx, vy = self._velocity(proj)
+        cells = deque()
+        for frame in range(self._sweep_length(proj)):
+            index = self.cell_index(proj.x + vx * frame, proj.y + vy * frame)
+            cells.append(index)
+            if index >= 0:
+                layer[index] += 1
+        return _Stamp(proj, cells)
+
+    def _advanced_straight(self, stamp, proj):
+        """前回から向き・速さが変わらず、ちょうど1フレーム分だけ進んだか"""
+        if proj.angle != stamp.angle or proj.speed != stamp.speed or proj.owner is not stamp.owner:
+            return False
+        vx, vy = self._velocity(proj)
+        return abs(stamp.x + vx - proj.x) < 1e-6 and abs(stamp.y + vy - proj.y) < 1e-6
+
+    def _advance(self, stamp, proj):
+        layer = self._layer(stamp.owner)
+        if stamp.cells:
+            index = stamp.cells.popleft()
+            if index >= 0:
+                layer[index] -= 1
+        # 残り寿命が掃引長より短くなったら末尾は伸ばさない
+        length = self._sweep_length(proj)
+        if len(stamp.cells) < length:
+            vx, vy = self._velocity(proj)
+            frame = len(stamp.cells)
+            index = self.cell_index(proj.x + vx * frame, proj.y + vy * frame)
+            stamp.cells.append(index)
+            if index >= 0:
+                layer[index] += 1
+        stamp.x = proj.x
+        stamp.y = proj.y
+
+    def _erase(self, stamp):
+        layer = self.layers.get(stamp.owner)
+        if layer is None:
+            return
+        for index in stamp.cells:
+            if index >= 0:
+                layer[index] -= 1
+
+    @staticmethod
+    def _velocity(proj):
+        return math.cos(proj.angle) * proj.speed, math.sin(proj.angle) * proj.speed
@@ -0,0 +1,84 @@
+import pygame
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# 更新面積が画面のこの割合を超えたら display.update(rects) より flip の方が安い
+FULL_FLIP_AREA_RATIO = 0.5
+# これ以上矩形が増えたら個別転送をやめて flip する
+MAX_DIRTY_RECTS = 64
+
+
+class DirtyRectTracker:
+    """フレーム間で変化した画面領域を集めて pygame.display.update(rects) 用に返す。
+
+    描画自体は従来通り毎フレーム全体をバックバッファに行い、ディスプレイ (WASM の
+    canvas) への転送だけを変化した矩形に絞る。移動物は前フレームの位置も消す必要が
+    あるので、前フレームの矩形と今フレームの矩形の和を転送する。
+
+    全画面転送が必要なとき (状態遷移直後、カメラズーム中、言語切替など) は
+    invalidate() を呼ぶ。その場合 flush() は None を返す。
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self._previous = []
+        self._current = []
+        self._full_redraw = True
+
+    def invalidate(self):
+        """次のフレームを全画面転送にする"""
+        self._full_redraw = True
+
+    def add(self, rect):
+        """今フレームで描き変わった矩形を登録する"""
+        if rect is None:
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width > 0 and rect.height > 0:
+            self._current.append(rect)
+
+    def add_all(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def flush(self):
+        """転送すべき矩形のリストを返す (全画面転送なら None)。
+
+        呼び出し後、今フレームの矩形は次フレームの「前フレーム」として保持される。
+        """
+        current = self._current
+        rects = _merge_rects(self._previous + current)
+        self._previous = current
+        self._current = []
+
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+        if len(rects) > MAX_DIRTY_RECTS:
+            return None
+        area = sum(r.width * r.height for r in rects)
+        if area > self.screen_rect.width * self.screen_rect.height * FULL_FLIP_AREA_RATIO:
+            return None
+        return rects
+
+
+def _merge_rects(rects):
+    """重なり合う矩形をまとめて転送回数を減らす (x 順の1パス)"""
+    merged = []
+    for rect in sorted(rects, key=lambda r: r.x):
+        for i, other in enumerate(merged):
+            if other.colliderect(rect):
+                merged[i] = other.union(rect)
+                break
+        else:
+            merged.append(rect)
+    return merged
+
+
+def present(tracker):
+    """トラッカーの内容に従ってディスプレイを更新する (main ループ用)"""
+    rects = tracker.flush()
+    if rects is None:
+        pygame.display.flip()
+    elif rects:
+        pygame.display.update(rects)
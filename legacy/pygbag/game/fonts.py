@@ -0,0 +1,77 @@
+import os
+
+import pygame
+
+from game.constants import DEFAULT_FONT, JAPANESE_FONT_NAMES, JP_FONT_PATH
+
+# 起動時に読み込んでおくサイズ (各 State / HUD が使うもの)
+PRELOAD_FONT_SIZES = (20, 24, 28, 36, 48, 72)
+# pygame 既定フォント (Font(None, size)) で使うサイズ
+PRELOAD_DEFAULT_FONT_SIZES = (24, 36)
+
+# (パス or SysFont名, サイズ) -> pygame.font.Font
+_fonts = {}
+# SysFont フォールバック時に使う日本語フォント名 (初回のみ検索)
+_fallback_sys_font_name = None
+
+
+def _find_japanese_sys_font():
+    """システムにインストールされた日本語フォント名を探す (見つからなければ DEFAULT_FONT)"""
+    global _fallback_sys_font_name
+    if _fallback_sys_font_name is None:
+        available = pygame.font.get_fonts()
+        available_lower = [f.lower() for f in available]
+        _fallback_sys_font_name = DEFAULT_FONT
+        for name in JAPANESE_FONT_NAMES:
+            if name.lower() in available_lower:
+                _fallback_sys_font_name = available[available_lower.index(name.lower())]
+                break
+    return _fallback_sys_font_name
+
+
+def get_font(size, path=JP_FONT_PATH):
+    """(path, size) ごとに一度だけロードしたフォントを返す。
+
+    TTF のパースは重く、State を作り直すたびにロードするとヒッチが出るため
+    プロセス全体で共有する。path=None は pygame 既定フォント。
+    path のファイルが無い場合は日本語 SysFont にフォールバックする。
+    """
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        if path is None or os.path.exists(path):
+            font = pygame.font.Font(path, size)
+        else:
+            font = get_sys_font(_find_japanese_sys_font(), size)
+        _fonts[key] = font
+    return font
+
+
+def get_sys_font(name, size):
+    """SysFont 版の get_font (同梱 TTF が無い環境向け)"""
+    key = ("sysfont:" + str(name), size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+
+def preload_fonts(sizes=PRELOAD_FONT_SIZES, default_sizes=PRELOAD_DEFAULT_FONT_SIZES):
+    """起動時に使用するフォントをまとめてロードしておく"""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    for size in sizes:
+        get_font(size)
+    for size in default_sizes:
+        get_font(size, path=None)
+
+
+def clear_fonts():
+    """登録済みフォントを破棄する (pygame.quit() 後は Font が無効になるため)"""
+    global _fallback_sys_font_name
+    _fonts.clear()
+    _fallback_sys_font_name = None
+
+
+pygame.register_quit(clear_fonts)
@@ -12,13 +12,22 @@ from game.constants import (
     MAX_HEAT, MAX_HYPER,
     HYPER_CONSUMPTION_RATE, HYPER_DECREASE_RATE_AT_BORDER, HYPER_ACTIVATION_COST,
     HYPER_DURATION, DASH_RING_DURATION, HEAT_DECREASE_RATE,
-    WEAPON_TYPES
+    WEAPON_TYPES, AI_DIFFICULTY
 )
 from game.player import Player
 from game.arena import Arena
 from game.hud import HUD
 from game.ai import AIController
-from game.states import TitleState
+from game.ai_scheduler import AIScheduler
+from game.audio_assets import AudioAssets
+from game.sound_bundle import BUNDLE_NAME, SoundBundle
+from game.voices import BGM_CHANNEL, SFX_VOLUME, VoiceManager
+from game.danger_field import DangerField
+from game.fonts import get_font, get_sys_font
+from game.dirty_rects import DirtyRectTracker
+from game.camera import Camera
+from game.title_demo import TitleDemo
+from game.states import PREWARM_STATE_CLASSES, TitleState
 from game.weapon import Weapon
 from game.projectile import BeamProjectile, BallisticProjectile, MeleeProjectile
 
@@ -52,6 +61,7 @@ class Game:
         # ズーム関連の属性
         self.current_zoom = 1.0  # 現在のズーム率
         self.target_zoom = 1.0   # 目標ズーム率
+        self.camera = Camera(self.width, self.height)  # アドバタイズモード用カメラ
         
         # 自動テスト用タイマー
         self.test_timer = 0
@@ -65,9 +75,14 @@ class Game:
         self.ai_move_timer1 = 0
         self.ai_move_timer2 = 0
         self.ai_move_interval = 60 * 1  # 1秒間隔（60FPS）
-        self.ai_move_direction1 = {"up": False, "down": False, "left": False, "right": False, "dash": False}
-        self.ai_move_direction2 = {"up": False, "down": False, "left": False, "right": False, "dash": False}
+        # 移動方針 (ai_move_direction1/2) は ai_controller の出力バッファに持つ
         self.ai_controller = AIController(self)
+        # 自動テスト AI の思考を間引くスケジューラ
+        self.ai_scheduler = AIScheduler(self.ai_controller)
+        # AI の回避判断に使う危険度グリッド (全 AI で1つを共有する)
+        self.danger_field = DangerField()
+        # 対戦モードの相手 AI の難易度 ("normal" / "hard")
+        self.ai_difficulty = AI_DIFFICULTY
         
         # メニュー関連 (状態クラスから参照される可能性あり)
         self.menu_items = ["シングル対戦モード", "トレーニングモード", "自動テスト", "操作説明", "オプション", "終了"]
@@ -101,8 +116,16 @@ class Game:
         if self.enable_audio and not pygame.mixer.get_init():
             pygame.mixer.init()
         self.sounds = {}
+        # 効果音・BGM をまとめたバンドルがあれば、ファイルを1つ開くだけで済む (デコードも不要)
+        bundle_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sounds", BUNDLE_NAME)
+        bundle = SoundBundle.open(bundle_path) if self.enable_audio else None
+        self.audio = AudioAssets(bundle)
+        # 効果音の同時発音数の管理 (BGM 用のチャンネルは予約して効果音に使わせない)
+        self.voices = VoiceManager(configure_mixer=self.enable_audio)
         self.init_sounds()  # 効果音の初期化を呼び出し
         self.init_title_bgm()
+        # デコードは裏で行い、タイトル画面の表示を待たせない (読み込み前の音は無音)
+        self.audio.start()
         
         # キーマッピングを constants.py で定義されているデフォルト値で初期化
         self.key_mapping_p1 = DEFAULT_KEY_MAPPING_P1.copy()
@@ -112,10 +135,17 @@ class Game:
         # キーコンフィグ設定を読み込み（コメントアウト - デフォルトのマッピングを使用）
         # self.load_key_config()
 
-        # 状態管理
+        # ディスプレイ転送する変化領域 (main ループが present() で使う)
+        self.dirty_rects = DirtyRectTracker(self.width, self.height)
+
+        # タイトル画面の背景デモ (初回のタイトル表示時に生成して使い回す)
+        self.title_demo = None
+
+        # 状態管理 (状態インスタンスはクラスごとに1つだけ生成して使い回す)
+        self.states = {}
         self.current_state = None
         self.previous_state = None
-        self.change_state(TitleState(self))
+        self.change_state(self.get_state(TitleState))
 
     # ---- 状態パターンのためのメソッド ----
     def change_state(self, new_state, previous_state=None):
@@ -123,12 +153,42 @@ class Game:
         if self.current_state and hasattr(self.current_state, "exit"):
             self.current_state.exit()
         self.current_state = new_state
+        # 画面構成が丸ごと変わるので次フレームは全画面転送
+        self.dirty_rects.invalidate()
         if previous_state:
             self.previous_state = previous_state
         if self.current_state and hasattr(self.current_state, "enter"):
             self.current_state.enter()
+
+    def get_state(self, state_class, previous_state=None):
+        """state_class のインスタンスを返す (初回のみ生成し、以降は使い回す)。
+
+        フォントやメニュー定義は生成時に一度だけ用意し、訪問ごとの初期化は enter() で行う。
+        previous_state を渡すと戻り先をその状態に差し替える。
+        """
+        state = self.states.get(state_class)
+        if state is None:
+            state = state_class(self)
+            self.states[state_class] = state
+        if previous_state is not None:
+            state.previous_state = previous_state
+        return state
+
+    def prewarm_state(self):
+        """未生成の状態を1つだけ生成する。生成したら True、全て生成済みなら False"""
+        for state_class in PREWARM_STATE_CLASSES:
+            if state_class not in self.states:
+                self.get_state(state_class)
+                return True
+        return False
     # ---------------------------------
 
+    def get_title_demo(self):
+        """タイトル背景デモを返す (初回のみ生成し、以降は使い回す)"""
+        if self.title_demo is None:
+            self.title_demo = TitleDemo(self)
+        return self.title_demo
+
     def init_fonts(self):
         """日本語フォントの初期化。
 
@@ -158,53 +218,67 @@ class Game:
             self.font_name = DEFAULT_FONT
 
     def make_font(self, size):
-        """日本語対応フォントをサイズ指定で生成する統一ヘルパ。
+        """日本語対応フォントをサイズ指定で取得する統一ヘルパ。
 
         font_path が設定されていれば TTF 直ロード (pygbag 対応)、
         そうでなければ SysFont にフォールバック。
+        どちらも game.fonts のレジストリ経由なので、同じサイズは一度しかロードされない。
         """
-        if self.font_path and os.path.exists(self.font_path):
-            return pygame.font.Font(self.font_path, size)
-        return pygame.font.SysFont(self.font_name, size)
+        if self.font_path:
+            return get_font(size, self.font_path)
+        return get_sys_font(self.font_name, size)
 
     def init_sounds(self):
-        # BGMとSEの読み込み
+        # BGMとSEの登録 (デコードは self.audio が優先度順に裏で行う)
         self.sounds = {}
         if not self.enable_audio:
             return
         
-        # 効果音ファイルが存在するか確認して読み込む
+        # 効果音ファイルと読み込みの優先度 (小さいほど先。タイトル画面で使う音から)
         sound_files = {
-            "shot": "assets/sounds/shot.ogg",
-            "special": "assets/sounds/special.ogg",
-            "hit": "assets/sounds/hit.ogg",
-            "shield": "assets/sounds/shield.ogg",
-            "hyper": "assets/sounds/hyper.ogg",
-            "menu": "assets/sounds/menu.ogg"
+            "menu": ("assets/sounds/menu.ogg", 1),
+            "special": ("assets/sounds/special.ogg", 1),
+            "shot": ("assets/sounds/shot.ogg", 2),
+            "hit": ("assets/sounds/hit.ogg", 2),
+            "shield": ("assets/sounds/shield.ogg", 2),
+            "hyper": ("assets/sounds/hyper.ogg", 2),
         }
         
         # サウンドディレクトリの存在確認
         sound_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sounds")
         os.makedirs(sound_dir, exist_ok=True)
         
-        # 存在するサウンドファイルのみロード
-        for sound_name, sound_path in sound_files.items():
+        # 存在するサウンドファイルのみ登録
+        for sound_name, (sound_path, priority) in sound_files.items():
             full_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), sound_path)
-            if os.path.exists(full_path):
-                try:
-                    self.sounds[sound_name] = pygame.mixer.Sound(full_path)
-                except Exception:
-                    pass
+            sound = self.audio.register(sound_name, full_path, priority)
+            if sound is not None:
+                self.sounds[sound_name] = sound
 
     def init_title_bgm(self):
         if not self.enable_audio:
             return
-        try:
-            self.title_bgm = pygame.mixer.Sound("assets/sounds/rockman_title.ogg")
-            # 起動直後にいきなり鳴っても驚かない音量に抑える。
-            self.title_bgm.set_volume(0.3)
-        except Exception:
-            self.title_bgm = None
+        full_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sounds", "rockman_title.ogg")
+        # 起動直後にいきなり鳴っても驚かない音量に抑える。
+        # タイトル画面ですぐ鳴らすので最優先で読み込む (読み込み前に play されたら読み込み後に鳴り始める)
+        self.title_bgm = self.audio.register("title_bgm", full_path, priority=0, volume=0.3, channel=BGM_CHANNEL)
+
+    def play_sfx(self, name, volume=SFX_VOLUME, immediate=False):
+        """効果音を鳴らす。同じフレームの要求はまとめて、フレームの終わりに voices が鳴らす
+        immediate=True ならまとめずにすぐ鳴らす (メニューの操作音用)
+        """
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        if immediate:
+            self.voices.play(name, sound, volume)
+        else:
+            self.voices.request(name, sound, volume)
+
+    def shutdown(self):
+        """終了処理。BGM を止め、音声の裏読み込みをやめる"""
+        self.stop_title_bgm()
+        self.audio.stop()
 
     def play_title_bgm(self):
         if self.title_bgm and not self.title_bgm_playing:
@@ -259,9 +333,11 @@ class Game:
     def update(self):
         """ゲーム状態の更新"""
         self.current_time += 1
+        self.audio.poll()
         if self.current_state.needs_game_update():
             self.previous_state = self.current_state
         self.current_state.update()
+        self.voices.flush()
     
     def update_gameplay_elements(self, use_simple_ai=False):
         """対戦/トレーニング共通の更新処理。"""
@@ -269,7 +345,10 @@ class Game:
         self.player1.update(self.arena, self.player2)
 
         if use_simple_ai:
-            self.player2.key_states = self.ai_controller.simple_ai_control()
+            if self.ai_difficulty == "hard":
+                self.player2.key_states = self.ai_controller.search_ai_control()
+            else:
+                self.player2.key_states = self.ai_controller.simple_ai_control()
         self.player2.update(self.arena, self.player1)
 
         # 粘り（糸）の物理引き寄せロジック
@@ -297,7 +376,7 @@ class Game:
         """自動テストモードの更新。"""
         self.test_timer += 1
         if self.test_duration != float("inf") and self.test_timer >= self.test_duration:
-            self.change_state(TitleState(self))
+            self.change_state(self.get_state(TitleState))
             return
 
         if self.test_duration == float("inf") and (
@@ -305,16 +384,17 @@ class Game:
         ):
             self.winner = 2 if self.player1.health <= 0 else 1
             self.result_timer = 0
-            self.change_state(TitleState(self))
+            self.change_state(self.get_state(TitleState))
             return
 
         self.ai_move_timer1 += 1
         self.ai_move_timer2 += 1
 
-        self.player1.key_states = self.ai_controller.auto_test_ai_control(
+        self.danger_field.refresh(self.projectiles)
+        self.player1.key_states = self.ai_scheduler.control(
             self.player1, self.player2, is_player1=True
         )
-        self.player2.key_states = self.ai_controller.auto_test_ai_control(
+        self.player2.key_states = self.ai_scheduler.control(
             self.player2, self.player1, is_player1=False
         )
         self.update_gameplay_elements(use_simple_ai=False)
@@ -331,7 +411,25 @@ class Game:
                     self.player1.health = MAX_HEALTH
                 if self.player2.health <= 0:
                     self.player2.health = MAX_HEALTH
-            self.change_state(TitleState(self))
+            self.change_state(self.get_state(TitleState))
+
+    @property
+    def ai_move_direction1(self):
+        """プレイヤー1の AI の移動方針 (AIController の出力バッファそのもの)"""
+        return self.ai_controller.intents[True].movement
+
+    @ai_move_direction1.setter
+    def ai_move_direction1(self, movement):
+        self.ai_controller.intents[True].movement.update(movement)
+
+    @property
+    def ai_move_direction2(self):
+        """プレイヤー2の AI の移動方針 (AIController の出力バッファそのもの)"""
+        return self.ai_controller.intents[False].movement
+
+    @ai_move_direction2.setter
+    def ai_move_direction2(self, movement):
+        self.ai_controller.intents[False].movement.update(movement)
 
     # Backward-compatible wrappers while AI implementation lives in AIController.
     def auto_test_ai_control(self, player, opponent, is_player1=True):
@@ -425,8 +523,10 @@ class Game:
                     proj.on_hit(self.player1)
                     if proj in self.projectiles:
                         self.projectiles.remove(proj)
+                    self.play_sfx("hit")
                 else:
                     proj.reflect(self.player1)
+                    self.play_sfx("shield")
                     
             # プレイヤー2との衝突
             elif proj.owner != self.player2 and self.player2.collides_with(proj):
@@ -439,75 +539,42 @@ class Game:
                     proj.on_hit(self.player2)
                     if proj in self.projectiles:
                         self.projectiles.remove(proj)
+                    self.play_sfx("hit")
                 else:
                     proj.reflect(self.player2)
+                    self.play_sfx("shield")
     
     def draw(self):
         """現在の状態に応じた描画処理"""
         self.current_state.draw(self.screen)
+        self.current_state.collect_dirty_rects(self.dirty_rects)
     
     def draw_to_surface(self, surface):
-        """サーフェスにゲーム画面を描画（アドバタイズモード用）"""
-        # バックバッファは毎フレーム再生成せずインスタンスにキャッシュする
-        buffer = getattr(self, "_advert_buffer", None)
-        if buffer is None:
-            buffer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self._advert_buffer = buffer
-        buffer.fill((0, 0, 0))
+        """サーフェスにゲーム画面を描画（アドバタイズモード用）
 
-        dx = self.player1.x - self.player2.x
-        dy = self.player1.y - self.player2.y
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        min_distance = 150
-        max_distance = 400
-        max_zoom = 1.5
-        min_zoom = 1.0
-        
-        if distance <= min_distance:
-            current_zoom = max_zoom
-        elif distance >= max_distance:
-            current_zoom = min_zoom
-        else:
-            ratio = (distance - min_distance) / (max_distance - min_distance)
-            current_zoom = max_zoom - ratio * (max_zoom - min_zoom)
-        
-        self.arena.draw(buffer)
+        2人の距離に応じてカメラをズームし、各エンティティはカメラ変換を通して
+        surface へ直接描く。ワールド全体をバッファに描いて subsurface を拡大する
+        方式と違い、画面全体のリサンプルが不要で、画面外のものは描画を省く。
+        """
+        width, height = surface.get_size()
+        if (self.camera.width, self.camera.height) != (width, height):
+            # 縮小バッファ (タイトルデモ等) に描く場合は解像度倍率付きのカメラにする
+            self.camera = Camera(width, height, self.width, self.height, resolution_scale=width / self.width)
+        camera = self.camera
+        camera.follow(self.player1, self.player2)
+        self.current_zoom = camera.zoom
+
+        surface.fill((0, 0, 0))
+        self.arena.draw(surface, camera)
         for proj in self.projectiles:
-            proj.draw(buffer)
-        self.player1.draw(buffer)
-        self.player2.draw(buffer)
+            if camera.is_visible(proj.get_draw_rect()):
+                proj.draw(surface, camera)
+        for player in (self.player1, self.player2):
+            if camera.is_visible(player.get_draw_rect()):
+                player.draw(surface, camera)
         for effect in self.effects:
-            effect.draw(buffer)
-        
-        center_x = (self.player1.x + self.player2.x) / 2
-        center_y = (self.player1.y + self.player2.y) / 2
-        
-        clip_x = int(center_x - SCREEN_WIDTH / (2 * current_zoom))
-        clip_y = int(center_y - SCREEN_HEIGHT / (2 * current_zoom))
-        
-        if clip_x < 0: clip_x = 0
-        if clip_y < 0: clip_y = 0
-        if clip_x + int(SCREEN_WIDTH / current_zoom) > SCREEN_WIDTH:
-            clip_x = max(0, SCREEN_WIDTH - int(SCREEN_WIDTH / current_zoom))
-        if clip_y + int(SCREEN_HEIGHT / current_zoom) > SCREEN_HEIGHT:
-            clip_y = max(0, SCREEN_HEIGHT - int(SCREEN_HEIGHT / current_zoom))
-        
-        clip_width = min(int(SCREEN_WIDTH / current_zoom), SCREEN_WIDTH - clip_x)
-        clip_height = min(int(SCREEN_HEIGHT / current_zoom), SCREEN_HEIGHT - clip_y)
-        
-        try:
-            clip_area = pygame.Rect(clip_x, clip_y, clip_width, clip_height)
-            clipped_buffer = buffer.subsurface(clip_area)
-            zoomed_width = int(clip_width * current_zoom)
-            zoomed_height = int(clip_height * current_zoom)
-            zoomed_buffer = pygame.transform.scale(clipped_buffer, (zoomed_width, zoomed_height))
-            surface.fill((0, 0, 0))
-            dest_x = int(SCREEN_WIDTH/2 - zoomed_width/2)
-            dest_y = int(SCREEN_HEIGHT/2 - zoomed_height/2)
-            surface.blit(zoomed_buffer, (dest_x, dest_y))
-        except ValueError:
-            surface.blit(buffer, (0, 0))
+            if camera.is_visible(effect.get_draw_rect()):
+                effect.draw(surface, camera)
     
     def add_projectile(self, projectile):
         """弾を追加"""
@@ -532,6 +599,8 @@ class Game:
         self.projectiles.clear()
         self.effects.clear()
         self.current_time = 0
+        self.ai_scheduler.reset()
+        self.danger_field.clear()
     
     def save_key_config(self):
         """キーコンフィグ設定を保存"""
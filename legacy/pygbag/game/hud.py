@@ -1,11 +1,12 @@
-import os
 import pygame
 from game.constants import (
-    SCREEN_WIDTH, JAPANESE_FONT_NAMES, DEFAULT_FONT, JP_FONT_PATH,
+    SCREEN_WIDTH,
     WHITE, GRAY, GREEN, ORANGE, RED, YELLOW, CYAN,
     MAX_HEALTH, MAX_HEAT, MAX_HYPER
 )
+from game.fonts import get_font
 from game.i18n import tr
+from game.text_cache import render_text
 
 class HUD:
     """ゲームのHUD（ヘッドアップディスプレイ）を管理するクラス"""
@@ -21,19 +22,13 @@ class HUD:
         self.frame_count = 0
 
     def _make_font(self, size):
-        """pygbag 対応の日本語フォント生成。
+        """pygbag 対応の日本語フォント取得。
 
         同梱 TTF があれば pygame.font.Font() で直接ロード。無い場合のみ
         SysFont によるシステムフォント検索にフォールバックする。
+        ロード済みフォントは game.fonts のレジストリで共有される。
         """
-        if os.path.exists(JP_FONT_PATH):
-            return pygame.font.Font(JP_FONT_PATH, size)
-        available = pygame.font.get_fonts()
-        available_lower = [f.lower() for f in available]
-        for name in JAPANESE_FONT_NAMES:
-            if name.lower() in available_lower:
-                return pygame.font.SysFont(available[available_lower.index(name.lower())], size)
-        return pygame.font.SysFont(DEFAULT_FONT, size)
+        return get_font(size)
         
     def draw(self, screen):
         """HUDを描画"""
@@ -53,7 +48,7 @@ class HUD:
         """個別プレイヤーのHUDを描画"""
         # プレイヤー名
         name = "プレイヤー1" if player.is_player1 else "プレイヤー2"
-        name_text = self.font.render(name, True, WHITE)
+        name_text = render_text(self.font, name, WHITE)
         name_rect = name_text.get_rect()
         name_rect.topleft = (x, y)
         screen.blit(name_text, name_rect)
@@ -98,7 +93,7 @@ class HUD:
         pygame.draw.rect(screen, WHITE, (heat_x, heat_y, heat_width, heat_height), 2)
         
         # ヒートテキスト
-        heat_text = self.font.render(tr("hud.heat", value=int(player.heat)), True, WHITE)
+        heat_text = render_text(self.font, tr("hud.heat", value=int(player.heat)), WHITE)
         heat_text_rect = heat_text.get_rect()
         heat_text_rect.topleft = (heat_x + heat_width + 10, heat_y)
         screen.blit(heat_text, heat_text_rect)
@@ -107,7 +102,7 @@ class HUD:
         if is_overheat:
             # 点滅表示
             if self.frame_count % 30 < 15:
-                overheat_text = self.font_large.render(tr("hud.overheat"), True, ORANGE)
+                overheat_text = render_text(self.font_large, tr("hud.overheat"), ORANGE)
                 overheat_rect = overheat_text.get_rect()
                 overheat_rect.midtop = (heat_x + heat_width // 2, heat_y - 30)
                 screen.blit(overheat_text, overheat_rect)
@@ -139,7 +134,7 @@ class HUD:
         pygame.draw.rect(screen, WHITE, (hyper_x, hyper_y, hyper_width, hyper_height), 2)
         
         # ハイパーテキスト
-        hyper_text = self.font.render(tr("hud.hyper", value=int(player.hyper_gauge)), True, WHITE)
+        hyper_text = render_text(self.font, tr("hud.hyper", value=int(player.hyper_gauge)), WHITE)
         hyper_text_rect = hyper_text.get_rect()
         hyper_text_rect.topleft = (hyper_x + hyper_width + 10, hyper_y)
         screen.blit(hyper_text, hyper_text_rect)
@@ -159,7 +154,7 @@ class HUD:
         pygame.draw.rect(screen, WHITE, (water_x, water_y, water_width, water_height), 2)
 
         # 水分テキスト
-        water_text = self.font.render(tr("hud.water", value=int(player.water_level)), True, WHITE)
+        water_text = render_text(self.font, tr("hud.water", value=int(player.water_level)), WHITE)
         water_text_rect = water_text.get_rect()
         water_text_rect.topleft = (water_x + water_width + 10, water_y)
         screen.blit(water_text, water_text_rect)
@@ -173,7 +168,7 @@ class HUD:
         pygame.draw.rect(screen, GRAY, (bean_x, bean_y, bean_width, bean_height))
         pygame.draw.rect(screen, (139, 69, 19), (bean_x, bean_y, bean_width * bean_percent, bean_height))
         pygame.draw.rect(screen, WHITE, (bean_x, bean_y, bean_width, bean_height), 1)
-        bean_text = self.font.render(tr("hud.bean", value=int(player.beans)), True, WHITE)
+        bean_text = render_text(self.font, tr("hud.bean", value=int(player.beans)), WHITE)
         screen.blit(bean_text, (bean_x + bean_width + 10, bean_y - 5))
 
         # 熟成度ゲージ (黄金色系)
@@ -185,12 +180,12 @@ class HUD:
         pygame.draw.rect(screen, GRAY, (aging_x, aging_y, aging_width, aging_height))
         pygame.draw.rect(screen, (255, 215, 0), (aging_x, aging_y, aging_width * aging_percent, aging_height))
         pygame.draw.rect(screen, WHITE, (aging_x, aging_y, aging_width, aging_height), 1)
-        aging_text = self.font.render(tr("hud.aging", value=int(player.aging)), True, WHITE)
+        aging_text = render_text(self.font, tr("hud.aging", value=int(player.aging)), WHITE)
         screen.blit(aging_text, (aging_x + aging_width + 10, aging_y - 5))
         
         # ハイパーモード中表示
         if hasattr(player, 'is_hyper_active') and player.is_hyper_active:
-            status_text = self.font_large.render(tr("hud.hyper_active"), True, YELLOW)
+            status_text = render_text(self.font_large, tr("hud.hyper_active"), YELLOW)
             status_rect = status_text.get_rect()
             status_rect.topleft = (x, y + 180)
             screen.blit(status_text, status_rect)
@@ -12,6 +12,7 @@ from game.constants import (
     NEGI_GREEN, BENI_RED, TOFU_WHITE,  # 新しい色をインポート
     WEAPON_TYPES
 )
+from game.camera import IDENTITY_CAMERA
 from game.weapon import Weapon
 from game.projectile import BeamProjectile, BallisticProjectile, MeleeProjectile
 
@@ -44,7 +45,7 @@ class DashRing:
         progress = 1.0 - (self.duration / self.max_duration)
         self.radius = self.start_radius + (self.max_radius - self.start_radius) * progress
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """リングを描画 - 進行方向に潰れた楕円"""
         alpha = int(255 * (self.duration / self.max_duration))
         color = (100, 200, 255, alpha)
@@ -59,14 +60,15 @@ class DashRing:
             norm_dir_y = 0
         
         # 楕円の描画パラメータ計算 - 潰れる方向を逆に
-        ellipse_width = int(self.radius * 0.8)  # 進行方向に潰れる (短い)
-        ellipse_height = int(self.radius * 1.5)  # 垂直方向に長い
+        ellipse_width = int(camera.scale(self.radius * 0.8))  # 進行方向に潰れる (短い)
+        ellipse_height = int(camera.scale(self.radius * 1.5))  # 垂直方向に長い
         
         # 進行方向の角度
         angle = math.degrees(math.atan2(norm_dir_y, norm_dir_x))
         
         # 楕円の中心
-        center_x, center_y = int(self.x), int(self.y)
+        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        center_x, center_y = int(screen_x), int(screen_y)
         
         # 描画対象の楕円の矩形
         pygame.Rect(
@@ -89,6 +91,11 @@ class DashRing:
         # 描画
         screen.blit(rotated_surface, rotated_rect.topleft)
         
+    def get_draw_rect(self):
+        """描画が及ぶ範囲 (回転後の楕円の外接矩形を含む)"""
+        half = int(self.radius * 0.75) + 2
+        return pygame.Rect(int(self.x) - half, int(self.y) - half, half * 2, half * 2)
+
     @property
     def is_dead(self):
         """リングが消えるべきかどうか"""
@@ -125,13 +132,14 @@ class ShieldEffect:
         for ring in self.rings:
             ring['angle'] = (ring['angle'] + ring['speed'] * 0.1) % (2 * math.pi)
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """エフェクトを描画"""
         if self.is_dead:
             return
         
         # プレイヤーの位置に追従
-        x, y = int(self.owner.x), int(self.owner.y)
+        screen_x, screen_y = camera.world_to_screen(self.owner.x, self.owner.y)
+        x, y = int(screen_x), int(screen_y)
         
         # リングのパルス効果用の係数（時間経過で変化）
         pulse_factor = 0.2 * math.sin(self.duration * 0.1) + 1.0
@@ -149,10 +157,10 @@ class ShieldEffect:
             color = (r, g, b)
             
             # リングの実際の半径（パルス効果を適用）
-            actual_radius = ring['radius'] * pulse_factor
+            actual_radius = camera.scale(ring['radius'] * pulse_factor)
             
             # リングの太さ
-            width = max(1, int(ring['width'] * alpha_factor * 1.5))
+            width = camera.scale_width(max(1, int(ring['width'] * alpha_factor * 1.5)))
             
             # 回転エフェクト用の複数の点を描画
             segments = 12
@@ -177,6 +185,12 @@ class ShieldEffect:
                 )
                 pygame.draw.arc(screen, color, rect, start_angle, end_angle, width)
 
+    def get_draw_rect(self):
+        """描画が及ぶ範囲 (最大リング半径 × 最大パルス)"""
+        half = int(self.base_radius * 1.2 * 1.2) + self.ring_count + 2
+        x, y = int(self.owner.x), int(self.owner.y)
+        return pygame.Rect(x - half, y - half, half * 2, half * 2)
+
 class Player:
     """プレイヤークラス"""
     def __init__(self, x, y, is_player1=True, game=None):
@@ -356,8 +370,8 @@ class Player:
         self.aging = min(100.0, self.aging + 0.02) # 1フレームにつき0.02%熟成 (約83秒で最大)
         if self.aging >= 100.0 and not self.is_fermented:
             self.is_fermented = True
-            if self.game and "hyper" in self.game.sounds:
-                self.game.sounds["hyper"].play() # 発酵時のSE
+            if self.game:
+                self.game.play_sfx("hyper") # 発酵時のSE
 
         # 発酵エフェクト（糸を引くパーティクル）の生成
         if self.is_fermented:
@@ -695,8 +709,8 @@ class Player:
                 self.weapon_b_burst_timer = self.weapon_b_burst_delay
                 
                 # 効果音を再生（もし存在すれば）
-                if self.game and "special" in self.game.sounds:
-                    self.game.sounds["special"].play()
+                if self.game:
+                    self.game.play_sfx("special")
                 
                 # クールダウンを設定
                 self.shoot_cooldown = weapon.cooldown
@@ -788,6 +802,7 @@ class Player:
             if self.game:
                 hyper_effect = HyperEffect(self.x, self.y, self, 120)
                 self.game.add_effect(hyper_effect)
+                self.game.play_sfx("hyper")
             
     def take_damage(self, amount):
         """ダメージを受ける"""
@@ -810,32 +825,36 @@ class Player:
         distance = math.sqrt(dx*dx + dy*dy)
         return distance < (self.radius + projectile.radius)
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """プレイヤーを描画"""
         # ダッシュリングを描画
         for ring in self.dash_rings:
-            ring.draw(screen)
+            ring.draw(screen, camera)
             
         # シールドエフェクトを描画
         if self.shield_effect:
-            self.shield_effect.draw(screen)
+            self.shield_effect.draw(screen, camera)
+
+        # 以降は画面座標で描く
+        x, y = camera.world_to_screen(self.x, self.y)
+        square_size = camera.scale(self.square_size)
             
         # ハイパーモード中は輝くエフェクト
         if self.is_hyper_active:
-            glow_radius = self.radius + 5
+            glow_radius = camera.scale(self.radius + 5)
             pulse = (self.hyper_duration % 20) / 20.0  # 脈動効果
             glow_color = (255, 255, 0, int(200 * pulse + 50))  # 黄色の輝き
-            pygame.draw.circle(screen, glow_color, (int(self.x), int(self.y)), glow_radius + int(pulse * 3))
+            pygame.draw.circle(screen, glow_color, (int(x), int(y)), glow_radius + int(camera.scale(pulse * 3)))
             
             # 輝く四角形のサイズ
-            glow_size = self.square_size + 6
+            glow_size = square_size + camera.scale(6)
             glow_rect = pygame.Rect(
-                int(self.x - glow_size/2),
-                int(self.y - glow_size/2),
+                int(x - glow_size/2),
+                int(y - glow_size/2),
                 glow_size,
                 glow_size
             )
-            pygame.draw.rect(screen, glow_color, glow_rect, 2)
+            pygame.draw.rect(screen, glow_color, glow_rect, camera.scale_width(2))
             
         # プレイヤーを白い四角形として描画
         color = self.color
@@ -857,10 +876,10 @@ class Player:
             aging_color = (139, 69, 19) # Natto Brown
         
         base_rect = pygame.Rect(
-            int(self.x - self.square_size/2),
-            int(self.y - self.square_size/2),
-            self.square_size,
-            self.square_size
+            int(x - square_size/2),
+            int(y - square_size/2),
+            square_size,
+            square_size
         )
         pygame.draw.rect(screen, aging_color, base_rect)
 
@@ -869,24 +888,38 @@ class Player:
             alpha = int(255 * (p["life"] / 30.0))
             # PygameのdrawはRGBAを直接扱えない場合があるため簡易的に
             p_color = (210, 180, 140) # 糸の色
-            pygame.draw.circle(screen, p_color, (int(p["x"]), int(p["y"])), 2)
+            px, py = camera.world_to_screen(p["x"], p["y"])
+            pygame.draw.circle(screen, p_color, (int(px), int(py)), camera.scale(2))
             # 糸っぽく本体と繋ぐ
-            pygame.draw.line(screen, p_color, (int(self.x), int(self.y)), (int(p["x"]), int(p["y"])), 1)
+            pygame.draw.line(screen, p_color, (int(x), int(y)), (int(px), int(py)), 1)
         
         # 四角形の上に色付きの線（ネギまたは紅生姜）
         border_rect = pygame.Rect(
-            int(self.x - self.square_size/2),
-            int(self.y - self.square_size/2),
-            self.square_size,
-            self.square_size
+            int(x - square_size/2),
+            int(y - square_size/2),
+            square_size,
+            square_size
         )
-        pygame.draw.rect(screen, color, border_rect, 2)
+        pygame.draw.rect(screen, color, border_rect, camera.scale_width(2))
         
         # プレイヤーの向きを示す線（武器）を太く、長くする
-        weapon_length = self.radius * 2.5  # 半径の2.5倍の長さ
-        end_x = self.x + math.cos(self.facing_angle) * weapon_length
-        end_y = self.y + math.sin(self.facing_angle) * weapon_length
-        pygame.draw.line(screen, color, (self.x, self.y), (end_x, end_y), 3)  # 線の太さを3に変更
+        weapon_length = camera.scale(self.radius * 2.5)  # 半径の2.5倍の長さ
+        end_x = x + math.cos(self.facing_angle) * weapon_length
+        end_y = y + math.sin(self.facing_angle) * weapon_length
+        pygame.draw.line(screen, color, (x, y), (end_x, end_y), camera.scale_width(3))  # 線の太さを3に変更
+
+    def get_draw_rect(self):
+        """draw() で描き変わる範囲 (ダーティ矩形描画用)"""
+        # 本体・武器の線・ハイパーの輝きを含む正方形
+        half = int(max(self.radius * 2.5, self.square_size / 2 + 6, self.radius + 8)) + 3
+        rect = pygame.Rect(int(self.x) - half, int(self.y) - half, half * 2, half * 2)
+        if self.shield_effect:
+            rect.union_ip(self.shield_effect.get_draw_rect())
+        for ring in self.dash_rings:
+            rect.union_ip(ring.get_draw_rect())
+        for p in self.ferment_particles:
+            rect.union_ip(pygame.Rect(int(p["x"]) - 3, int(p["y"]) - 3, 6, 6))
+        return rect
 
     def _fire_weapon_b_burst_shot(self):
         """武器Bの連射モードで1発発射する"""
@@ -913,8 +946,8 @@ class Player:
             self.game.add_projectile(projectile)
             
             # 効果音を再生（もし存在すれば）
-            if self.game and "shot" in self.game.sounds:
-                self.game.sounds["shot"].play()
+            if self.game:
+                self.game.play_sfx("shot")
 
     def _fire_special_spread_shot(self):
         """スペシャルスプレッド弾を発射する（武器Bの強化版）"""
@@ -1017,15 +1050,21 @@ class HyperEffect:
         self.x = self.owner.x
         self.y = self.owner.y
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """エフェクトを描画"""
         if self.is_dead:
             return
             
         alpha = int(255 * (self.duration / self.max_duration))
+        x, y = camera.world_to_screen(self.x, self.y)
         radius = self.radius + int((self.max_duration - self.duration) / 2)
         
         # 輝くリング
         color = (200, 200, 255, alpha)
         for r in range(radius - 5, radius + 6, 3):
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), r, 1) 
\ No newline at end of file
+            pygame.draw.circle(screen, color, (int(x), int(y)), camera.scale(r), 1)
+
+    def get_draw_rect(self):
+        """描画が及ぶ範囲"""
+        half = self.radius + int((self.max_duration - self.duration) / 2) + 7
+        return pygame.Rect(int(self.x) - half, int(self.y) - half, half * 2, half * 2) 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pygame
 import math
+from game.camera import IDENTITY_CAMERA
 from game.constants import (
     ARENA_CENTER_X, ARENA_CENTER_Y, ARENA_RADIUS, 
     WHITE, CYAN, MAGENTA, YELLOW, ORANGE, GREEN, RED,
@@ -68,9 +69,15 @@ class Projectile:
         # ホーミングの強さに応じて角度を変更
         self.angle += angle_diff * self.homing_strength
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """弾を描画"""
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius)
+        x, y = camera.world_to_screen(self.x, self.y)
+        pygame.draw.circle(screen, WHITE, (int(x), int(y)), camera.scale(self.radius))
+
+    def get_draw_rect(self):
+        """draw() で描き変わる範囲 (ダーティ矩形描画用)"""
+        half = int(self.radius) + 2
+        return pygame.Rect(int(self.x) - half, int(self.y) - half, half * 2, half * 2)
         
     def on_hit(self, target):
         """ヒット時の処理"""
@@ -95,16 +102,27 @@ class BeamProjectile(Projectile):
         self.homing = True
         self.homing_strength = 0.02  # 2%の強さでホーミング
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """ビームを描画"""
         # ビームの先端
-        end_x = self.x + math.cos(self.angle) * self.length
-        end_y = self.y + math.sin(self.angle) * self.length
+        end_x, end_y = camera.world_to_screen(
+            self.x + math.cos(self.angle) * self.length,
+            self.y + math.sin(self.angle) * self.length
+        )
+        start = camera.world_to_screen(self.x, self.y)
         
         # ビームの本体
-        pygame.draw.line(screen, self.color, (self.x, self.y), (end_x, end_y), 3)
+        pygame.draw.line(screen, self.color, start, (end_x, end_y), camera.scale_width(3))
         # ビームの先端
-        pygame.draw.circle(screen, WHITE, (int(end_x), int(end_y)), 2)
+        pygame.draw.circle(screen, WHITE, (int(end_x), int(end_y)), camera.scale(2))
+
+    def get_draw_rect(self):
+        """ビームの線分と先端を含む範囲"""
+        end_x = self.x + math.cos(self.angle) * self.length
+        end_y = self.y + math.sin(self.angle) * self.length
+        left, right = sorted((int(self.x), int(end_x)))
+        top, bottom = sorted((int(self.y), int(end_y)))
+        return pygame.Rect(left - 4, top - 4, right - left + 8, bottom - top + 8)
         
     def on_hit(self, target):
         """ビームヒット時の処理"""
@@ -123,9 +141,10 @@ class BallisticProjectile(Projectile):
         self.homing = True
         self.homing_strength = 0.03  # 3%の強さでホーミング
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """弾丸を描画"""
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+        x, y = camera.world_to_screen(self.x, self.y)
+        pygame.draw.circle(screen, self.color, (int(x), int(y)), camera.scale(self.radius))
         
     def on_hit(self, target):
         """弾丸ヒット時の処理"""
@@ -156,9 +175,10 @@ class MeleeProjectile(Projectile):
             self.x = self.owner.x + math.cos(self.angle) * offset_distance
             self.y = self.owner.y + math.sin(self.angle) * offset_distance
         
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """近接攻撃を描画"""
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius, 2)
+        x, y = camera.world_to_screen(self.x, self.y)
+        pygame.draw.circle(screen, self.color, (int(x), int(y)), camera.scale(self.radius), camera.scale_width(2))
         
     def on_hit(self, target):
         """近接攻撃ヒット時の処理"""
@@ -187,8 +207,11 @@ class SoybeanCollectible(Projectile):
         self.x += random.uniform(-0.5, 0.5)
         self.y += random.uniform(-0.5, 0.5)
 
-    def draw(self, screen):
+    def draw(self, screen, camera=IDENTITY_CAMERA):
         """描画"""
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+        x, y = camera.world_to_screen(self.x, self.y)
+        center = (int(x), int(y))
+        radius = camera.scale(self.radius)
+        pygame.draw.circle(screen, self.color, center, radius)
         # 縁取り
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius, 1)
+        pygame.draw.circle(screen, WHITE, center, radius, 1)
@@ -0,0 +1,167 @@
+import math
+import random
+
+import numpy as np
+import pygame
+
+from game.ai import MOVEMENT_STYLE_WEIGHTS, AIController
+from game.ai_search import SearchAI
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.states import AutoTestState
+
+# 1試合の上限フレーム数 (60秒)。決着がつかなければ残り体力で勝敗を決める
+MATCH_FRAMES = 60 * 60
+# 自己対戦の探索 AI は時間ではなく全候補を評価しきるまで探索する (結果を再現可能にするため)
+SELFPLAY_SEARCH_BUDGET_MS = 1000.0
+ELO_BASE = 1500.0
+
+
+def policy_name(kind, weights=None):
+    """方策の表記。auto_test の重み付き版は "auto_test:6,2,1,2" の形"""
+    if kind == "auto_test" and weights is not None and tuple(weights) != MOVEMENT_STYLE_WEIGHTS:
+        return "auto_test:" + ",".join(str(w) for w in weights)
+    return kind
+
+
+def parse_policy(spec):
+    """方策の表記を (種類, 移動スタイルの重み) に分解する"""
+    kind, _, params = spec.partition(":")
+    if kind not in ("auto_test", "simple", "hard"):
+        raise ValueError(f"未知の AI 方策です: {spec}")
+    weights = MOVEMENT_STYLE_WEIGHTS
+    if params:
+        if kind != "auto_test":
+            raise ValueError(f"重みを指定できるのは auto_test だけです: {spec}")
+        weights = tuple(int(w) for w in params.split(","))
+        if len(weights) != len(MOVEMENT_STYLE_WEIGHTS) or min(weights) < 0 or sum(weights) <= 0:
+            raise ValueError(f"重みは0以上の整数4つで指定してください: {spec}")
+    return kind, weights
+
+
+def random_policy_specs(count, seed=0, max_weight=8):
+    """auto_test の移動スタイルの重みをランダムに振った方策を count 個作る"""
+    rng = random.Random(seed)
+    specs = []
+    seen = {policy_name("auto_test")}
+    while len(specs) < count:
+        weights = tuple(rng.randint(0, max_weight) for _ in MOVEMENT_STYLE_WEIGHTS)
+        spec = policy_name("auto_test", weights)
+        if sum(weights) > 0 and spec not in seen:
+            seen.add(spec)
+            specs.append(spec)
+    return specs
+
+
+def _make_control(game, spec, player, opponent, is_player1):
+    """方策に従って player の入力を返す関数を作る"""
+    kind, weights = parse_policy(spec)
+    if kind == "auto_test":
+        controller = AIController(game, movement_weights=weights)
+        return lambda: controller.auto_test_ai_control(player, opponent, is_player1)
+    if kind == "simple":
+        return lambda: game.ai_controller.simple_ai_control(player, opponent)
+    search = SearchAI(time_budget_ms=SELFPLAY_SEARCH_BUDGET_MS)
+    return lambda: search.control(player, opponent, game.projectiles, hyper_ready=player.hyper_gauge >= 100)
+
+
+def play_match(spec1, spec2, seed, max_frames=MATCH_FRAMES):
+    """spec1 (プレイヤー1) と spec2 (プレイヤー2) を描画なしで1試合戦わせる。
+
+    乱数は seed で初期化するので、同じ引数なら同じ結果になる。
+    戻り値は {"score": プレイヤー1の得点 (1/0.5/0), "frames", "health1", "health2"}。
+    """
+    if not pygame.get_init():
+        pygame.init()
+    random.seed(seed)
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_audio=False, enable_title_background=False)
+    game.sounds = {}
+    # 決着判定は自前で行うので、自動テストの時間切れ・体力0での遷移は止めておく
+    game.test_duration = float("inf")
+    game.change_state(game.get_state(AutoTestState))
+    game.reset_players()
+    player1, player2 = game.player1, game.player2
+    control1 = _make_control(game, spec1, player1, player2, True)
+    control2 = _make_control(game, spec2, player2, player1, False)
+
+    frames = 0
+    while frames < max_frames and player1.health > 0 and player2.health > 0:
+        frames += 1
+        game.current_time += 1
+        game.ai_move_timer1 += 1
+        game.ai_move_timer2 += 1
+        game.danger_field.refresh(game.projectiles)
+        player1.key_states = control1()
+        player2.key_states = control2()
+        game.update_gameplay_elements(use_simple_ai=False)
+
+    if player1.health == player2.health:
+        score = 0.5
+    else:
+        score = 1.0 if player1.health > player2.health else 0.0
+    return {"score": score, "frames": frames, "health1": player1.health, "health2": player2.health}
+
+
+def _fit_strengths(wins, games, iterations=200):
+    """Bradley-Terry モデルの強さを MM 法で最尤推定する (引き分けは0.5勝)"""
+    strengths = np.ones(len(wins))
+    for _ in range(iterations):
+        denominator = (games / (strengths[:, None] + strengths[None, :])).sum(axis=1)
+        strengths = wins / denominator
+        strengths /= math.exp(np.log(strengths).mean())
+    return strengths
+
+
+def _ratings(names, results, indices):
+    index = {name: i for i, name in enumerate(names)}
+    count = len(names)
+    wins = np.zeros(count)
+    games = np.zeros((count, count))
+    for k in indices:
+        a, b, score = results[k]
+        i, j = index[a], index[b]
+        wins[i] += score
+        wins[j] += 1.0 - score
+        games[i, j] += 1
+        games[j, i] += 1
+    # 全勝・全敗でも発散しないよう、対戦した組ごとに1引き分けを仮に加える
+    played = games > 0
+    wins += 0.5 * played.sum(axis=1)
+    games += played
+    strengths = _fit_strengths(wins, games)
+    elo = 400.0 * np.log10(strengths)
+    return ELO_BASE + elo - elo.mean()
+
+
+def elo_table(results, names=None, bootstrap=200, seed=0):
+    """対戦結果 [(方策A, 方策B, Aの得点), ...] から Elo レーティング表を作る。
+
+    レーティングは Bradley-Terry の最尤推定を Elo 尺度 (平均1500) に直したもの。
+    95% 信頼区間は試合単位のブートストラップで求める。
+    戻り値はレーティング降順の {"name", "elo", "low", "high", "games", "score"} のリスト。
+    """
+    if names is None:
+        names = sorted({a for a, _, _ in results} | {b for _, b, _ in results})
+    names = list(names)
+    elo = _ratings(names, results, range(len(results)))
+
+    rng = np.random.default_rng(seed)
+    samples = np.array([
+        _ratings(names, results, rng.integers(0, len(results), len(results)))
+        for _ in range(bootstrap)
+    ]) if results and bootstrap > 0 else elo[None, :]
+    low, high = np.percentile(samples, [2.5, 97.5], axis=0)
+
+    table = []
+    for i, name in enumerate(names):
+        played = [(score if a == name else 1.0 - score) for a, b, score in results if name in (a, b)]
+        table.append({
+            "name": name,
+            "elo": float(elo[i]),
+            "low": float(low[i]),
+            "high": float(high[i]),
+            "games": len(played),
+            "score": sum(played) / len(played) if played else 0.0,
+        })
+    table.sort(key=lambda row: row["elo"], reverse=True)
+    return table
@@ -0,0 +1,107 @@
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+BUNDLE_NAME = "sounds.bundle"  # assets/sounds 内のファイル名
+# バンドルに入れる音 (ファイル名、拡張子なし)。Game が登録する効果音と BGM だけで、使わない WAV は入れない
+BUNDLED_SOUNDS = ("menu", "special", "shot", "hit", "shield", "hyper", "rockman_title")
+
+# ファイルの先頭: マジック (8 バイト) + 索引の長さ (uint32, リトルエンディアン) + 索引 (JSON)
+MAGIC = b"SNDBNDL1"
+_HEADER = struct.Struct("<8sI")
+ALIGN = 16  # PCM の先頭をそろえる境界
+SAMPLE_SIZE = -16  # pygame.mixer の形式の表記 (符号付き 16 ビット)
+
+
+class SoundBundle:
+    """assets/sounds の音声をまとめた1ファイル (synth/build_sounds.py が作る)。
+
+    中身はミキサーにそのまま渡せる int16 の PCM で、索引に 名前 -> 位置・長さ・形式 を持つ。
+    開くときに読むのは索引だけで、Sound を作るまでどの音の PCM も読まない (音ごとに遅延して実体化する)。
+    Sound(buffer=...) には mmap の該当部分をそのまま渡すので、デコードも中間のコピーもない。
+    mmap が使えない環境 (WASM など) では、Sound を作るときにその音の分だけファイルから読む。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, index_length = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"音声バンドルではありません: {path}")
+            self.entries = json.loads(f.read(index_length).decode("utf-8"))
+            try:
+                self._view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except (OSError, ValueError):
+                self._view = None
+        self._base = _payload_start(index_length)
+
+    @classmethod
+    def open(cls, path):
+        """バンドルを開く。ないか壊れていれば None (そのときは個別のファイルを読む)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self):
+        return list(self.entries)
+
+    def buffer(self, name):
+        """その音の PCM (mmap できていればコピーしない memoryview、できなければその音の分だけ読んだ bytes)"""
+        entry = self.entries[name]
+        start = self._base + entry["offset"]
+        if self._view is None:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                return f.read(entry["length"])
+        return self._view[start:start + entry["length"]]
+
+    def playable(self, name):
+        """いまのミキサーの形式のまま鳴らせるか (違えば個別のファイルをデコードする)"""
+        entry = self.entries.get(name)
+        init = pygame.mixer.get_init()
+        return entry is not None and init is not None and tuple(init) == (
+            entry["frequency"], SAMPLE_SIZE, entry["channels"])
+
+    def sound(self, name):
+        return pygame.mixer.Sound(buffer=self.buffer(name))
+
+
+def write_bundle(path, sounds):
+    """sounds (名前 -> (int16 の PCM (フレーム数 x チャンネル数), サンプリング周波数)) を1ファイルに書く"""
+    entries = {}
+    offset = 0
+    for name, (samples, frequency) in sounds.items():
+        entries[name] = {
+            "offset": offset,
+            "length": samples.nbytes,
+            "frequency": int(frequency),
+            "channels": 1 if samples.ndim == 1 else int(samples.shape[1]),
+        }
+        offset += -(-samples.nbytes // ALIGN) * ALIGN
+
+    index = json.dumps(entries, sort_keys=True).encode("utf-8")
+    base = _payload_start(len(index))
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        for name, (samples, _) in sounds.items():
+            f.seek(base + entries[name]["offset"])
+            f.write(samples.tobytes())
+        f.truncate(base + offset)
+    os.replace(tmp, path)
+    return entries
+
+
+def _payload_start(index_length):
+    """PCM の並びの開始位置 (索引の後ろを ALIGN にそろえたところ)。索引の offset はここからの位置"""
+    return -(-(_HEADER.size + index_length) // ALIGN) * ALIGN
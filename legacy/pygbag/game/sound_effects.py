@@ -1,18 +1,24 @@
+import hashlib
+import inspect
+import os
 import pygame
 import numpy as np
 from pathlib import Path
 
-# 効果音ディレクトリ
-sfx_dir = Path("sfx")
-sfx_dir.mkdir(exist_ok=True)
+# 効果音ディレクトリ (生成した PCM のディスクキャッシュ。最初の書き込み時に作る)
+sfx_dir = Path(__file__).resolve().parent.parent / "sfx"
+
+# キャッシュファイルの形式を変えたら上げる (古いファイルは読まれなくなり、書き込み時に消える)
+SFX_CACHE_VERSION = 1
 
 # 効果音キャッシュ
 sound_cache = {}
 
-def create_sound_effect(effect_type, volume=0.7):
-    """8ビット風の効果音を生成する
+def synthesize_pcm(effect_type, volume=0.7):
+    """8ビット風の効果音の波形を生成する
     effect_type: 効果音の種類 ('dash', 'shot', 'hit', 'menu_move', 'menu_select')
     volume: 音量 (0.0〜1.0)
+    戻り値: そのまま mixer に渡せるステレオ int16 の配列 (サンプル数, 2)
     """
     sample_rate = 44100
     
@@ -134,12 +140,65 @@ def create_sound_effect(effect_type, volume=0.7):
 
     # mixerは16bit int (size=-16) 初期化のため、float32を渡すとWASM上でバイト列が
     # そのまま解釈されてホワイトノイズになる。必ず int16 に量子化してから渡す。
-    stereo_i16 = (stereo * 32767.0).astype(np.int16)
+    return (stereo * 32767.0).astype(np.int16)
+
+_generator_digest = None
+
+def _generator_source_digest():
+    """波形生成コードのハッシュ。synthesize_pcm を書き換えるとキャッシュが自動で無効になる"""
+    global _generator_digest
+    if _generator_digest is None:
+        try:
+            source = inspect.getsource(synthesize_pcm)
+        except (OSError, TypeError):
+            # ソースが読めない環境ではバージョン番号だけで判定する
+            source = ""
+        _generator_digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return _generator_digest
+
+def cache_path(effect_type, volume=0.7, cache_dir=None):
+    """(効果音の種類, 音量, 生成コードのバージョン) から決まるキャッシュファイルのパス"""
+    key = f"{SFX_CACHE_VERSION}:{effect_type}:{volume!r}:{_generator_source_digest()}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir or sfx_dir) / f"{effect_type}-{volume!r}-{digest}.npy"
+
+def load_pcm(effect_type, volume=0.7, cache_dir=None):
+    """効果音の PCM を返す。ディスクキャッシュがあればメモリマップで読み、なければ生成して保存する"""
+    path = cache_path(effect_type, volume, cache_dir)
+    try:
+        pcm = np.load(path, mmap_mode="r", allow_pickle=False)
+        if pcm.dtype == np.int16 and pcm.ndim == 2 and pcm.shape[1] == 2:
+            return pcm
+    except (OSError, ValueError):
+        pass
+
+    pcm = synthesize_pcm(effect_type, volume)
+    _store_pcm(path, pcm)
+    return pcm
+
+def _store_pcm(path, pcm):
+    """PCM を書き込み、同じ効果音・音量の古いバージョンのファイルを消す (書き込めなくても無視する)"""
+    prefix = path.name.rsplit("-", 1)[0] + "-"
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            np.save(f, pcm, allow_pickle=False)
+        os.replace(tmp_path, path)
+        for stale in path.parent.glob(prefix + "*.npy"):
+            if stale != path:
+                stale.unlink()
+    except OSError as e:
+        print(f"効果音キャッシュ書き込みエラー: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
 
-    # PyGame用のサウンドオブジェクトに変換
+def create_sound_effect(effect_type, volume=0.7):
+    """8ビット風の効果音を pygame の Sound として返す (波形はディスクキャッシュ経由)"""
     try:
-        sound = pygame.sndarray.make_sound(stereo_i16)
-        return sound
+        return pygame.sndarray.make_sound(load_pcm(effect_type, volume))
     except Exception as e:
         print(f"効果音生成エラー: {e}")
         return None
@@ -160,7 +219,7 @@ def play_sound(effect_type, volume=0.7):
         sound.set_volume(volume)
         sound.play()
 
-# 初期化関数
+# 初期化関数 (インポートしただけでは生成もディスクへの書き込みもしない。使う側が呼ぶ)
 def initialize_sounds():
     """全効果音を事前に生成してキャッシュ"""
     effects = ["dash", "shot", "hit", "menu_move", "menu_select"]
@@ -168,7 +227,4 @@ def initialize_sounds():
         get_sound(effect)
     
     print("効果音初期化完了")
-
-# Pygameが初期化されている場合のみ実行
-if pygame.mixer.get_init():
-    initialize_sounds() 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -1,5 +1,4 @@
 import sys
-import time  # time.timeを使用するため
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -11,13 +10,17 @@ from game.constants import (
     CYAN,
     GRAY,
     NEGI_GREEN,
+    PAUSE_BLUR_FACTOR,
+    PAUSE_DIM_ALPHA,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     TOFU_WHITE,
     WHITE,
     YELLOW,
 )
-from game.i18n import tr
+from game.fonts import get_font
+from game.i18n import get_language, tr
+from game.text_cache import render_text
 
 # Gameクラスを循環参照なしで型ヒントとして利用するためのインポート
 if TYPE_CHECKING:
@@ -74,6 +77,13 @@ class BaseState(ABC):
         """画面を描画する"""
         pass
 
+    def collect_dirty_rects(self, tracker):
+        """直前の draw() で描き変わった領域を tracker に登録する。
+
+        デフォルトは全画面転送。変化が局所的な状態だけがオーバーライドする。
+        """
+        tracker.invalidate()
+
 
 class TitleState(BaseState):
     """タイトル画面の状態"""
@@ -86,46 +96,28 @@ class TitleState(BaseState):
         self.title_font = self.game.make_font(72)
         self.menu_font = self.game.make_font(36)
         self.version_font = self.game.make_font(20)
-        # Surface は毎フレーム再生成せずインスタンスに保持する (pygbag で描画コストを下げるため)
-        self.background_surface = pygame.Surface(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-        )
-        self.overlay_surface = pygame.Surface(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-        )
-        self.overlay_surface.fill((0, 0, 0, 100))
-        self.background_game = None
-        self.background_test_start_time = 0.0
+        # 背景デモは Game が保持するものを使い回す (enter で取得)
+        self.demo = None
 
     def enter(self):
+        # インスタンスは使い回されるので、訪問ごとにカーソルを先頭へ戻す
+        self.selected_item = 0
         self.game.play_title_bgm()
         if not self.game.enable_title_background:
             return
-        from game.game import Game
-
-        self.background_game = Game(
-            self.game.screen, debug=False, enable_audio=False, enable_title_background=False
-        )
-        self.background_game.change_state(AutoTestState(self.background_game))
-        self.background_test_start_time = time.time()
-
-    def exit(self):
-        self.background_game = None
+        self.demo = self.game.get_title_demo()
 
     def handle_input(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_item = (self.selected_item - 1) % len(self.menu_items)
-                if "menu" in self.game.sounds:
-                    self.game.sounds["menu"].play()
+                self.game.play_sfx("menu", immediate=True)
             elif event.key == pygame.K_DOWN:
                 self.selected_item = (self.selected_item + 1) % len(self.menu_items)
-                if "menu" in self.game.sounds:
-                    self.game.sounds["menu"].play()
+                self.game.play_sfx("menu", immediate=True)
             elif event.key == pygame.K_RETURN or event.key == pygame.K_z:
                 self.select_menu_item()
-                if "special" in self.game.sounds:
-                    self.game.sounds["special"].play()
+                self.game.play_sfx("special", immediate=True)
             elif event.key == pygame.K_ESCAPE:
                 # タイトル画面でESCを押すとゲームを終了
                 pygame.quit()
@@ -144,65 +136,52 @@ class TitleState(BaseState):
 
         selected_option = self.menu_items[self.selected_item]
         if selected_option == "シングル対戦モード":
-            self.game.change_state(SingleVersusGameState(self.game))
+            self.game.change_state(self.game.get_state(SingleVersusGameState))
             self.game.reset_players()
         elif selected_option == "トレーニングモード":
-            self.game.change_state(TrainingState(self.game))
+            self.game.change_state(self.game.get_state(TrainingState))
             self.game.reset_players()
         elif selected_option == "自動テスト":
-            self.game.change_state(AutoTestState(self.game))
+            self.game.change_state(self.game.get_state(AutoTestState))
             self.game.reset_players()
+            self.game.test_timer = 0
         elif selected_option == "操作説明":
-            self.game.change_state(InstructionsState(self.game))
+            self.game.change_state(self.game.get_state(InstructionsState, previous_state=self))
         elif selected_option == "オプション":
-            self.game.change_state(OptionsState(self.game))
+            self.game.change_state(self.game.get_state(OptionsState, previous_state=self))
         elif selected_option == "終了":
             pygame.quit()
             sys.exit()
 
     def update(self):
-        if not self.background_game:
-            return
-        current_time = time.time()
-        if current_time - self.background_test_start_time > 10:
-            # 背景デモをリスタートさせるのに必要なのは (1) プレイヤー等の位置リセットと
-            # (2) AutoTestState の残り時間カウンタ初期化の2つだけ。
-            # AutoTestState(...) を毎回 new すると make_font(24) が TTF を再ロードして
-            # 可視なヒッチが出るので、既にそのステートならインスタンス再生成は省く。
-            self.background_game.reset_players()
-            self.background_game.test_timer = 0
-            if not isinstance(self.background_game.current_state, AutoTestState):
-                self.background_game.change_state(AutoTestState(self.background_game))
-            self.background_test_start_time = current_time
-        self.background_game.update()
+        if self.demo:
+            self.demo.update()
+        # メニュー待機中に、まだ生成していない状態を1フレームに1つずつ作っておく
+        self.game.prewarm_state()
 
     def draw(self, screen: pygame.Surface):
         """タイトル画面の描画処理"""
         screen.fill((0, 0, 0))
-        if self.background_game:
-            self.background_surface.fill((0, 0, 0, 0))
-            self.background_game.draw_to_surface(self.background_surface)
-            # overlay Surface は __init__ でキャッシュ済みのものを使い回す (毎フレーム alloc を避ける)
-            self.background_surface.blit(self.overlay_surface, (0, 0))
-            screen.blit(self.background_surface, (0, 0))
+        if self.demo:
+            self.demo.draw(screen)
 
         # ゲームタイトル
-        title_text = self.title_font.render(tr("splash.title"), True, CYAN)
+        title_text = render_text(self.title_font, tr("splash.title"), CYAN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
         screen.blit(title_text, title_rect)
 
         # メニュー項目
         for i, item in enumerate(self.menu_items):
             if i == self.selected_item:
-                text = self.menu_font.render(f"> {item} <", True, CYAN)
+                text = render_text(self.menu_font, f"> {item} <", CYAN)
             else:
-                text = self.menu_font.render(item, True, WHITE)
+                text = render_text(self.menu_font, item, WHITE)
 
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, 300 + i * 50))
             screen.blit(text, rect)
 
         # バージョン表示
-        version_text = self.version_font.render("Ver 0.1.0", True, (100, 100, 100))
+        version_text = render_text(self.version_font, "Ver 0.1.0", (100, 100, 100))
         version_rect = version_text.get_rect(
             bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20)
         )
@@ -210,7 +189,7 @@ class TitleState(BaseState):
 
         # ミュート切替案内 (左下)
         mute_key = "title.mute_hint_off" if getattr(self.game, "audio_muted", False) else "title.mute_hint_on"
-        mute_text = self.version_font.render(tr(mute_key), True, (150, 200, 230))
+        mute_text = render_text(self.version_font, tr(mute_key), (150, 200, 230))
         mute_rect = mute_text.get_rect(
             bottomleft=(20, SCREEN_HEIGHT - 20)
         )
@@ -227,8 +206,11 @@ class SingleVersusGameState(BaseState):
         # ゲーム開始時は弾をクリアしない（状態遷移時に保持するため）
         # self.game.projectiles.clear()
         # self.game.effects.clear()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(36, path=None)
+        self.small_font = get_font(24, path=None)
+        # HUD 文字列の描画結果 (slot -> (Surface, Rect)) と今フレームで変化した領域
+        self._hud_blits = {}
+        self._hud_dirty = []
 
     def needs_game_update(self):
         return True
@@ -281,7 +263,7 @@ class SingleVersusGameState(BaseState):
         self.game.player2.key_states = {
             key: False for key in self.game.player2.key_states
         }
-        self.game.change_state(PauseState(self.game, self))
+        self.game.change_state(self.game.get_state(PauseState, previous_state=self))
 
     def update(self):
         """ゲーム状態の更新"""
@@ -289,6 +271,7 @@ class SingleVersusGameState(BaseState):
 
     def draw(self, screen: pygame.Surface):
         """ゲーム画面の描画"""
+        self._hud_dirty = []
         # ゲーム背景の描画
         self.game.draw_background(screen)
 
@@ -306,19 +289,47 @@ class SingleVersusGameState(BaseState):
     def draw_hud(self, screen: pygame.Surface):
         """HUD（ヘッドアップディスプレイ）を描画する"""
         # プレイヤー1の体力バー
-        p1_health_text = f"P1: {self.game.player1.health}"
-        p1_health_surf = self.font.render(p1_health_text, True, (255, 255, 255))
-        screen.blit(p1_health_surf, (20, 20))
+        # 整数に丸めて、値が変わったときだけ文字列キャッシュを更新させる
+        p1_health_text = f"P1: {int(self.game.player1.health)}"
+        p1_health_surf = render_text(self.font, p1_health_text, (255, 255, 255))
+        self._blit_hud(screen, "p1_health", p1_health_surf, (20, 20))
 
         # プレイヤー2の体力バー
-        p2_health_text = f"P2: {self.game.player2.health}"
-        p2_health_surf = self.font.render(p2_health_text, True, (255, 255, 255))
-        screen.blit(p2_health_surf, (self.game.width - 120, 20))
+        p2_health_text = f"P2: {int(self.game.player2.health)}"
+        p2_health_surf = render_text(self.font, p2_health_text, (255, 255, 255))
+        self._blit_hud(screen, "p2_health", p2_health_surf, (self.game.width - 120, 20))
 
         # ゲーム時間の表示（テスト用に簡易表示）
         game_time_text = "TIME: 00:00"
-        time_surf = self.font.render(game_time_text, True, (255, 255, 255))
-        screen.blit(time_surf, (self.game.width // 2 - time_surf.get_width() // 2, 20))
+        time_surf = render_text(self.font, game_time_text, (255, 255, 255))
+        self._blit_hud(screen, "time", time_surf, (self.game.width // 2 - time_surf.get_width() // 2, 20))
+
+    def _blit_hud(self, screen: pygame.Surface, slot, surface, pos):
+        """HUD 文字列を描画し、前フレームから変わっていればその領域を記録する。
+
+        文字列 Surface はテキストキャッシュで共有されるので、同一性で変化を判定できる。
+        """
+        rect = pygame.Rect(pos, surface.get_size())
+        screen.blit(surface, rect)
+        previous = self._hud_blits.get(slot)
+        if previous is None or previous[0] is not surface:
+            self._hud_dirty.append(rect if previous is None else rect.union(previous[1]))
+            self._hud_blits[slot] = (surface, rect)
+
+    def collect_dirty_rects(self, tracker):
+        """移動するプレイヤー・弾・エフェクトと、変化した HUD 領域を登録する"""
+        if self.game.current_zoom != 1.0:
+            # カメラがズームしている間は画面全体が動くので全画面転送
+            tracker.invalidate()
+            return
+        tracker.add(self.game.player1.get_draw_rect())
+        tracker.add(self.game.player2.get_draw_rect())
+        for projectile in self.game.projectiles:
+            tracker.add(projectile.get_draw_rect())
+        for effect in self.game.effects:
+            tracker.add(effect.get_draw_rect())
+        tracker.add_all(self.game.arena.get_dirty_rects())
+        tracker.add_all(self._hud_dirty)
 
 
 class TrainingState(SingleVersusGameState):  # SingleVersusGameStateを継承して基本的な動作は共通化
@@ -360,6 +371,7 @@ class AutoTestState(SingleVersusGameState):
 
     def draw(self, screen: pygame.Surface):
         """自動テストモード用の描画処理"""
+        self._hud_dirty = []
         if not isinstance(screen, pygame.Surface):
             self.draw_hud(screen)
             return
@@ -379,21 +391,66 @@ class AutoTestState(SingleVersusGameState):
 
         # テスト情報の表示
         test_info = f"自動テスト中: {self.game.test_timer // 60}秒経過"
-        test_text = self.test_font.render(test_info, True, (255, 255, 0))
-        screen.blit(test_text, (self.game.width // 2 - test_text.get_width() // 2, 50))
+        test_text = render_text(self.test_font, test_info, (255, 255, 0))
+        self._blit_hud(screen, "test_info", test_text, (self.game.width // 2 - test_text.get_width() // 2, 50))
 
 
-class InstructionsState(BaseState):
+class StaticScreenState(BaseState):
+    """キー入力か言語切替でしか見た目が変わらない画面の基底クラス。
+
+    compose() で描いた画面全体を Surface に保持し、毎フレームはそれを1回貼るだけにする。
+    作り直すのは invalidate_screen() された後 (enter・キー入力) と言語が変わったときだけ。
+    """
+
+    def __init__(self, game: "Game"):
+        super().__init__(game)
+        self._screen_cache = None
+        self._screen_cache_language = None
+        self._screen_stale = True
+        self._composed_this_frame = False
+
+    def enter(self):
+        super().enter()
+        self.invalidate_screen()
+
+    def invalidate_screen(self):
+        """次の draw() で画面を作り直させる"""
+        self._screen_stale = True
+
+    @abstractmethod
+    def compose(self, surface: pygame.Surface):
+        """画面全体を surface に描く"""
+        pass
+
+    def draw(self, screen: pygame.Surface):
+        language = get_language()
+        self._composed_this_frame = self._screen_stale or language != self._screen_cache_language
+        if self._composed_this_frame:
+            if self._screen_cache is None:
+                self._screen_cache = pygame.Surface((self.game.width, self.game.height))
+            self.compose(self._screen_cache)
+            self._screen_cache_language = language
+            self._screen_stale = False
+        screen.blit(self._screen_cache, (0, 0))
+
+    def collect_dirty_rects(self, tracker):
+        """作り直したフレームだけ全画面転送し、それ以外は何も転送しない"""
+        if self._composed_this_frame:
+            tracker.invalidate()
+
+
+class InstructionsState(StaticScreenState):
     """操作説明画面の状態"""
 
     def __init__(self, game: "Game", previous_state=None):
         super().__init__(game)
-        self.previous_state = previous_state or TitleState(game)
+        self.previous_state = previous_state or game.get_state(TitleState)
         self.title_font = self.game.make_font(48)
         self.font = self.game.make_font(24)
 
     def handle_input(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
+            self.invalidate_screen()
             # どのキーでも前の状態に戻る
             if event.key == pygame.K_ESCAPE:
                 self.handle_escape()
@@ -410,23 +467,23 @@ class InstructionsState(BaseState):
         if self.previous_state:
             self.game.change_state(self.previous_state)
         else:
-            self.game.change_state(TitleState(self.game))
+            self.game.change_state(self.game.get_state(TitleState))
 
     def update(self):
         # 操作説明画面では特に更新処理はない
         pass
 
-    def draw(self, screen: pygame.Surface):
+    def compose(self, screen: pygame.Surface):
         # 背景
         screen.fill((0, 0, 0))
 
         # タイトル
-        title = self.title_font.render(tr("controls.title"), True, (255, 255, 255))
+        title = render_text(self.title_font, tr("controls.title"), (255, 255, 255))
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 60))
         screen.blit(title, title_rect)
 
         # プレイヤー1の操作説明
-        p1_title = self.font.render(tr("controls.player1"), True, (0, 255, 255))
+        p1_title = render_text(self.font, tr("controls.player1"), (0, 255, 255))
         screen.blit(p1_title, (100, 120))
 
         y_offset = 155
@@ -439,12 +496,12 @@ class InstructionsState(BaseState):
             ("スペシャル攻撃", "C"),
             ("シールド", "V"),
         ]:
-            text = self.font.render(f"  {action}: {description}", True, (255, 255, 255))
+            text = render_text(self.font, f"  {action}: {description}", (255, 255, 255))
             screen.blit(text, (120, y_offset))
             y_offset += 28
 
         # プレイヤー2の操作説明
-        p2_title = self.font.render(tr("controls.player2"), True, (255, 100, 100))
+        p2_title = render_text(self.font, tr("controls.player2"), (255, 100, 100))
         screen.blit(p2_title, (100, y_offset + 15))
 
         y_offset += 50
@@ -457,38 +514,47 @@ class InstructionsState(BaseState):
             ("スペシャル攻撃", "T"),
             ("シールド", "Y"),
         ]:
-            text = self.font.render(f"  {action}: {description}", True, (255, 255, 255))
+            text = render_text(self.font, f"  {action}: {description}", (255, 255, 255))
             screen.blit(text, (120, y_offset))
             y_offset += 28
 
         # 共通操作
-        common_title = self.font.render(tr("controls.common"), True, (200, 200, 100))
+        common_title = render_text(self.font, tr("controls.common"), (200, 200, 100))
         screen.blit(common_title, (100, y_offset + 15))
         y_offset += 50
         for text_str in ["ESC: ポーズ/戻る", "Enter or Z: 決定"]:
-            text = self.font.render(f"  {text_str}", True, (200, 200, 200))
+            text = render_text(self.font, f"  {text_str}", (200, 200, 200))
             screen.blit(text, (120, y_offset))
             y_offset += 28
 
         # 戻る方法
-        back_text = self.font.render(tr("controls.back"), True, (150, 150, 150))
+        back_text = render_text(self.font, tr("controls.back"), (150, 150, 150))
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
         screen.blit(back_text, back_rect)
 
 
-class OptionsState(BaseState):
+class OptionsState(StaticScreenState):
     """オプション画面の状態"""
 
     def __init__(self, game: "Game"):
         super().__init__(game)
         self.selected_item = 0
         self.menu_items = ["プレイヤー1設定", "プレイヤー2設定", "サウンド設定", "戻る"]
-        self.previous_state = TitleState(game)  # デフォルトの前の状態はタイトル
+        self.previous_state = game.get_state(TitleState)  # デフォルトの前の状態はタイトル
         self.title_font = self.game.make_font(48)
         self.menu_font = self.game.make_font(36)
+        self._keep_cursor = False  # キー設定から戻ってくるときはカーソルをそのままにする
+
+    def enter(self):
+        super().enter()
+        # インスタンスは使い回されるので、開くたびにカーソルを先頭へ戻す (キー設定から戻ったときを除く)
+        if not self._keep_cursor:
+            self.selected_item = 0
+        self._keep_cursor = False
 
     def handle_input(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
+            self.invalidate_screen()
             if event.key == pygame.K_ESCAPE:
                 self.handle_escape()
                 return
@@ -498,30 +564,29 @@ class OptionsState(BaseState):
                 action = self.game.key_mapping_p1[event.key]
 
             if action == "up":
-                if "menu" in self.game.sounds:
-                    self.game.sounds["menu"].play()
+                self.game.play_sfx("menu", immediate=True)
                 self.selected_item = (self.selected_item - 1) % len(self.menu_items)
             elif action == "down":
-                if "menu" in self.game.sounds:
-                    self.game.sounds["menu"].play()
+                self.game.play_sfx("menu", immediate=True)
                 self.selected_item = (self.selected_item + 1) % len(self.menu_items)
             elif action == "weapon_a" or event.key == pygame.K_z:  # 決定（K_zキーも直接チェック）
-                if "special" in self.game.sounds:
-                    self.game.sounds["special"].play()
+                self.game.play_sfx("special", immediate=True)
                 selected_option = self.menu_items[self.selected_item]
                 if selected_option == "プレイヤー1設定":
                     self.game.key_config_player = 1
                     self.game.key_config_selected_item = 0
                     self.game.waiting_for_key_input = False
+                    self._keep_cursor = True
                     self.game.change_state(
-                        KeyConfigState(self.game, self)
+                        self.game.get_state(KeyConfigState, previous_state=self)
                     )  # 自身を前の状態として渡す
                 elif selected_option == "プレイヤー2設定":
                     self.game.key_config_player = 2
                     self.game.key_config_selected_item = 0
                     self.game.waiting_for_key_input = False
+                    self._keep_cursor = True
                     self.game.change_state(
-                        KeyConfigState(self.game, self)
+                        self.game.get_state(KeyConfigState, previous_state=self)
                     )  # 自身を前の状態として渡す
                 elif selected_option == "サウンド設定":
                     # TODO: サウンド設定画面を実装
@@ -534,46 +599,57 @@ class OptionsState(BaseState):
         if self.previous_state:
             self.game.change_state(self.previous_state)
         else:
-            self.game.change_state(TitleState(self.game))
+            self.game.change_state(self.game.get_state(TitleState))
 
     def update(self):
         # オプション画面では特に更新処理はない
         pass
 
-    def draw(self, screen: pygame.Surface):
+    def compose(self, screen: pygame.Surface):
         # 背景
         screen.fill((0, 0, 0))
 
         # タイトル
-        title_text = self.title_font.render(tr("options.title"), True, WHITE)
+        title_text = render_text(self.title_font, tr("options.title"), WHITE)
         screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 100))
 
         # メニュー項目
         for i, item in enumerate(self.menu_items):
             color = (0, 255, 255) if i == self.selected_item else (255, 255, 255)
-            text = self.menu_font.render(item, True, color)
+            text = render_text(self.menu_font, item, color)
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, 200 + i * 60))
             screen.blit(text, rect)
 
 
-class KeyConfigState(BaseState):
+class KeyConfigState(StaticScreenState):
     """キーコンフィグ画面の状態"""
 
     def __init__(self, game: "Game", previous_state=None):
         super().__init__(game)
         # Gameオブジェクトからキーコンフィグ関連の変数を初期化
-        self.player = self.game.key_config_player
-        self.selected_item = self.game.key_config_selected_item
-        self.waiting_for_input = self.game.waiting_for_key_input
+        self.sync_from_game()
         self.config_items = self.game.key_config_items
-        self.previous_state = previous_state or OptionsState(game)
+        self.previous_state = previous_state or game.get_state(OptionsState)
         self.title_font = self.game.make_font(48)
         self.player_font = self.game.make_font(36)
         self.menu_font = self.game.make_font(28)
         self.inst_font = self.game.make_font(20)
 
+    def sync_from_game(self):
+        """対象プレイヤー・選択項目・入力待ちを Game 側の値に合わせる"""
+        self.player = self.game.key_config_player
+        self.selected_item = self.game.key_config_selected_item
+        self.waiting_for_input = self.game.waiting_for_key_input
+
+    def enter(self):
+        super().enter()
+        # 使い回しのインスタンスなので、オプション画面で選ばれたプレイヤーを訪問ごとに反映する
+        self.sync_from_game()
+
     def handle_input(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
+            # 選択移動・キー割り当て・リセットのどれでも表示が変わる
+            self.invalidate_screen()
             if event.key == pygame.K_ESCAPE:
                 self.handle_escape()
                 return
@@ -621,23 +697,23 @@ class KeyConfigState(BaseState):
         if self.previous_state:
             self.game.change_state(self.previous_state)
         else:
-            self.game.change_state(OptionsState(self.game))
+            self.game.change_state(self.game.get_state(OptionsState))
 
     def update(self):
         pass
 
-    def draw(self, screen: pygame.Surface):
+    def compose(self, screen: pygame.Surface):
         """キー設定画面の描画処理"""
         # 背景
         screen.fill((0, 0, 0))
 
         # タイトル
-        title_text = self.title_font.render(tr("keyconfig.title"), True, WHITE)
+        title_text = render_text(self.title_font, tr("keyconfig.title"), WHITE)
         screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 50))
 
         # プレイヤー選択表示
         player_text = f"プレイヤー {self.player}"
-        player_label = self.player_font.render(player_text, True, WHITE)
+        player_label = render_text(self.player_font, player_text, WHITE)
         screen.blit(
             player_label, (SCREEN_WIDTH // 2 - player_label.get_width() // 2, 120)
         )
@@ -648,7 +724,7 @@ class KeyConfigState(BaseState):
         for i, action in enumerate(self.config_items):
             action_color = YELLOW if i == self.selected_item else WHITE
             action_text = f"{ACTION_NAMES[action]}: "
-            action_label = self.menu_font.render(action_text, True, action_color)
+            action_label = render_text(self.menu_font, action_text, action_color)
 
             # 現在のキー名を取得 (修正)
             key_mapping = (
@@ -678,7 +754,7 @@ class KeyConfigState(BaseState):
             else:
                 key_text = key_name
 
-            key_label = self.menu_font.render(key_text, True, action_color)
+            key_label = render_text(self.menu_font, key_text, action_color)
 
             # 描画
             screen.blit(action_label, (SCREEN_WIDTH // 3, y_pos))
@@ -692,7 +768,7 @@ class KeyConfigState(BaseState):
 
         y_pos = 480
         for instruction in instructions:
-            inst_label = self.inst_font.render(instruction, True, GRAY)
+            inst_label = render_text(self.inst_font, instruction, GRAY)
             screen.blit(
                 inst_label, (SCREEN_WIDTH // 2 - inst_label.get_width() // 2, y_pos)
             )
@@ -710,8 +786,15 @@ class PauseState(BaseState):
         self.selected_item = 0
         self.menu_items = ["ゲームに戻る", "操作説明", "タイトルに戻る", "ゲーム終了"]
         self.menu_positions = []
-        self.previous_state = prev_state or TitleState(game)
+        self.previous_state = prev_state or game.get_state(TitleState)
         self.setup_menu_positions()
+        # ダーティ矩形描画用: 直前に描いた選択位置とメニュー項目の領域
+        self._drawn_selected_item = None
+        self._menu_rects = []
+        self._menu_changed = True
+        # ポーズ直前のゲーム画面 (ポーズごとに一度だけ合成し、以降は毎フレーム貼るだけ)
+        self.snapshot = None
+        self._snapshot_stale = True
 
     # Setup positions for each menu item
     def setup_menu_positions(self):
@@ -723,6 +806,34 @@ class PauseState(BaseState):
         for i in range(len(self.menu_items)):
             self.menu_positions.append((screen_center_x, start_y + i * spacing))
 
+    def enter(self):
+        super().enter()
+        # 使い回しのインスタンスなので、ポーズするたびにメニューを初期状態に戻す
+        self.selected_item = 0
+        self._drawn_selected_item = None
+        self._menu_changed = True
+        # ゲームは止まっているので、次の描画で一度だけ静止画を作り直す
+        self._snapshot_stale = True
+
+    def capture_snapshot(self):
+        """中断したゲーム画面を描き、暗転・ぼかしを掛けた1枚の Surface として保持する"""
+        size = (self.game.width, self.game.height)
+        if self.snapshot is None or self.snapshot.get_size() != size:
+            self.snapshot = pygame.Surface(size)
+        self.snapshot.fill((0, 0, 0))
+        if self.previous_state is not None and self.previous_state.needs_game_update():
+            self.previous_state.draw(self.snapshot)
+
+        if PAUSE_BLUR_FACTOR > 1:
+            small_size = (max(1, size[0] // PAUSE_BLUR_FACTOR), max(1, size[1] // PAUSE_BLUR_FACTOR))
+            small = pygame.transform.smoothscale(self.snapshot, small_size)
+            pygame.transform.smoothscale(small, size, self.snapshot)
+        if PAUSE_DIM_ALPHA > 0:
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, PAUSE_DIM_ALPHA))
+            self.snapshot.blit(overlay, (0, 0))
+        self._snapshot_stale = False
+
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             # ESCキーでゲームに戻る
@@ -740,9 +851,9 @@ class PauseState(BaseState):
                 if self.selected_item == 0:  # Resume game
                     self.handle_escape()
                 elif self.selected_item == 1:  # Instructions
-                    self.game.change_state(InstructionsState(self.game, self))
+                    self.game.change_state(self.game.get_state(InstructionsState, previous_state=self))
                 elif self.selected_item == 2:  # Back to title
-                    self.game.change_state(TitleState(self.game))
+                    self.game.change_state(self.game.get_state(TitleState))
                 elif self.selected_item == 3:  # Exit game
                     pygame.quit()
                     sys.exit()
@@ -761,7 +872,7 @@ class PauseState(BaseState):
         if self.previous_state:
             self.game.change_state(self.previous_state)
         else:
-            self.game.change_state(TitleState(self.game))
+            self.game.change_state(self.game.get_state(TitleState))
 
     def update(self):
         """ポーズ画面の更新処理"""
@@ -769,16 +880,38 @@ class PauseState(BaseState):
 
     def draw(self, screen):
         """ポーズ画面の描画処理"""
-        # 背景を暗く表示
-        s = pygame.Surface((self.game.width, self.game.height), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))  # 半透明の黒
-        screen.blit(s, (0, 0))
+        # 背景は enter 時に合成した静止画を貼るだけ (ゲームは描き直さない)
+        if self._snapshot_stale:
+            self.capture_snapshot()
+        screen.blit(self.snapshot, (0, 0))
 
         # メニューの表示
+        self._menu_changed = self.selected_item != self._drawn_selected_item
+        self._drawn_selected_item = self.selected_item
+        self._menu_rects = []
         for i, item in enumerate(self.menu_items):
             color = (255, 255, 0) if i == self.selected_item else (255, 255, 255)
-            text = self.menu_font.render(item, True, color)
+            text = render_text(self.menu_font, item, color)
             x, y = self.menu_positions[i]
+            rect = text.get_rect(center=(x, y))
             screen.blit(text, (x - text.get_width() // 2, y - text.get_height() // 2))
+            self._menu_rects.append(rect)
+
+    def collect_dirty_rects(self, tracker):
+        """ポーズ中は選択項目が変わったときのメニュー領域だけを転送する"""
+        if self._menu_changed:
+            tracker.add_all(self._menu_rects)
+
 
 
+
+# タイトル画面の待機中に Game.prewarm_state() が順に生成しておく状態
+PREWARM_STATE_CLASSES = (
+    SingleVersusGameState,
+    TrainingState,
+    AutoTestState,
+    InstructionsState,
+    OptionsState,
+    KeyConfigState,
+    PauseState,
+)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+from game.i18n import get_language
+
+# キャッシュする文字列 Surface の上限数
+DEFAULT_MAX_ENTRIES = 256
+
+
+class TextSurfaceCache:
+    """font.render の結果を (フォント, 文字列, 色, 言語) ごとに保持する LRU キャッシュ。
+
+    フォントのラスタライズは pygbag/WASM で最も重い処理の一つで、HUD やメニューの
+    文字列はほとんど変化しない。HUD の数値は整数に丸めた文字列をキーにするので、
+    値が変わったときだけ再ラスタライズされる。
+
+    返す Surface は共有物なので呼び出し側で書き換えないこと。
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """キャッシュ済みの文字列 Surface を返す（無ければ描画して登録）"""
+        key = (font, text, tuple(color), antialias, get_language())
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """全エントリを破棄する"""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# プロセス全体で共有するキャッシュ
+_shared_cache = TextSurfaceCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """共有キャッシュ経由で文字列を描画する (font.render の置き換え)"""
+    return _shared_cache.render(font, text, color, antialias)
+
+
+def get_text_cache():
+    """共有キャッシュを返す（統計の参照やテスト用）"""
+    return _shared_cache
@@ -0,0 +1,146 @@
+import math
+
+import numpy as np
+
+# 何フレーム先までに当たる弾を脅威とみなすか
+THREAT_HORIZON = 60
+# 敵弾がこの数以上なら配列演算でまとめて解く (少ないうちは NumPy 呼び出しの固定費の方が高い)
+THREAT_VECTORIZE_MIN = 96
+
+
+class ThreatTable:
+    """あるプレイヤーに対する敵弾ごとの着弾予測 (evaluate_threats の結果)。
+
+    projectiles[i] について hit_times[i] は当たり判定に入るまでのフレーム数
+    (当たらない・THREAT_HORIZON 以上なら inf)、distances[i] は現在の距離。
+    """
+
+    def __init__(self, projectiles, hit_times, distances, earliest, nearest_distance):
+        self.projectiles = projectiles
+        self.hit_times = hit_times
+        self.distances = distances
+        self._earliest = earliest
+        self.nearest_distance = nearest_distance
+
+    def __len__(self):
+        return len(self.projectiles)
+
+    def earliest(self):
+        """最も早く当たる弾を (弾, 着弾時間, 着弾x, 着弾y) で返す。なければ None"""
+        return self._earliest
+
+    def any_within(self, distance_threshold):
+        """distance_threshold 未満の距離に敵弾があるか"""
+        return self.nearest_distance < distance_threshold
+
+
+def new_threat_table():
+    """evaluate_threats の table 引数に渡して使い回す空の表"""
+    return ThreatTable([], [], [], None, math.inf)
+
+
+def evaluate_threats(player, projectiles, horizon=THREAT_HORIZON, table=None):
+    """player に向かう敵弾すべての着弾時間と距離を一度の走査で求める。
+
+    弾を等速直線運動とみなし、|p + v t - q| = r1 + r2 の小さい方の正の解を求める。
+    敵弾が THREAT_VECTORIZE_MIN 以上あれば配列演算で一括して解く。
+    どちらの経路も式と演算順は同じなので、弾ごとに同じ結果になる。
+    table (new_threat_table() で作った表) を渡すと、弾が少ないうちはそのリストを書き換えて返す。
+    """
+    if table is None:
+        table = new_threat_table()
+    hostile = table.projectiles
+    hostile.clear()
+    for proj in projectiles:
+        if proj.owner != player:
+            hostile.append(proj)
+    if len(hostile) >= THREAT_VECTORIZE_MIN:
+        return _evaluate_vectorized(player, list(hostile), horizon)
+    return _evaluate_scalar(player, table, horizon)
+
+
+def _evaluate_scalar(player, table, horizon):
+    hostile = table.projectiles
+    hit_times = table.hit_times
+    distances = table.distances
+    hit_times.clear()
+    distances.clear()
+    earliest = None
+    nearest_distance = math.inf
+
+    for proj in hostile:
+        proj_vx = math.cos(proj.angle) * proj.speed
+        proj_vy = math.sin(proj.angle) * proj.speed
+        dx = player.x - proj.x
+        dy = player.y - proj.y
+
+        distance = math.sqrt(dx * dx + dy * dy)
+        distances.append(distance)
+        if distance < nearest_distance:
+            nearest_distance = distance
+
+        reach = player.radius + proj.radius
+        a = proj_vx * proj_vx + proj_vy * proj_vy
+        b = 2 * (proj_vx * dx + proj_vy * dy)
+        c = dx * dx + dy * dy - reach * reach
+        discriminant = b * b - 4 * a * c
+
+        hit_time = math.inf
+        if discriminant >= 0 and a > 0:
+            root = math.sqrt(discriminant)
+            t1 = (-b - root) / (2 * a)
+            t2 = (-b + root) / (2 * a)
+            if t1 > 0:
+                hit_time = t1
+            elif t2 > 0:
+                hit_time = t2
+            if hit_time >= horizon:
+                hit_time = math.inf
+        hit_times.append(hit_time)
+
+        if hit_time < (earliest[1] if earliest else math.inf):
+            earliest = (proj, hit_time, proj.x + proj_vx * hit_time, proj.y + proj_vy * hit_time)
+
+    table._earliest = earliest
+    table.nearest_distance = nearest_distance
+    return table
+
+
+def _evaluate_vectorized(player, hostile, horizon):
+    data = np.array([(proj.x, proj.y, proj.angle, proj.speed, proj.radius) for proj in hostile], dtype=float)
+    proj_x, proj_y, angle, speed, radius = data.T
+
+    proj_vx = np.cos(angle) * speed
+    proj_vy = np.sin(angle) * speed
+    dx = player.x - proj_x
+    dy = player.y - proj_y
+    distances = np.sqrt(dx * dx + dy * dy)
+
+    reach = player.radius + radius
+    a = proj_vx * proj_vx + proj_vy * proj_vy
+    b = 2 * (proj_vx * dx + proj_vy * dy)
+    c = dx * dx + dy * dy - reach * reach
+    discriminant = b * b - 4 * a * c
+    solvable = (discriminant >= 0) & (a > 0)
+
+    # 解けない弾は判別式0・分母1に置き換えて警告を出さずに計算し、後で inf にする
+    root = np.sqrt(np.where(solvable, discriminant, 0.0))
+    denominator = 2 * np.where(solvable, a, 0.5)
+    t1 = (-b - root) / denominator
+    t2 = (-b + root) / denominator
+    hit_times = np.where(t1 > 0, t1, np.where(t2 > 0, t2, np.inf))
+    hit_times[~solvable | (hit_times >= horizon)] = np.inf
+
+    earliest = None
+    index = int(np.argmin(hit_times))
+    if hit_times[index] != np.inf:
+        proj = hostile[index]
+        hit_time = float(hit_times[index])
+        earliest = (
+            proj,
+            hit_time,
+            proj.x + float(proj_vx[index]) * hit_time,
+            proj.y + float(proj_vy[index]) * hit_time,
+        )
+
+    return ThreatTable(hostile, hit_times, distances, earliest, float(distances.min()))
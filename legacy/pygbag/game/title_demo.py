@@ -0,0 +1,77 @@
+import pygame
+
+from game.constants import (
+    FPS,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    TITLE_DEMO_RESOLUTION_SCALE,
+    TITLE_DEMO_RESTART_SECONDS,
+    TITLE_DEMO_UPDATE_INTERVAL,
+)
+from game.states import AutoTestState
+
+
+class TitleDemo:
+    """タイトル画面の背景で流す自動対戦デモ (アトラクトモード)。
+
+    Game ごとに一度だけ生成して使い回すので、タイトルに戻るたびに
+    2つ目の Game (HUD・フォント・AI) を作り直すことはない。
+    シミュレーションは update_interval フレームに1回、描画は縮小バッファに行い、
+    新しいフレームができたときだけ画面サイズへ一度拡大する。
+    """
+
+    def __init__(self, game, update_interval=TITLE_DEMO_UPDATE_INTERVAL,
+                 resolution_scale=TITLE_DEMO_RESOLUTION_SCALE,
+                 restart_seconds=TITLE_DEMO_RESTART_SECONDS):
+        from game.game import Game
+
+        self.game = Game(game.screen, debug=False, enable_audio=False, enable_title_background=False)
+        self.update_interval = max(1, int(update_interval))
+        self.restart_frames = int(restart_seconds * FPS)
+
+        low_res_size = (
+            max(1, int(SCREEN_WIDTH * resolution_scale)),
+            max(1, int(SCREEN_HEIGHT * resolution_scale)),
+        )
+        self.low_res_surface = pygame.Surface(low_res_size)
+        self.overlay_surface = pygame.Surface(low_res_size, pygame.SRCALPHA)
+        self.overlay_surface.fill((0, 0, 0, 100))
+        self.frame_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        self.frame_count = 0
+        self.needs_render = True
+        self.restart()
+
+    def restart(self):
+        """デモを最初からやり直す (位置リセットと残り時間カウンタの初期化)"""
+        self.game.reset_players()
+        self.game.test_timer = 0
+        # 既に AutoTestState ならインスタンス再生成は省く
+        if not isinstance(self.game.current_state, AutoTestState):
+            self.game.change_state(self.game.get_state(AutoTestState))
+        self.frame_count = 0
+        self.needs_render = True
+
+    def update(self):
+        """メインループの1フレーム分進める (シミュレーションは間引く)"""
+        self.frame_count += 1
+        if self.frame_count >= self.restart_frames:
+            self.restart()
+            return
+        if self.frame_count % self.update_interval == 0:
+            self.game.update()
+            self.needs_render = True
+
+    def draw(self, screen):
+        """最新のデモ画面 (暗転済み) を screen に描画する"""
+        if self.needs_render:
+            self.game.draw_to_surface(self.low_res_surface)
+            self.low_res_surface.blit(self.overlay_surface, (0, 0))
+            if self.low_res_surface.get_size() == self.frame_surface.get_size():
+                self.frame_surface.blit(self.low_res_surface, (0, 0))
+            else:
+                pygame.transform.scale(
+                    self.low_res_surface, self.frame_surface.get_size(), self.frame_surface
+                )
+            self.needs_render = False
+        screen.blit(self.frame_surface, (0, 0))
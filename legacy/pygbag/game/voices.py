@@ -0,0 +1,121 @@
+import math
+
+import pygame
+
+# 同時に鳴らす効果音の上限。ミキサーにはこれより BGM_CHANNELS 多くチャンネルを用意する
+SFX_CHANNELS = 8
+BGM_CHANNELS = 1
+BGM_CHANNEL = 0  # BGM 専用に予約するチャンネル (予約は番号の小さいほうから)
+
+# 優先度。上限に達したら低いものから止める (同じなら古いものから)
+SFX_PRIORITY = {"hit": 3, "shield": 3, "hyper": 2, "special": 2, "menu": 1, "shot": 0}
+# 効果音ごとの同時発音数の上限。超えたら同じ効果音の古いものを止めて鳴らし直す
+SFX_POLYPHONY = {"shot": 3, "hit": 2, "shield": 1, "hyper": 1, "special": 2, "menu": 1}
+DEFAULT_POLYPHONY = 2
+
+# 1回分の音量。同じフレームに重なった分を足せるよう余裕を残す
+SFX_VOLUME = 0.7
+
+
+class Voice:
+    """鳴らしている効果音と、そのチャンネル"""
+
+    __slots__ = ("name", "priority", "started", "channel", "sound")
+
+    def __init__(self, name, priority, started, channel, sound):
+        self.name = name
+        self.priority = priority
+        self.started = started
+        self.channel = channel
+        self.sound = sound  # チャンネルで鳴らし始めた Sound
+
+    def playing(self):
+        """まだこの効果音が鳴っているか。
+        鳴り終わったチャンネルは別の音に使われるので、チャンネルが鳴っているだけでは足りない
+        """
+        return self.channel.get_busy() and self.channel.get_sound() is self.sound
+
+
+class VoiceManager:
+    """効果音の発音をフレーム単位でまとめ、同時発音数を制限する。
+
+    request() は鳴らしたい効果音を記録するだけで、flush() (毎フレーム1回) で実際に鳴らす。
+    - 同じフレームに同じ効果音が何度要求されても1音にまとめ、音量を重ねる (エネルギー和、上限 1.0)
+    - 効果音ごとの同時発音数を SFX_POLYPHONY で制限する
+    - 全体で max_voices を超えるときは、優先度の低い効果音から止めて鳴らす
+    ミキサーのチャンネルは max_voices + BGM_CHANNELS 本にし、BGM_CHANNEL は BGM 用に予約する。
+    Sound.play() は予約したチャンネルを使わないので、効果音が BGM のチャンネルを取ることはない。
+    弾幕でどれだけ要求が来ても、ミキサーが合成する効果音は max_voices を超えない。
+    """
+
+    def __init__(self, max_voices=SFX_CHANNELS, configure_mixer=True):
+        self.max_voices = max_voices
+        if configure_mixer and pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(max_voices + BGM_CHANNELS)
+            pygame.mixer.set_reserved(BGM_CHANNELS)
+        self.voices = []
+        self.pending = {}  # 効果音名 -> [Sound, 音量の二乗和]
+        self.frame = 0
+        self.stats = {"requested": 0, "played": 0, "coalesced": 0, "stolen": 0, "dropped": 0}
+
+    def request(self, name, sound, volume=SFX_VOLUME):
+        """このフレームで鳴らす効果音を登録する"""
+        self.stats["requested"] += 1
+        entry = self.pending.get(name)
+        if entry is None:
+            self.pending[name] = [sound, volume * volume]
+        else:
+            entry[1] += volume * volume
+            self.stats["coalesced"] += 1
+
+    def play(self, name, sound, volume=SFX_VOLUME):
+        """まとめずにすぐ鳴らす (メニューの操作音など、入力にすぐ応えたいもの)。上限は同じく守る"""
+        self.stats["requested"] += 1
+        self._prune()
+        self._start(name, sound, volume)
+
+    def flush(self):
+        """このフレームに要求された効果音を優先度の高い順に鳴らす"""
+        if self.pending:
+            self._prune()
+            requests = sorted(self.pending.items(), key=lambda item: -SFX_PRIORITY.get(item[0], 0))
+            for name, (sound, energy) in requests:
+                self._start(name, sound, min(1.0, math.sqrt(energy)))
+            self.pending.clear()
+        self.frame += 1
+
+    def active(self, name=None):
+        """いま鳴っている効果音の数 (name を渡すとその効果音だけ)"""
+        return sum(1 for voice in self.voices if voice.playing() and (name is None or voice.name == name))
+
+    def _prune(self):
+        # 鳴り終わったものに加え、チャンネルが別の音に使われたものも外す (止めると別の音が止まる)
+        self.voices = [voice for voice in self.voices if voice.playing()]
+
+    def _start(self, name, sound, volume):
+        priority = SFX_PRIORITY.get(name, 0)
+        same = [voice for voice in self.voices if voice.name == name]
+        if len(same) >= SFX_POLYPHONY.get(name, DEFAULT_POLYPHONY):
+            # 同時発音数の上限: 同じ効果音の一番古いものを止めて鳴らし直す
+            victim = min(same, key=lambda voice: voice.started)
+        elif len(self.voices) >= self.max_voices:
+            candidates = [voice for voice in self.voices if voice.priority <= priority]
+            if not candidates:
+                self.stats["dropped"] += 1
+                return
+            victim = min(candidates, key=lambda voice: (voice.priority, voice.started))
+        else:
+            victim = None
+
+        if victim is not None:
+            victim.channel.stop()
+            self.voices.remove(victim)
+            self.stats["stolen"] += 1
+        channel = sound.play()
+        if channel is None:
+            # 読み込み前 (LazySound) か、空きチャンネルがない
+            self.stats["dropped"] += 1
+            return
+        channel.set_volume(volume)
+        self.voices.append(Voice(name, priority, self.frame, channel, channel.get_sound()))
+        self.stats["played"] += 1
@@ -9,6 +9,8 @@ import traceback
 import pygame
 
 from game.constants import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
+from game.dirty_rects import present
+from game.fonts import preload_fonts
 from game.game import Game
 from game.i18n import set_language, tr
 
@@ -18,6 +20,7 @@ async def main():
     parser = argparse.ArgumentParser(description="Acceleration of Tofu")
     parser.add_argument("-d", "--debug", action="store_true", help="デバッグモードを有効化 / Enable debug mode")
     parser.add_argument("--lang", default=None, help="Language code (ja, en, ...). Overrides auto-detect.")
+    parser.add_argument("--ai", choices=["normal", "hard"], default=None, help="対戦相手 AI の難易度 / Opponent AI difficulty")
     # Tolerate unknown args (e.g. pygbag may inject flags).
     args, _unknown = parser.parse_known_args()
 
@@ -32,11 +35,15 @@ async def main():
     pygame.display.set_caption(tr("title"))
 
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # TTF のパースは起動時に一度だけ済ませ、以降の状態遷移ではフォントファイルに触れない。
+    preload_fonts()
     clock = pygame.time.Clock()
 
     # Game.__init__ が既に TitleState を current_state に設定しているので、
     # ここで追加の change_state は呼ばない (スプラッシュは廃止)。
     game = Game(screen, debug=args.debug)
+    if args.ai:
+        game.ai_difficulty = args.ai
 
     running = True
     while running:
@@ -56,7 +63,8 @@ async def main():
             screen.fill((0, 0, 0))
             game.draw()
 
-            pygame.display.flip()
+            # 変化した領域だけをディスプレイへ転送 (全画面が必要なときは flip)
+            present(game.dirty_rects)
             clock.tick(FPS)
 
             # Yield to browser event loop (required by pygbag, no-op on desktop).
@@ -65,6 +73,7 @@ async def main():
             traceback.print_exc()
             running = False
 
+    game.shutdown()
     pygame.quit()
     # sys.exit would abort pygbag's Python runtime; just return instead.
     if sys.platform != "emscripten":
@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+"""
+効果音・BGM アセットのビルド
+使用方法 (legacy/pygbag から): python synth/build_sounds.py [-j 4] [--force] [--dry-run] [--no-ogg] [--no-bundle]
+                                [--bundle-sounds menu,shot,...]
+
+assets/sounds の WAV を生成スクリプトから作り、すべての WAV を OGG に変換する。
+どの WAV をどのスクリプトの関数・引数で作るかは targets() にまとめてある。
+生成スクリプトのソースと引数のハッシュ (OGG は元の WAV のハッシュ) を
+assets/sounds/.build_manifest.json に記録し、変わっていないものは作り直さない。
+マニフェストはアセットと一緒にコミットし、チェックアウト直後のビルドでは何も作り直さないようにする。
+生成と OGG 変換はプロセスプールで並列に行い、WAV ができたものから順に変換を始める。
+最後に、ゲームが使う音の WAV (既定は game.sound_bundle.BUNDLED_SOUNDS) をミキサーにそのまま渡せる
+PCM にして1つのバンドル (sounds.bundle) にまとめる。
+バンドルはデスクトップで起動時のデコードを省くためのビルド生成物で、git には入れない。
+PCM は OGG の10倍以上の大きさになる (タイトル BGM だけで 2.3 MB) ので、web (pygbag) 版を
+パッケージするときは作らない (--no-bundle) か消しておく。なければゲームは OGG をデコードする。
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import random
+import sys
+import time
+import wave
+import zlib
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import numpy as np
+
+SYNTH_DIR = Path(__file__).resolve().parent
+ASSET_DIR = SYNTH_DIR.parent / "assets" / "sounds"
+MANIFEST_NAME = ".build_manifest.json"
+# バンドルの元になった WAV のハッシュ。バンドルと同じくコミットしないので、マニフェストとは分けて置く
+BUNDLE_DIGEST_NAME = ".bundle_digest"
+SAMPLE_RATE = 44100
+
+# 出力の形式を変えたら上げる (すべて作り直しになる)
+BUILD_VERSION = 1
+OGG_ENCODER = "soundfile-vorbis"
+
+# バンドルの PCM の形式。ゲームが pygame.mixer.init() の既定で開くミキサーに合わせる
+BUNDLE_CHANNELS = 2
+
+for path in (SYNTH_DIR, SYNTH_DIR.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# output: assets/sounds 内のファイル名, module: synth 内のスクリプト, function: 波形 (int16) を返す関数
+Target = namedtuple("Target", "output module function kwargs")
+
+
+def targets():
+    """生成する WAV と、その生成関数の一覧"""
+    import generate_sounds
+    import save_sound_assets
+
+    result = [
+        Target(filename, "generate_sounds", "render_sound", {"effect_type": effect})
+        for effect, filename in generate_sounds.EFFECTS.items()
+    ]
+    result += [
+        Target(filename, "save_sound_assets", generate.__name__, kwargs)
+        for filename, (generate, kwargs) in save_sound_assets.ASSETS.items()
+    ]
+    result.append(Target("rockman_title.wav", "rockman_title", "generate_rockman_title", {}))
+    return result
+
+
+def target_digest(target):
+    """生成スクリプトのソースと引数のハッシュ"""
+    digest = hashlib.sha256()
+    digest.update(f"{BUILD_VERSION}\n{target.module}.{target.function}\n".encode())
+    digest.update(json.dumps(target.kwargs, sort_keys=True).encode())
+    # チェックアウトした環境で改行が CRLF / LF に変わっても、作り直しにはしない
+    digest.update((SYNTH_DIR / f"{target.module}.py").read_bytes().replace(b"\r\n", b"\n"))
+    return digest.hexdigest()
+
+
+def file_digest(path, salt=""):
+    digest = hashlib.sha256(salt.encode())
+    digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def load_manifest(asset_dir):
+    try:
+        with open(Path(asset_dir) / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"wav": {}, "ogg": {}}
+    manifest.setdefault("wav", {})
+    manifest.setdefault("ogg", {})
+    return manifest
+
+
+def save_manifest(asset_dir, manifest):
+    path = Path(asset_dir) / MANIFEST_NAME
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def write_wav(path, samples, sample_rate=SAMPLE_RATE):
+    """int16 の波形 (モノラル / ステレオ) を WAV に書く。書き終えるまで元のファイルは残す"""
+    samples = np.ascontiguousarray(samples, dtype=np.int16)
+    tmp = Path(str(path) + ".tmp")
+    with wave.open(str(tmp), "wb") as wav_file:
+        wav_file.setnchannels(1 if samples.ndim == 1 else samples.shape[1])
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    os.replace(tmp, path)
+
+
+def render_target(target, asset_dir):
+    """ワーカープロセスで1つの WAV を生成する"""
+    # ノイズを使う効果音も毎回同じ波形になるよう、ファイル名から乱数の種を決める
+    seed = zlib.crc32(target.output.encode())
+    random.seed(seed)
+    np.random.seed(seed)
+    module = importlib.import_module(target.module)
+    samples = np.asarray(getattr(module, target.function)(**target.kwargs))
+    write_wav(Path(asset_dir) / target.output, samples)
+    return target.output
+
+
+def encode_ogg(wav_path, ogg_path):
+    """ワーカープロセスで WAV を OGG Vorbis に変換する"""
+    import soundfile
+
+    with wave.open(str(wav_path), "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    tmp = Path(str(ogg_path) + ".tmp")
+    soundfile.write(str(tmp), samples, sample_rate, format="OGG", subtype="VORBIS")
+    os.replace(tmp, ogg_path)
+    return Path(ogg_path).name
+
+
+def read_wav(path):
+    """WAV を (int16 の PCM (フレーム数 x チャンネル数), サンプリング周波数) で読む"""
+    with wave.open(str(path), "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+    return samples.reshape(-1, channels), sample_rate
+
+
+def bundle_digest(asset_dir, wav_names):
+    digest = hashlib.sha256(f"{BUILD_VERSION}\n{BUNDLE_CHANNELS}\n".encode())
+    for name in wav_names:
+        digest.update(f"{name}\n{file_digest(Path(asset_dir) / name)}\n".encode())
+    return digest.hexdigest()
+
+
+def write_sound_bundle(asset_dir, wav_names):
+    """WAV をまとめてバンドルに書く。名前は拡張子を除いたファイル名"""
+    from game.sound_bundle import BUNDLE_NAME, write_bundle
+
+    sounds = {}
+    for name in wav_names:
+        samples, sample_rate = read_wav(Path(asset_dir) / name)
+        if samples.shape[1] == 1:
+            # モノラルは左右に同じ音を置く (ロード時に変換しなくて済むように)
+            samples = np.repeat(samples, BUNDLE_CHANNELS, axis=1)
+        sounds[Path(name).stem] = (samples, sample_rate)
+    write_bundle(Path(asset_dir) / BUNDLE_NAME, sounds)
+
+
+def ogg_encoder_available():
+    try:
+        import soundfile  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build(asset_dir=ASSET_DIR, jobs=None, force=False, dry_run=False, ogg=True, bundle=True, build_targets=None,
+          bundle_sounds=None):
+    """古くなったアセットだけを作り直す。作ったもの・飛ばしたものを種類ごとに返す
+
+    bundle_sounds はバンドルに入れる音の名前 (拡張子なし)。None ならゲームが使う音 (BUNDLED_SOUNDS)
+    """
+    from game.sound_bundle import BUNDLE_NAME, BUNDLED_SOUNDS
+
+    asset_dir = Path(asset_dir)
+    bundle_sounds = set(BUNDLED_SOUNDS if bundle_sounds is None else bundle_sounds)
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(asset_dir)
+    build_targets = targets() if build_targets is None else build_targets
+    report = {"rendered": [], "encoded": [], "up_to_date": [], "ogg_pending": [], "bundled": [], "failed": []}
+
+    stale = []
+    for target in build_targets:
+        digest = target_digest(target)
+        if force or manifest["wav"].get(target.output) != digest or not (asset_dir / target.output).exists():
+            stale.append((target, digest))
+        else:
+            report["up_to_date"].append(target.output)
+    rendering = {target.output for target, _ in stale}
+    if ogg and not ogg_encoder_available():
+        print("OGG への変換には soundfile が必要です。'pip install soundfile' を実行してください。")
+        ogg = False
+
+    def ogg_job(wav_name):
+        """OGG が古ければ (ogg のファイル名, 元 WAV のハッシュ) を返す"""
+        ogg_name = Path(wav_name).with_suffix(".ogg").name
+        digest = file_digest(asset_dir / wav_name, OGG_ENCODER)
+        if not force and manifest["ogg"].get(ogg_name) == digest and (asset_dir / ogg_name).exists():
+            return None
+        return ogg_name, digest
+
+    def bundled(wav_names):
+        return sorted(name for name in wav_names if Path(name).stem in bundle_sounds)
+
+    def bundle_stale():
+        wav_names = bundled(path.name for path in asset_dir.glob("*.wav"))
+        digest = bundle_digest(asset_dir, wav_names)
+        digest_path = asset_dir / BUNDLE_DIGEST_NAME
+        if (not force and digest_path.exists() and digest_path.read_text(encoding="utf-8") == digest
+                and (asset_dir / BUNDLE_NAME).exists()):
+            return None
+        return wav_names, digest
+
+    # 手作業で置いた WAV も含め、作り直さない WAV の OGG を確認する
+    existing = sorted(path.name for path in asset_dir.glob("*.wav") if path.name not in rendering)
+    if dry_run:
+        report["rendered"] = sorted(rendering)
+        report["ogg_pending"] = [job[0] for job in map(ogg_job, existing) if job is not None]
+        if bundle and (bundled(rendering) or bundle_stale()):
+            report["bundled"] = bundled(set(existing) | rendering)
+        return report
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = {}
+
+        def submit_ogg(wav_name):
+            job = ogg_job(wav_name)
+            if job is None:
+                return
+            if not ogg:
+                report["ogg_pending"].append(job[0])
+                return
+            future = pool.submit(encode_ogg, asset_dir / wav_name, asset_dir / job[0])
+            pending[future] = ("ogg", job[0], job[1])
+
+        for target, digest in stale:
+            pending[pool.submit(render_target, target, asset_dir)] = ("wav", target.output, digest)
+        for wav_name in existing:
+            submit_ogg(wav_name)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, name, digest = pending.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"失敗: {name} ({e})")
+                    report["failed"].append(name)
+                    continue
+                if kind == "wav":
+                    manifest["wav"][name] = digest
+                    report["rendered"].append(name)
+                    submit_ogg(name)
+                else:
+                    manifest["ogg"][name] = digest
+                    report["encoded"].append(name)
+                # 途中で止まっても、終わった分は次回飛ばせるように毎回書き出す
+                save_manifest(asset_dir, manifest)
+
+    # 作り直しに失敗した WAV があるときは、古い音を混ぜないようにバンドルを作らない
+    if bundle and not report["failed"]:
+        stale_bundle = bundle_stale()
+        if stale_bundle is not None:
+            wav_names, digest = stale_bundle
+            write_sound_bundle(asset_dir, wav_names)
+            (asset_dir / BUNDLE_DIGEST_NAME).write_text(digest, encoding="utf-8")
+            report["bundled"] = wav_names
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="効果音・BGM アセットのビルド (変更があったものだけ並列に作り直す)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="ワーカープロセス数 (既定は CPU 数)")
+    parser.add_argument("--force", action="store_true", help="変更がなくてもすべて作り直す")
+    parser.add_argument("--dry-run", action="store_true", help="作り直す予定のものを表示するだけ")
+    parser.add_argument("--no-ogg", action="store_true", help="OGG への変換を行わない")
+    parser.add_argument("--no-bundle", action="store_true", help="バンドル (sounds.bundle) を作らない")
+    parser.add_argument("--bundle-sounds", default=None,
+                        help="バンドルに入れる音 (拡張子なしのファイル名をカンマ区切り。既定はゲームが使う音)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    bundle_sounds = args.bundle_sounds.split(",") if args.bundle_sounds else None
+    report = build(jobs=args.jobs, force=args.force, dry_run=args.dry_run, ogg=not args.no_ogg,
+                   bundle=not args.no_bundle, bundle_sounds=bundle_sounds)
+    elapsed = time.perf_counter() - start
+
+    label = "作り直す予定" if args.dry_run else "生成"
+    print(f"{label} WAV: {len(report['rendered'])} {' '.join(sorted(report['rendered']))}")
+    if not args.dry_run:
+        print(f"変換 OGG: {len(report['encoded'])} {' '.join(sorted(report['encoded']))}")
+    if report["ogg_pending"]:
+        print(f"未変換 OGG: {len(report['ogg_pending'])} {' '.join(sorted(report['ogg_pending']))}")
+    if report["bundled"]:
+        print(f"バンドル: {len(report['bundled'])} 音")
+    print(f"変更なし: {len(report['up_to_date'])}")
+    if report["failed"]:
+        print(f"失敗: {' '.join(report['failed'])}")
+    print(f"所要時間: {elapsed:.2f}秒")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
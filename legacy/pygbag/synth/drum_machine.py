@@ -1,17 +1,20 @@
 import pygame
 import numpy as np
 import time
-from scipy.signal import butter, filtfilt
+import filters
 import urllib.request
 import threading
 from pathlib import Path
 import json
 from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT  # 定数をインポート
-import wave
+import itertools
+from pattern_export import export_arrangement
+from sequencer import Sequencer
 
 # Pygameの初期化
 pygame.init()
 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+pygame.mixer.set_reserved(2)  # パターン再生用と BGM 用 (Sound.play() の空きチャンネル探しに使わせない)
 
 # 画面サイズ
 WIDTH, HEIGHT = SCREEN_WIDTH, SCREEN_HEIGHT  # constants.pyの値を使用
@@ -163,8 +166,7 @@ def create_drum_sound(sound_type, volume=0.7, quality="high"):
         noise = np.random.uniform(-1, 1, len(t))
         
         # バンドパスフィルター（スネアらしい周波数帯域を強調）
-        b1, a1 = butter(2, [900/sample_rate*2, 2000/sample_rate*2], btype='band')
-        filtered_noise = filtfilt(b1, a1, noise)
+        filtered_noise = filters.apply(noise, "band", 2, (900, 2000), sample_rate)
         
         # 非線形歪み
         membrane_nl = np.tanh(2 * membrane)
@@ -196,8 +198,7 @@ def create_drum_sound(sound_type, volume=0.7, quality="high"):
         
         # 高周波ノイズ
         noise = np.random.uniform(-1, 1, len(t))
-        b, a = butter(6, 7000/sample_rate*2, btype='high')
-        filtered_noise = filtfilt(b, a, noise)
+        filtered_noise = filters.apply(noise, "high", 6, 7000, sample_rate)
         
         # 合成
         wave = 0.6 * cymbal_nl + 0.4 * filtered_noise
@@ -239,16 +240,13 @@ def create_drum_sound(sound_type, volume=0.7, quality="high"):
         noise = np.random.uniform(-1, 1, len(t))
         
         # 低周波フィルタリング（より穏やかな轟音）
-        b, a = butter(4, 150/sample_rate*2, btype='low')
-        low_noise = filtfilt(b, a, noise)
+        low_noise = filters.apply(noise, "low", 4, 150, sample_rate)
         
         # 中周波フィルタリング（より柔らかい破裂音）
-        b2, a2 = butter(4, [150/sample_rate*2, 1000/sample_rate*2], btype='band')
-        mid_noise = filtfilt(b2, a2, noise)
+        mid_noise = filters.apply(noise, "band", 4, (150, 1000), sample_rate)
         
         # 高周波成分を抑える
-        b3, a3 = butter(4, 2000/sample_rate*2, btype='high')
-        high_noise = filtfilt(b3, a3, noise)
+        high_noise = filters.apply(noise, "high", 4, 2000, sample_rate)
         
         # 各成分のエンベロープ（よりゆっくりと）
         env_low = np.exp(-3 * t)
@@ -285,9 +283,7 @@ def create_drum_sound(sound_type, volume=0.7, quality="high"):
     # 4. 高品質なリサンプリング
     if quality == "high":
         # アンチエイリアシングフィルタ
-        nyq = sample_rate / 2
-        b, a = butter(3, 18000/nyq, btype='low')  # より自然なロールオフ
-        wave = filtfilt(b, a, wave)
+        wave = filters.apply(wave, "low", 3, 18000, sample_rate)  # より自然なロールオフ
     
     # ステレオ化（より自然な定位）
     stereo = np.zeros((len(wave), 2), dtype=np.float32)
@@ -573,66 +569,21 @@ class BeatGrid:
             return True
         return False
 
-def play_bgm(drum_sounds, drum_types):
-    """BGMとしてパターンを再生（グローバル変数を使用）"""
-    global bgm_pattern, bgm_tempo, bgm_is_playing
-    
-    if not bgm_is_playing or not bgm_pattern:
-        return
-    
-    current_time = time.time()
-    60 / bgm_tempo / 4  # 16分音符の間隔
-    
-    # 現在のビート位置を計算
-    current_beat = int((current_time * bgm_tempo / 60 * 4) % 16)
-    
-    # アクティブなセルの音を再生
-    for row in range(len(bgm_pattern)):
-        if row < len(drum_types) and bgm_pattern[row][current_beat]:
-            sound_type = drum_types[row]
-            if sound_type in drum_sounds and drum_sounds[sound_type]:
-                drum_sounds[sound_type].play()
+def drum_voices(drum_sounds, drum_types):
+    """行番号 -> 波形。PyGameのSoundオブジェクトから波形データを取得"""
+    voices = {}
+    for row, sound_type in enumerate(drum_types):
+        if drum_sounds.get(sound_type):
+            voices[row] = pygame.sndarray.samples(drum_sounds[sound_type])
+    return voices
 
-def export_pattern_to_wav(grid, tempo, drum_sounds, drum_types, filename="bgm/current_pattern.wav"):
-    """パターンをWAVファイルとして書き出す"""
-    sample_rate = 44100
-    beat_duration = 60.0 / tempo / 4.0  # 16分音符の長さ（秒）
-    pattern_duration = beat_duration * 16  # 全パターンの長さ（秒）
-    total_samples = int(pattern_duration * sample_rate)
-    
-    # 出力バッファ（ステレオ）
-    output_buffer = np.zeros((total_samples, 2), dtype=np.float32)
-    
-    # 各ビートの音を合成
-    for col in range(16):  # 16ビート
-        start_sample = int(col * beat_duration * sample_rate)
-        for row in range(len(grid)):
-            if grid[row][col] and row < len(drum_types):
-                sound_type = drum_types[row]
-                if sound_type in drum_sounds and drum_sounds[sound_type]:
-                    # PyGameのSoundオブジェクトから波形データを取得
-                    sound_array = pygame.sndarray.samples(drum_sounds[sound_type])
-                    sound_length = min(len(sound_array), total_samples - start_sample)
-                    output_buffer[start_sample:start_sample + sound_length] += sound_array[:sound_length]
-    
-    # クリッピング防止のためにノーマライズ
-    max_val = np.max(np.abs(output_buffer))
-    if max_val > 0:
-        output_buffer = output_buffer / max_val * 0.9
-    
-    # WAVファイルとして保存
-    bgm_dir = Path("bgm")
-    bgm_dir.mkdir(exist_ok=True)
-    
-    with wave.open(str(bgm_dir / "current_pattern.wav"), 'w') as wav_file:
-        wav_file.setnchannels(2)  # ステレオ
-        wav_file.setsampwidth(2)  # 16bit
-        wav_file.setframerate(sample_rate)
-        
-        # float32からint16に変換
-        wav_data = (output_buffer * 32767).astype(np.int16)
-        wav_file.writeframes(wav_data.tobytes())
-    
+def export_pattern_to_wav(grid, tempo, drum_sounds, drum_types, filename="bgm/current_pattern.wav", bars=1):
+    """パターンを bars 小節くり返して filename に書き出す (拡張子 .ogg なら OGG)
+
+    ブロック単位でミックス・リミッタ処理・書き込みを行うので、小節数によらずメモリ使用量は一定。
+    """
+    voices = drum_voices(drum_sounds, drum_types[:len(grid)])
+    export_arrangement(itertools.repeat(grid, bars), tempo, voices, filename)
     return True
 
 def create_piano_sound(base_freq, volume=0.7, quality="high"):
@@ -670,8 +621,8 @@ def create_piano_sound(base_freq, volume=0.7, quality="high"):
     wave[:attack_samples] += attack_noise * attack_env * 0.3
     
     # 弦の共鳴効果（より自然な共鳴）
-    b, a = butter(2, [0.1, 0.9], btype='band')
-    resonance = filtfilt(b, a, wave)
+    nyq = sample_rate / 2
+    resonance = filters.apply(wave, "band", 2, (0.1 * nyq, 0.9 * nyq), sample_rate)
     wave = wave + resonance * 0.2
     
     # DCオフセット除去
@@ -720,15 +671,14 @@ def main():
         grid.load_pattern(bgm_pattern)
         bgm_is_playing = True
         tempo = bgm_tempo
-        beat_interval = 60 / tempo / 4
     else:
         tempo = 120  # デフォルトBPM
-        beat_interval = 60 / tempo / 4  # 16分音符の間隔 (秒)
     
-    # 再生関連のパラメータ
-    is_playing = False
-    current_beat = 0
-    last_beat_time = 0
+    # パターン再生とBGMは、1小節ずつ先にミックスして専用チャンネルで鳴らす
+    voices = drum_voices(drum_sounds, drum_types)
+    voices_source = drum_sounds
+    preview = Sequencer(pygame.mixer.Channel(0), voices, tempo)
+    bgm = Sequencer(pygame.mixer.Channel(1), voices, bgm_tempo)
     
     # ボタン
     play_button = Button(100, 380, 120, 40, "再生", GREEN)
@@ -789,15 +739,13 @@ def main():
                         drum_sounds[sound_type].play()
             
             # ボタンのイベント処理
-            if play_button.handle_event(event) and not is_playing:
-                is_playing = True
-                current_beat = 0
-                last_beat_time = current_time
+            if play_button.handle_event(event) and not preview.playing:
+                preview.start()
                 message = "再生開始"
                 message_time = current_time
             
-            if stop_button.handle_event(event) and is_playing:
-                is_playing = False
+            if stop_button.handle_event(event) and preview.playing:
+                preview.stop()
                 message = "停止"
                 message_time = current_time
             
@@ -856,8 +804,6 @@ def main():
                     # テンポ値の計算
                     normalized_pos = (tempo_handle_x - tempo_slider_x) / tempo_slider_width
                     tempo = int(tempo_min + normalized_pos * (tempo_max - tempo_min))
-                    # ビート間隔の再計算
-                    beat_interval = 60 / tempo / 4
                     # グローバルテンポを更新
                     bgm_tempo = tempo
             
@@ -871,8 +817,6 @@ def main():
                 # テンポ値の計算
                 normalized_pos = (tempo_handle_x - tempo_slider_x) / tempo_slider_width
                 tempo = int(tempo_min + normalized_pos * (tempo_max - tempo_min))
-                # ビート間隔の再計算
-                beat_interval = 60 / tempo / 4
                 # グローバルテンポを更新
                 bgm_tempo = tempo
             
@@ -899,23 +843,26 @@ def main():
                     message = "先にパターンを保存してください"
                     message_time = current_time
         
-        # 再生中の場合、現在のビートを更新
-        if is_playing and current_time - last_beat_time >= beat_interval:
-            # 現在のビートのアクティブなセルの音を再生
-            active_cells = grid.get_active_cells(current_beat)
-            for row in active_cells:
-                if row < len(drum_types):
-                    sound_type = drum_types[row]
-                    if sound_type in drum_sounds and drum_sounds[sound_type]:
-                        drum_sounds[sound_type].play()
-            
-            # 次のビートに進む
-            current_beat = (current_beat + 1) % grid.cols
-            last_beat_time = current_time
+        # 音色を切り替えたら次の小節から反映
+        if drum_sounds is not voices_source:
+            voices = drum_voices(drum_sounds, drum_types)
+            voices_source = drum_sounds
+            preview.set_voices(voices)
+            bgm.set_voices(voices)
+        
+        # パターン・テンポの変更は次の小節の頭から反映される
+        preview.set_pattern(grid.grid)
+        preview.set_tempo(tempo)
+        preview.update()
         
         # BGM再生の処理
+        bgm.set_pattern(bgm_pattern)
+        bgm.set_tempo(bgm_tempo)
         if bgm_is_playing and bgm_pattern:
-            play_bgm(drum_sounds, drum_types)
+            bgm.start()
+        elif bgm.playing:
+            bgm.stop()
+        bgm.update()
         
         # ダウンロード状態を更新
         if download_status["in_progress"] or (download_status["completed"] and current_time - message_time < 2.0):
@@ -943,8 +890,7 @@ def main():
             screen.blit(label_text, (50, 100 + i * grid.cell_height + grid.cell_height // 2 - 10))
         
         # ビートグリッド描画
-        current_beat_pos = current_beat if is_playing else None
-        grid.draw(screen, current_beat_pos)
+        grid.draw(screen, preview.current_step())
         
         # ボタン描画
         play_button.draw(screen)
@@ -987,6 +933,14 @@ def main():
             bgm_text = font.render(bgm_status, True, GREEN if bgm_is_playing else WHITE)
             screen.blit(bgm_text, (520, 500))
         
+        # 先読みの補充遅れ (予約した小節が鳴り始めてから次の小節を予約するまで) と途切れた回数
+        if preview.playing:
+            stats = preview.stats
+            latency_text = small_font.render(
+                f"補充遅れ {stats['refill_delay'] * 1000:.0f}ms (最大 {stats['max_refill_delay'] * 1000:.0f}ms) 途切れ {stats['underruns']}回",
+                True, LIGHT_GRAY)
+            screen.blit(latency_text, (720, 480))
+        
         # メッセージ表示
         if current_time - message_time < 2.0 and message:
             message_text = font.render(message, True, GREEN)
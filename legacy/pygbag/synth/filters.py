@@ -0,0 +1,189 @@
+"""バターワースフィルタ (二次セクション) の設計と、状態を持ち越すストリーミング処理
+
+音を作るたびに butter() で係数を設計し直し、filtfilt() で全体を往復2回なめていたのを、
+- 設計は (種類, 次数, カットオフ, サンプルレート) ごとにキャッシュした二次セクション (SOS) にする
+- フィルタは片方向1回だけかけ、状態 (zi) を返すのでブロックごとに続けて処理できる
+SciPy があれば scipy.signal を使い、ない環境 (pygbag など) では NumPy だけで同じ結果を出す。
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from scipy import signal as _signal
+except ImportError:
+    _signal = None
+
+SAMPLE_RATE = 44100
+BLOCK = 128  # NumPy 版で1回の行列演算にまとめるサンプル数
+
+
+def design(btype, order, cutoff, sample_rate=SAMPLE_RATE):
+    """バターワースフィルタの SOS 係数 (セクション数 x 6)。同じ設計は使い回すので書き換えないこと
+
+    btype: "low" / "high" / "band"、cutoff: Hz (band は (低い側, 高い側))
+    """
+    if np.ndim(cutoff):
+        cutoff = tuple(float(c) for c in cutoff)
+    else:
+        cutoff = float(cutoff)
+    return _design(btype, int(order), cutoff, float(sample_rate))
+
+
+@lru_cache(maxsize=256)
+def _design(btype, order, cutoff, sample_rate):
+    nyquist = sample_rate / 2
+    wn = np.asarray(cutoff) / nyquist
+    if np.any(wn <= 0) or np.any(wn >= 1):
+        raise ValueError(f"カットオフは 0〜{nyquist:g}Hz の間で指定してください: {cutoff}")
+    if _signal is not None:
+        sos = _signal.butter(order, wn, btype=btype, output="sos")
+    else:
+        sos = _butter_sos(order, wn, btype)
+    return np.ascontiguousarray(sos, dtype=np.float64)
+
+
+def _butter_sos(order, wn, btype):
+    """NumPy だけで butter(..., output="sos") と同じ特性の係数を作る (双一次変換)"""
+    fs = 2.0  # 正規化周波数 (ナイキスト = 1) での双一次変換
+    warped = 2 * fs * np.tan(np.pi * np.atleast_1d(wn) / fs)
+    k = np.arange(order)
+    poles = np.exp(1j * np.pi * (2 * k + order + 1) / (2 * order))  # アナログ原型の極
+
+    if btype == "low":
+        poles = poles * warped[0]
+        zeros = np.full(order, -1.0)  # 双一次変換で無限遠の零点は -1 に移る
+    elif btype == "high":
+        poles = warped[0] / poles
+        zeros = np.full(order, 1.0)
+    elif btype == "band":
+        bandwidth = warped[1] - warped[0]
+        center = np.sqrt(warped[0] * warped[1])
+        half = poles * bandwidth / 2
+        offset = np.sqrt(half ** 2 - center ** 2 + 0j)
+        poles = np.concatenate([half + offset, half - offset])
+        # 原点の零点は 1 に、無限遠の零点は -1 に移る。セクションごとに 1 と -1 を1つずつ
+        zeros = np.tile([1.0, -1.0], order)
+    else:
+        raise ValueError(f"未対応のフィルタの種類です: {btype}")
+    poles = (2 * fs + poles) / (2 * fs - poles)
+
+    # 共役の極をまとめて二次セクションにし、実数の極は2つずつ (余れば1つで) まとめる
+    upper = sorted((p for p in poles if p.imag > 1e-12), key=abs)
+    real = sorted((p.real for p in poles if abs(p.imag) <= 1e-12), key=abs)
+    groups = [[p, np.conj(p)] for p in upper]
+    groups += [real[i:i + 2] for i in range(0, len(real), 2)]
+    sections = []
+    for i, group in enumerate(groups):
+        a = np.real(np.poly(group))
+        b = np.real(np.poly(zeros[2 * i:2 * i + len(group)]))
+        sections.append(np.concatenate([np.pad(b, (0, 3 - len(b))), np.pad(a, (0, 3 - len(a)))]))
+    sos = np.array(sections)
+
+    # 通過域の中心でゲイン 1 になるように最初のセクションで合わせる
+    if btype == "low":
+        point = 1.0
+    elif btype == "high":
+        point = -1.0
+    else:
+        point = np.exp(1j * 2 * np.arctan(np.sqrt(np.prod(warped)) / (2 * fs)))
+    gain = np.prod([np.polyval(s[:3], point) / np.polyval(s[3:], point) for s in sos])
+    sos[0, :3] /= abs(gain)
+    return sos
+
+
+def sosfilt(sos, x, zi=None):
+    """SOS を片方向に1回かける。(出力, 最後の状態) を返す。
+
+    zi は前のブロックが返した状態 (セクション数 x 2)。None ならゼロから始める。
+    状態の形は scipy.signal.sosfilt と同じなので、どちらの実装でも続けて使える。
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if zi is None:
+        zi = np.zeros((len(sos), 2))
+    if _signal is not None:
+        return _signal.sosfilt(sos, x, zi=zi)
+    y = x
+    zf = np.empty((len(sos), 2))
+    for i in range(len(sos)):
+        y, zf[i] = _section(sos, i).filter(y, zi[i])
+    return y, zf
+
+
+def apply(x, btype, order, cutoff, sample_rate=SAMPLE_RATE):
+    """1回かけるだけのとき用 (状態は捨てる)"""
+    y, _ = sosfilt(design(btype, order, cutoff, sample_rate), x)
+    return y
+
+
+class StreamingFilter:
+    """ブロックごとに処理しても、全体を一度に処理したのと同じ結果になるフィルタ"""
+
+    def __init__(self, sos):
+        self.sos = sos
+        self.reset()
+
+    def reset(self):
+        self.zi = np.zeros((len(self.sos), 2))
+
+    def process(self, block):
+        y, self.zi = sosfilt(self.sos, block, self.zi)
+        return y
+
+
+@lru_cache(maxsize=64)
+def _block_section(coefficients):
+    return _BlockSection(np.array(coefficients))
+
+
+def _section(sos, i):
+    return _block_section(tuple(sos[i]))
+
+
+class _BlockSection:
+    """NumPy 版の二次セクション (転置直接形 II)
+
+    状態 s と入力 x について s' = A s + B x, y = C s + D x。BLOCK サンプル分の応答を行列にしておき、
+    各ブロックのゼロ状態応答をまとめて1回の行列積で出す。Python のループはブロックの境目で
+    状態 (2次元) を受け渡す分だけなので、サンプルごとにループするよりずっと速い。
+    """
+
+    def __init__(self, section):
+        b0, b1, b2, a0, a1, a2 = section / section[3]
+        self.a = np.array([[-a1, 1.0], [-a2, 0.0]])
+        b = np.array([b1 - a1 * b0, b2 - a2 * b0])
+
+        powers = np.empty((BLOCK + 1, 2, 2))  # A^0 .. A^BLOCK
+        powers[0] = np.eye(2)
+        for k in range(BLOCK):
+            powers[k + 1] = self.a @ powers[k]
+        self.powers = powers
+        impulse = np.concatenate([[b0], powers[:BLOCK - 1, 0] @ b])  # y の応答 h[0..BLOCK-1]
+        lag = np.arange(BLOCK)[:, None] - np.arange(BLOCK)[None, :]
+        self.response = np.where(lag >= 0, impulse[np.clip(lag, 0, None)], 0.0)  # T[k, j] = h[k - j]
+        self.observe = powers[:BLOCK, 0]  # 初期状態が出力に現れる分 (C A^k)
+        self.drive = (powers[BLOCK - 1::-1] @ b).T  # 入力が最後の状態に残る分 (A^(L-1-j) B)
+
+    def filter(self, x, state):
+        n = len(x)
+        full = n // BLOCK
+        blocks = x[:full * BLOCK].reshape(full, BLOCK)
+        y = np.empty(n)
+        y[:full * BLOCK] = (blocks @ self.response.T).ravel()
+        ends = blocks @ self.drive.T
+
+        state = np.asarray(state, dtype=np.float64)
+        starts = np.empty((full, 2))
+        step = self.powers[BLOCK]
+        for k in range(full):
+            starts[k] = state
+            state = step @ state + ends[k]
+        y[:full * BLOCK] += (starts @ self.observe.T).ravel()
+
+        rest = n - full * BLOCK
+        if rest:
+            tail = x[full * BLOCK:]
+            y[full * BLOCK:] = self.response[:rest, :rest] @ tail + self.observe[:rest] @ state
+            state = self.powers[rest] @ state + self.drive[:, BLOCK - rest:] @ tail
+        return y, state
@@ -6,8 +6,15 @@ import numpy as np
 import os
 from pathlib import Path
 
-# Pygameの初期化
-pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+# 生成する効果音と保存先のファイル名 (synth/build_sounds.py もこの表を使う)
+EFFECTS = {
+    "shot": "shot.wav",
+    "special": "special.wav",
+    "hit": "hit.wav",
+    "shield": "shield.wav",
+    "hyper": "hyper.wav",
+    "menu": "menu.wav"
+}
 
 def create_sound_effect(effect_type, volume=0.7):
     """8ビット風の効果音を生成する
@@ -174,14 +181,16 @@ def create_sound_effect(effect_type, volume=0.7):
     
     # PyGame用のサウンドオブジェクトに変換
     try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
         sound = pygame.sndarray.make_sound(stereo)
         return sound
     except Exception as e:
         print(f"効果音生成エラー: {e}")
         return None
 
-def save_sound(effect_type, filename):
-    """効果音を生成してファイルに保存"""
+def render_sound(effect_type):
+    """効果音の波形を生成する (ステレオ int16 の配列)"""
     # 効果音データを直接生成
     sample_rate = 44100
     
@@ -335,20 +344,26 @@ def save_sound(effect_type, filename):
     # -1.0～1.0の範囲にクリップ
     wave = np.clip(wave, -1.0, 1.0)
     
+    # 16ビット整数に変換
+    wave_int16 = (wave * 32767).astype(np.int16)
+    
+    # ステレオ化
+    stereo = np.zeros((len(wave_int16), 2), dtype=np.int16)
+    stereo[:, 0] = wave_int16  # 左チャンネル
+    stereo[:, 1] = wave_int16  # 右チャンネル
+    return stereo
+
+def save_sound(effect_type, filename):
+    """効果音を生成してファイルに保存"""
+    sample_rate = 44100
+    stereo = render_sound(effect_type)
+    
     # WAVファイルとして保存
     try:
         # 既存のファイルを一旦削除
         if os.path.exists(filename):
             os.remove(filename)
         
-        # 16ビット整数に変換
-        wave_int16 = (wave * 32767).astype(np.int16)
-        
-        # ステレオ化
-        stereo = np.zeros((len(wave_int16), 2), dtype=np.int16)
-        stereo[:, 0] = wave_int16  # 左チャンネル
-        stereo[:, 1] = wave_int16  # 右チャンネル
-        
         # WAVファイルとして保存
         from scipy.io import wavfile
         wavfile.write(filename, sample_rate, stereo)
@@ -367,24 +382,14 @@ def main():
     sound_dir = Path("assets/sounds")
     os.makedirs(sound_dir, exist_ok=True)
     
-    # 生成する効果音の定義
-    effects = {
-        "shot": "shot.wav",
-        "special": "special.wav", 
-        "hit": "hit.wav",
-        "shield": "shield.wav",
-        "hyper": "hyper.wav",
-        "menu": "menu.wav"
-    }
-    
     # 各効果音を生成して保存
     success_count = 0
-    for effect_type, filename in effects.items():
+    for effect_type, filename in EFFECTS.items():
         filepath = sound_dir / filename
         if save_sound(effect_type, str(filepath)):
             success_count += 1
     
-    print(f"効果音生成完了: {success_count}/{len(effects)}個の効果音を生成しました")
+    print(f"効果音生成完了: {success_count}/{len(EFFECTS)}個の効果音を生成しました")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""ドラムパターンのストリーミング書き出し
+
+16ステップのパターン (小節) の列を、固定長のリングバッファでブロックごとにミックスし、
+トゥルーピークリミッタを通して WAV / OGG にチャンク単位で書き出す。
+どの段もブロックを受け取ってブロックを返すジェネレータなので、
+何小節あってもメモリ使用量は一定になる。
+"""
+
+import wave
+from pathlib import Path
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+STEPS_PER_BAR = 16
+BLOCK_SIZE = 4096  # 1ブロックのサンプル数
+
+# リミッタの設定
+TRUE_PEAK_CEILING = 10 ** (-1.0 / 20)  # -1 dBTP
+LOOKAHEAD_SAMPLES = 64  # 約1.5ms 先のピークに向けてゲインを下げ始める
+RELEASE_SECONDS = 0.05  # ゲインが戻る時定数
+OVERSAMPLE = 4  # トゥルーピーク推定のオーバーサンプリング倍率
+INTERPOLATION_TAPS = 16  # 補間フィルタの片側タップ数 (8 だと鋭いピークを数%見落とす)
+
+
+def step_duration(tempo):
+    """16分音符1つの長さ (秒)"""
+    return 60.0 / tempo / 4.0
+
+
+def arrangement_length(bars, tempo, sample_rate=SAMPLE_RATE):
+    """bars 小節分のサンプル数"""
+    return int(bars * STEPS_PER_BAR * step_duration(tempo) * sample_rate)
+
+
+def pattern_hits(arrangement, tempo, voices, sample_rate=SAMPLE_RATE, bar_count=None):
+    """小節の列を (開始サンプル, 波形) の時刻順に展開する。
+
+    arrangement は grid[行][ステップ] の列 (イテレータでよい)、voices は行番号 -> 波形。
+    bar_count (1要素のリスト) を渡すと、読み終えた小節数をそこに書き込む。
+    """
+    step = step_duration(tempo)
+    bars = 0
+    for bar, grid in enumerate(arrangement):
+        for col in range(STEPS_PER_BAR):
+            start = int((bar * STEPS_PER_BAR + col) * step * sample_rate)
+            for row in range(len(grid)):
+                voice = voices.get(row)
+                if grid[row][col] and voice is not None and len(voice):
+                    yield start, voice
+        bars = bar + 1
+        if bar_count is not None:
+            bar_count[0] = bars
+    if bar_count is not None:
+        bar_count[0] = bars
+
+
+def render_blocks(arrangement, tempo, voices, block_size=BLOCK_SIZE, sample_rate=SAMPLE_RATE):
+    """パターンをミックスし、float32 ステレオのブロック (block_size, 2) を順に返す。
+
+    発音はリングバッファ (block_size + 最長の波形) に足し込み、ブロックを出すたびにその区間を空ける。
+    波形が最後の小節の終わりをはみ出した分は切り捨てる (書き出し長は小節数で決まる)。
+    """
+    voices = {row: as_stereo(voice) for row, voice in voices.items() if voice is not None}
+    longest = max((len(voice) for voice in voices.values()), default=0)
+    ring = np.zeros((block_size + longest, 2), dtype=np.float32)
+    size = len(ring)
+
+    bar_count = [0]
+    hits = pattern_hits(arrangement, tempo, voices, sample_rate, bar_count)
+    next_hit = next(hits, None)
+    position = 0
+    while True:
+        end = position + block_size
+        while next_hit is not None and next_hit[0] < end:
+            _mix_into_ring(ring, *next_hit)
+            next_hit = next(hits, None)
+        if next_hit is None:
+            # 全小節を読み終えたので全体の長さが決まる
+            end = min(end, arrangement_length(bar_count[0], tempo, sample_rate))
+        if end <= position:
+            return
+
+        start = position % size
+        count = end - position
+        first = min(count, size - start)
+        block = np.concatenate((ring[start:start + first], ring[:count - first]))
+        ring[start:start + first] = 0
+        ring[:count - first] = 0
+        position = end
+        yield block
+
+
+def _mix_into_ring(ring, start, voice):
+    size = len(ring)
+    offset = start % size
+    first = min(len(voice), size - offset)
+    ring[offset:offset + first] += voice[:first]
+    ring[:len(voice) - first] += voice[first:]
+
+
+def as_stereo(voice):
+    """波形を float32 ステレオ (-1.0〜1.0) にそろえる。int16 はフルスケールで割る"""
+    voice = np.asarray(voice)
+    if voice.dtype == np.int16:
+        voice = voice.astype(np.float32) / 32768.0
+    voice = voice.astype(np.float32, copy=False)
+    if voice.ndim == 1:
+        voice = np.repeat(voice[:, None], 2, axis=1)
+    return voice
+
+
+def _sliding_min(values, length):
+    """長さ length の窓ごとの最小値 (窓幅を倍々に広げるので length 回の比較は要らない)"""
+    result, span = values, 1
+    while span * 2 <= length:
+        result = np.minimum(result[:-span], result[span:])
+        span *= 2
+    if span < length:
+        result = np.minimum(result[:len(result) - (length - span)], result[length - span:])
+    return result
+
+
+def _interpolation_filters(oversample=OVERSAMPLE, taps=INTERPOLATION_TAPS):
+    """サンプル間 (n + p/oversample) の値を求める窓付き sinc フィルタ (p = 1..oversample-1)"""
+    offsets = np.arange(-taps + 1, taps + 1)
+    filters = []
+    for phase in range(1, oversample):
+        x = phase / oversample - offsets
+        window = np.cos(np.pi * (offsets - phase / oversample) / (2 * taps)) ** 2
+        filters.append(np.sinc(x) * window)
+    return np.array(filters).T  # (2 * taps, oversample - 1)
+
+
+class TruePeakLimiter:
+    """先読み付きのトゥルーピークリミッタ (ブロック単位で状態を持ち越す)。
+
+    サンプル間のピークをオーバーサンプリング補間で見積もり、どこでも ceiling を超えないゲインを求める。
+    ゲインは先読み区間の最小値を同じ長さで移動平均するので、ピークの手前から滑らかに下がり、
+    release の時定数で戻る。出力は入力より latency サンプル遅れる。
+    """
+
+    def __init__(self, ceiling=TRUE_PEAK_CEILING, lookahead=LOOKAHEAD_SAMPLES,
+                 release=RELEASE_SECONDS, sample_rate=SAMPLE_RATE, channels=2):
+        self.ceiling = ceiling
+        self.lookahead = max(1, int(lookahead))
+        self.release = np.exp(-1.0 / max(1.0, release * sample_rate))
+        self.filters = _interpolation_filters()
+        taps = len(self.filters) // 2
+        self.latency = taps + self.lookahead - 1
+        # 補間の文脈 (直前の入力)。最初は無音が続いていたものとみなし、その分を出力から捨てる
+        self._context = np.zeros((2 * taps - 1, channels), dtype=np.float32)
+        self._delayed = np.zeros((self.latency, channels), dtype=np.float32)
+        self._skip = self.latency
+        self._required = np.ones(self.lookahead - 1)
+        self._envelope = 0.0
+        self._gains = np.ones(self.lookahead - 1)
+        self.peak_reduction = 1.0  # これまでに掛けた最小のゲイン
+
+    def process(self, block):
+        """ブロックを受け取り、処理の済んだ分 (遅延の分だけ前のサンプル) を返す"""
+        block = np.asarray(block, dtype=np.float32)
+        if not len(block):
+            return block
+
+        context = np.concatenate((self._context, block))
+        self._context = context[len(block):]
+        true_peak = self._true_peak(context)
+
+        # 各サンプルで ceiling を超えないために必要なゲイン
+        required = np.concatenate((self._required, np.minimum(1.0, self.ceiling / np.maximum(true_peak, 1e-12))))
+        self._required = required[len(block):]
+        window_min = _sliding_min(required, self.lookahead)
+
+        # 減衰量を release の時定数で戻すピークホールド: e[k] = max(a[k], r * e[k-1])
+        attenuation = 1.0 - window_min
+        held = self._hold(attenuation)
+        gains = np.concatenate((self._gains, 1.0 - held))
+        self._gains = gains[len(block):]
+        total = np.concatenate(([0.0], np.cumsum(gains)))
+        smooth = (total[self.lookahead:] - total[:-self.lookahead]) / self.lookahead
+
+        samples = np.concatenate((self._delayed, block))
+        self._delayed = samples[len(block):]
+        out = samples[:len(block)] * smooth[:, None].astype(np.float32)
+        self.peak_reduction = min(self.peak_reduction, float(smooth.min()))
+
+        if self._skip:
+            skipped = min(self._skip, len(out))
+            self._skip -= skipped
+            out = out[skipped:]
+        return out
+
+    def flush(self):
+        """入力の終わりで、遅延していた残りのサンプルを出し切る"""
+        pending = self.latency - self._skip
+        if pending <= 0:
+            return np.zeros((0, self._context.shape[1]), dtype=np.float32)
+        return self.process(np.zeros((self.latency, self._context.shape[1]), dtype=np.float32))[:pending]
+
+    def _true_peak(self, context):
+        """context[taps - 1 : -taps] に当たる各サンプルの、次のサンプルまでの区間のピーク"""
+        taps = len(self.filters) // 2
+        peak = np.abs(context[taps - 1:len(context) - taps]).max(axis=1)
+        for channel in context.T:
+            for phase in self.filters.T:
+                # サンプル間の補間値 (フィルタは相関なので反転して畳み込む)
+                between = np.convolve(channel, phase[::-1], mode="valid")
+                np.maximum(peak, np.abs(between), out=peak)
+        return peak
+
+    def _hold(self, attenuation):
+        # log 領域では e[k] = max_j (log a[j] + (k - j) log r) となり、累積最大で一度に求まる
+        count = len(attenuation)
+        log_r = np.log(self.release)
+        k = np.arange(count)
+        with np.errstate(divide="ignore"):
+            candidates = np.log(attenuation) - k * log_r
+            carried = np.log(self._envelope) + log_r if self._envelope > 0 else -np.inf
+        held = np.exp(np.maximum(np.maximum.accumulate(candidates), carried) + k * log_r)
+        self._envelope = float(held[-1]) if count else self._envelope
+        return held
+
+
+def limit_blocks(blocks, limiter=None):
+    """ブロック列にリミッタを掛ける (入力が尽きたら遅延分も出し切る)"""
+    limiter = limiter or TruePeakLimiter()
+    for block in blocks:
+        out = limiter.process(block)
+        if len(out):
+            yield out
+    tail = limiter.flush()
+    if len(tail):
+        yield tail
+
+
+def to_int16(blocks):
+    """float ブロックを int16 の PCM に変換する"""
+    for block in blocks:
+        yield np.clip(np.round(block * 32767.0), -32767, 32767).astype(np.int16)
+
+
+def write_wav(blocks, filename, sample_rate=SAMPLE_RATE):
+    """int16 ステレオのブロック列を WAV にチャンク単位で書き込む。書いたフレーム数を返す"""
+    frames = 0
+    with wave.open(str(filename), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        for block in blocks:
+            wav_file.writeframes(np.ascontiguousarray(block).tobytes())
+            frames += len(block)
+    return frames
+
+
+def write_ogg(blocks, filename, sample_rate=SAMPLE_RATE):
+    """int16 ステレオのブロック列を OGG Vorbis にチャンク単位で書き込む (soundfile が必要)"""
+    try:
+        import soundfile
+    except ImportError:
+        raise RuntimeError("OGG の書き出しには soundfile が必要です。'pip install soundfile' を実行してください。")
+    frames = 0
+    with soundfile.SoundFile(str(filename), "w", samplerate=sample_rate, channels=2,
+                             format="OGG", subtype="VORBIS") as ogg_file:
+        for block in blocks:
+            ogg_file.write(block)
+            frames += len(block)
+    return frames
+
+
+def export_arrangement(arrangement, tempo, voices, filename, block_size=BLOCK_SIZE,
+                       sample_rate=SAMPLE_RATE, limiter=None):
+    """小節の列をミックス・リミッタ処理して filename に書き出す (拡張子 .ogg なら OGG、それ以外は WAV)"""
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    blocks = to_int16(limit_blocks(render_blocks(arrangement, tempo, voices, block_size, sample_rate), limiter))
+    if path.suffix.lower() == ".ogg":
+        return write_ogg(blocks, path, sample_rate)
+    return write_wav(blocks, path, sample_rate)
@@ -1,10 +1,7 @@
 import pygame
 import numpy as np
-from array import array
 import wave
 
-pygame.mixer.init(frequency=44100, size=-16, channels=1)
-
 # BGMの基本設定
 BPM = 145
 BEATS_PER_BAR = 4  # 4/4拍子
@@ -25,53 +22,58 @@ def save_samples_to_wav(samples, filename, sample_rate=44100):
         wav_file.setframerate(sample_rate)
         wav_file.writeframes(samples.tobytes())
 
+def square_phase(length, freq, duty, sample_rate=SAMPLE_RATE):
+    """矩形波の位相 (整数周期の位相アキュムレータ) が前半 duty に入っているサンプルで True"""
+    period = int(sample_rate / freq)
+    return np.arange(length) % period < period * duty
+
 def generate_note(freq, duration, volume=0.5, duty=0.25):
     """単音を生成"""
     sample_rate = 44100
-    samples = array('h', [0] * int(sample_rate * duration))
-    
-    period = sample_rate / freq
-    for i in range(len(samples)):
-        if (i % int(period)) < (int(period) * duty):
-            samples[i] = int(32767 * volume)
-        else:
-            samples[i] = int(-32767 * volume)
-    
-    return samples
+    high = int(32767 * volume)
+    on = square_phase(int(sample_rate * duration), freq, duty, sample_rate)
+    return np.where(on, high, -high).astype(np.int16)
 
 def generate_drum_hit(freq, duration, volume=0.7):
     """ドラム音を生成（急速な減衰付き）"""
     sample_rate = 44100
-    samples = array('h', [0] * int(sample_rate * duration))
-    
-    period = sample_rate / freq
-    for i in range(len(samples)):
-        t = i / sample_rate
-        # 急速な減衰
-        decay = np.exp(-t * 30)
-        if (i % int(period)) < (int(period) * 0.5):
-            samples[i] = int(32767 * volume * decay)
-        else:
-            samples[i] = int(-32767 * volume * decay)
-    
-    return samples
+    length = int(sample_rate * duration)
+    on = square_phase(length, freq, 0.5, sample_rate)
+    # 急速な減衰
+    decay = np.exp(-(np.arange(length) / sample_rate) * 30)
+    level = 32767 * volume * decay
+    # int() と同じく0方向に切り捨てる
+    return np.where(on, level, -level).astype(np.int16)
 
-def mix_samples(*sample_arrays):
-    """複数の音をミックス"""
+def mix_samples(*sample_arrays, out=None):
+    """複数の音を順に足し、1つ足すごとに ±32767 で飽和させる
+    out (int16 配列) を渡すとそこに書き込む
+    """
     max_length = max(len(arr) for arr in sample_arrays)
-    mixed = array('h', [0] * max_length)
+    if out is None:
+        out = np.empty(max_length, dtype=np.int16)
+    mixed = np.zeros(max_length, dtype=np.int32)
     
     for samples in sample_arrays:
-        for i in range(len(samples)):
-            mixed[i] = max(min(mixed[i] + samples[i], 32767), -32767)
+        head = mixed[:len(samples)]
+        head += samples
+        np.clip(head, -32767, 32767, out=head)
     
-    return mixed
+    out[:max_length] = mixed
+    return out
+
+def add_at(track, samples, start):
+    """start 秒の位置から track に samples を足す (はみ出した分は捨てる)"""
+    start_idx = int(start * SAMPLE_RATE)
+    count = min(len(samples), len(track) - start_idx)
+    if count > 0:
+        track[start_idx:start_idx + count] += samples[:count]
 
 def generate_rockman_title():
     """ロックマンタイトルBGMを生成"""
     total_bars = 8  # 全8小節
     total_duration = bar_to_sec(total_bars)
-    samples = array('h', [0] * int(SAMPLE_RATE * total_duration))
+    length = int(SAMPLE_RATE * total_duration)
     
     # 音階の周波数（オクターブを追加）
     notes = {
@@ -179,50 +181,38 @@ def generate_rockman_title():
             if beat < BEATS_PER_BAR - 1:  # 最後の拍以外
                 drum_pattern.append((300, time + bpm_to_sec(0.5), bpm_to_sec(0.25)))
     
-    # 音を生成してミックス
-    melody_samples = array('h', [0] * len(samples))
-    bass_samples = array('h', [0] * len(samples))
-    drum_samples = array('h', [0] * len(samples))
+    # 音を生成してミックス (パートごとの和は int16 に収まるので int32 で足しておく)
+    melody_samples = np.zeros(length, dtype=np.int32)
+    bass_samples = np.zeros(length, dtype=np.int32)
+    drum_samples = np.zeros(length, dtype=np.int32)
     
     # イントロ部分を生成
     for freq, start, duration in intro_melody:
-        note = generate_note(freq, duration, volume=0.4)
-        start_idx = int(start * SAMPLE_RATE)
-        for i in range(len(note)):
-            if start_idx + i < len(melody_samples):
-                melody_samples[start_idx + i] += note[i]
+        add_at(melody_samples, generate_note(freq, duration, volume=0.4), start)
     
     # メインメロディを生成
     for freq, start, duration in main_melody:
-        note = generate_note(freq, duration, volume=0.3)
-        start_idx = int(start * SAMPLE_RATE)
-        for i in range(len(note)):
-            if start_idx + i < len(melody_samples):
-                melody_samples[start_idx + i] += note[i]
+        add_at(melody_samples, generate_note(freq, duration, volume=0.3), start)
     
     # ベース音を生成（太い音色で）
     for freq, start, duration in bass_notes:
-        note = generate_note(freq, duration, volume=0.35, duty=0.5)
-        start_idx = int(start * SAMPLE_RATE)
-        for i in range(len(note)):
-            if start_idx + i < len(bass_samples):
-                bass_samples[start_idx + i] += note[i]
+        add_at(bass_samples, generate_note(freq, duration, volume=0.35, duty=0.5), start)
     
     # ドラム音を生成
     for freq, start, duration in drum_pattern:
-        drum = generate_drum_hit(freq, duration, volume=0.4)
-        start_idx = int(start * SAMPLE_RATE)
-        for i in range(len(drum)):
-            if start_idx + i < len(drum_samples):
-                drum_samples[start_idx + i] += drum[i]
+        add_at(drum_samples, generate_drum_hit(freq, duration, volume=0.4), start)
     
     # 全パートをミックス
     final_samples = mix_samples(melody_samples, bass_samples, drum_samples)
     return final_samples
 
-# BGMを生成して保存
-print("ロックマンタイトルBGMを生成中...")
-print(f"BPM: {BPM}, 小節数: 8小節")
-bgm_samples = generate_rockman_title()
-save_samples_to_wav(bgm_samples, "assets/sounds/rockman_title.wav")
-print("保存完了: rockman_title.wav") 
\ No newline at end of file
+if __name__ == "__main__":
+    pygame.mixer.init(frequency=44100, size=-16, channels=1)
+
+    # BGMを生成して保存
+    print("ロックマンタイトルBGMを生成中...")
+    print(f"BPM: {BPM}, 小節数: 8小節")
+    bgm_samples = generate_rockman_title()
+    save_samples_to_wav(bgm_samples, "assets/sounds/rockman_title.wav")
+    print("保存完了: rockman_title.wav")
+ 
\ No newline at end of file
@@ -4,11 +4,8 @@ from array import array
 import os
 import wave
 
-# assetsフォルダの作成
+# 保存先
 assets_dir = "assets/sounds"
-os.makedirs(assets_dir, exist_ok=True)
-
-pygame.mixer.init(frequency=44100, size=-16, channels=1)
 
 def save_samples_to_wav(samples, filename, sample_rate=44100):
     """サンプルデータをWAVファイルとして保存"""
@@ -226,46 +223,31 @@ def generate_boss_appear():
     
     return samples
 
-# 効果音の生成と保存
-print("効果音ファイルを生成中...")
-
-# 基本アクション音
-jump_samples = generate_sweep_sound(400, 1200, 0.15, volume=0.4)
-save_samples_to_wav(jump_samples, f"{assets_dir}/jump.wav")
-print("保存完了: jump.wav")
-
-land_samples = generate_sweep_sound(300, 150, 0.1, volume=0.5)
-save_samples_to_wav(land_samples, f"{assets_dir}/land.wav")
-print("保存完了: land.wav")
-
-buster_samples = generate_buster_sound()
-save_samples_to_wav(buster_samples, f"{assets_dir}/buster.wav")
-print("保存完了: buster.wav")
-
-# イベント音
-damage_samples = generate_damage_sound()
-save_samples_to_wav(damage_samples, f"{assets_dir}/damage.wav")
-print("保存完了: damage.wav")
-
-oneup_samples = generate_1up_sound()
-save_samples_to_wav(oneup_samples, f"{assets_dir}/1up.wav")
-print("保存完了: 1up.wav")
-
-item_samples = generate_item_sound()
-save_samples_to_wav(item_samples, f"{assets_dir}/item.wav")
-print("保存完了: item.wav")
-
-# 特殊効果音
-charge_samples = generate_charge_sound()
-save_samples_to_wav(charge_samples, f"{assets_dir}/charge.wav")
-print("保存完了: charge.wav")
-
-clear_samples = generate_stage_clear()
-save_samples_to_wav(clear_samples, f"{assets_dir}/stage_clear.wav")
-print("保存完了: stage_clear.wav")
-
-boss_samples = generate_boss_appear()
-save_samples_to_wav(boss_samples, f"{assets_dir}/boss_appear.wav")
-print("保存完了: boss_appear.wav")
-
-print("\nすべての効果音を assets/sounds フォルダに保存しました！") 
\ No newline at end of file
+# 効果音と生成関数 (ファイル名 -> (関数, 引数))。synth/build_sounds.py もこの表を使う
+ASSETS = {
+    # 基本アクション音
+    "jump.wav": (generate_sweep_sound, {"start_freq": 400, "end_freq": 1200, "duration": 0.15, "volume": 0.4}),
+    "land.wav": (generate_sweep_sound, {"start_freq": 300, "end_freq": 150, "duration": 0.1, "volume": 0.5}),
+    "buster.wav": (generate_buster_sound, {}),
+    # イベント音
+    "damage.wav": (generate_damage_sound, {}),
+    "1up.wav": (generate_1up_sound, {}),
+    "item.wav": (generate_item_sound, {}),
+    # 特殊効果音
+    "charge.wav": (generate_charge_sound, {}),
+    "stage_clear.wav": (generate_stage_clear, {}),
+    "boss_appear.wav": (generate_boss_appear, {}),
+}
+
+def main():
+    # 効果音の生成と保存
+    os.makedirs(assets_dir, exist_ok=True)
+    print("効果音ファイルを生成中...")
+    for filename, (generate, kwargs) in ASSETS.items():
+        save_samples_to_wav(generate(**kwargs), f"{assets_dir}/{filename}")
+        print(f"保存完了: {filename}")
+    print("\nすべての効果音を assets/sounds フォルダに保存しました！")
+
+if __name__ == "__main__":
+    pygame.mixer.init(frequency=44100, size=-16, channels=1)
+    main()
@@ -0,0 +1,176 @@
+"""ドラムパターンの先読みシーケンサ
+
+フレームごとに Sound.play() で1打ずつ鳴らすと、発音の時刻がフレーム間隔に引きずられて揺れ、
+重いフレームでは打点が抜けたり重なったりする。ここでは1小節ずつ PCM にミックスしてから
+専用のチャンネルに Channel.queue() で次の小節を予約しておき、小節のつなぎ目をミキサーに任せる。
+打点の位置はサンプル単位で決まるので、フレームレートには左右されない。
+"""
+
+import copy
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+from pattern_export import SAMPLE_RATE, STEPS_PER_BAR, TruePeakLimiter, as_stereo, step_duration
+
+# 予約済みの小節をこれより直前には作り直さない (差し替えが間に合わない恐れがある)
+RESCHEDULE_MARGIN = 0.05
+
+
+class ScheduledBar:
+    """チャンネルに渡した1小節分の記録"""
+
+    __slots__ = ("start", "duration", "step", "pattern", "tempo", "voices", "state", "sound")
+
+    def __init__(self, start, duration, step, pattern, tempo, voices, state, sound):
+        self.start = start  # 鳴り始める時刻 (perf_counter 基準の見積もり)
+        self.duration = duration
+        self.step = step  # 16分音符の長さ (秒)
+        self.pattern = pattern
+        self.tempo = tempo
+        self.voices = voices
+        self.state = state  # この小節を作る前の (位置, 持ち越し, リミッタ)。作り直しに使う
+        self.sound = sound
+
+
+class Sequencer:
+    """パターンを1小節ずつ先にミックスし、専用チャンネルで途切れなく鳴らす。
+
+    update() をメインループから毎フレーム呼ぶ。再生中の小節の次の1小節を常に Channel.queue() で
+    予約しておくので、フレームが1小節分近く遅れても音は途切れない。
+    テンポ・パターン・音色の変更は、まだ鳴り始めていない次の小節の頭から反映される。
+    小節をまたいで鳴り続ける音 (長い余韻) は次の小節に持ち越してつなぐ。
+    """
+
+    def __init__(self, channel, voices=None, tempo=120, clock=time.perf_counter,
+                 sample_rate=SAMPLE_RATE):
+        self.channel = channel
+        self.clock = clock
+        self.sample_rate = sample_rate
+        self.tempo = tempo
+        self.pattern = None
+        self.voices = {}
+        self.playing = False
+        self.scheduled = deque()  # 再生中の小節と予約中の小節
+        self.stats = {"refill_delay": 0.0, "max_refill_delay": 0.0, "min_headroom": None, "underruns": 0}
+        self.set_voices(voices or {})
+        self._reset_stream()
+
+    def set_voices(self, voices):
+        """行番号 -> 波形 (int16 / float, モノラル / ステレオ)。次の小節から使う"""
+        self.voices = {row: as_stereo(voice) for row, voice in voices.items() if voice is not None}
+
+    def set_pattern(self, pattern):
+        """grid[行][ステップ] を設定する。次に作る小節の時点の内容を使う"""
+        self.pattern = pattern
+
+    def set_tempo(self, tempo):
+        self.tempo = tempo
+
+    def start(self):
+        if not self.playing:
+            self.playing = True
+            self._reset_stream()
+
+    def stop(self):
+        self.playing = False
+        self.scheduled.clear()
+        self.channel.stop()
+
+    def update(self):
+        """毎フレーム呼ぶ。小節の切り替わりを記録し、空いた予約枠に次の小節を入れる"""
+        if not self.playing or not self.pattern:
+            return
+        now = self.clock()
+
+        if not self.channel.get_busy():
+            if self.scheduled:
+                # 予約が間に合わずに音が途切れた
+                self.stats["underruns"] += 1
+            self.scheduled.clear()
+            self._reset_stream()
+            bar = self._render(now)
+            self.channel.play(bar.sound)
+            self.scheduled.append(bar)
+        elif len(self.scheduled) > 1 and self.channel.get_queue() is None:
+            # 予約していた小節が鳴り始めた。気づくまでの遅れが予約の補充の遅れになる
+            self.scheduled.popleft()
+            current = self.scheduled[0]
+            # オーディオの時計が見積もりより進んでいたら合わせ直す (以降の小節の時刻がずれていかないように)
+            current.start = min(current.start, now)
+            delay = now - current.start
+            self.stats["refill_delay"] = delay
+            self.stats["max_refill_delay"] = max(self.stats["max_refill_delay"], delay)
+
+        if self.channel.get_queue() is None:
+            current = self.scheduled[-1]
+            self._queue(self._render(current.start + current.duration), now)
+        elif len(self.scheduled) > 1 and self._stale(self.scheduled[-1]):
+            queued = self.scheduled[-1]
+            if queued.start - now > RESCHEDULE_MARGIN:
+                self.scheduled.pop()
+                self._position, self._carry, self._limiter = queued.state
+                self._queue(self._render(queued.start), now)
+
+    def current_step(self):
+        """いま鳴っている16分音符の位置 (0〜15)。停止中は None"""
+        if not self.playing or not self.scheduled:
+            return None
+        now = self.clock()
+        bar = self.scheduled[0]
+        if len(self.scheduled) > 1 and now >= self.scheduled[1].start:
+            bar = self.scheduled[1]
+        return min(STEPS_PER_BAR - 1, max(0, int((now - bar.start) / bar.step)))
+
+    def _queue(self, bar, now):
+        self.channel.queue(bar.sound)
+        self.scheduled.append(bar)
+        headroom = bar.start - now  # 予約した小節が鳴り始めるまでの余裕
+        if self.stats["min_headroom"] is None or headroom < self.stats["min_headroom"]:
+            self.stats["min_headroom"] = headroom
+
+    def _stale(self, bar):
+        return bar.pattern != self.pattern or bar.tempo != self.tempo or bar.voices is not self.voices
+
+    def _reset_stream(self):
+        longest = max((len(voice) for voice in self.voices.values()), default=0)
+        self._position = 0.0  # 小節の頭のサンプル位置 (端数を持ち越してテンポのずれをためない)
+        self._carry = np.zeros((longest, 2), dtype=np.float32)
+        self._limiter = TruePeakLimiter(sample_rate=self.sample_rate)
+
+    def _render(self, start):
+        """次の1小節をミックスして ScheduledBar にする"""
+        state = (self._position, self._carry, copy.deepcopy(self._limiter))
+        pattern = [row[:] for row in self.pattern]
+        step = step_duration(self.tempo)
+        first = int(self._position)
+        end = self._position + STEPS_PER_BAR * step * self.sample_rate
+        length = int(end) - first
+
+        longest = max([len(voice) for voice in self.voices.values()] + [len(self._carry)])
+        mix = np.zeros((length + longest, 2), dtype=np.float32)
+        mix[:len(self._carry)] += self._carry
+        for col in range(STEPS_PER_BAR):
+            offset = int(self._position + col * step * self.sample_rate) - first
+            for row, cells in enumerate(pattern):
+                voice = self.voices.get(row)
+                if cells[col] and voice is not None:
+                    mix[offset:offset + len(voice)] += voice
+
+        self._position = end
+        self._carry = mix[length:].copy()
+        out = self._limiter.process(mix[:length])
+        pcm = np.clip(np.round(out * 32767.0), -32767, 32767).astype(np.int16)
+        sound = pygame.sndarray.make_sound(_match_mixer(pcm))
+        return ScheduledBar(start, len(pcm) / self.sample_rate, step, pattern, self.tempo,
+                            self.voices, state, sound)
+
+
+def _match_mixer(pcm):
+    """ミキサーのチャンネル数に合わせる (make_sound は形が一致しないと例外になる)"""
+    init = pygame.mixer.get_init()
+    if init and init[2] == 1:
+        return np.ascontiguousarray(pcm.mean(axis=1).astype(np.int16))
+    return np.ascontiguousarray(pcm)
@@ -3,6 +3,9 @@ import numpy as np
 import pygame.gfxdraw
 import os
 
+import filters
+import wavetable
+
 # Pygameの初期化
 pygame.init()
 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
@@ -151,20 +154,14 @@ class Button:
 # 波形生成関数
 def generate_waveform(frequency, duration, volume, waveform_type, params):
     sample_rate = 44100
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    length = int(sample_rate * duration)
     
-    # 波形タイプにより異なる音色を生成
-    if waveform_type == 0:  # Sine wave
-        wave = np.sin(2 * np.pi * frequency * t)
-    elif waveform_type == 1:  # Square wave
-        wave = np.sign(np.sin(2 * np.pi * frequency * t))
-    elif waveform_type == 2:  # Sawtooth wave
-        wave = 2 * (t * frequency - np.floor(0.5 + t * frequency))
-    elif waveform_type == 3:  # Triangle wave
-        wave = 2 * np.abs(2 * (t * frequency - np.floor(t * frequency + 0.5))) - 1
+    # 波形タイプにより異なる音色を生成 (0-3 は帯域制限したウェーブテーブルから読む)
+    if waveform_type in wavetable.WAVEFORMS:  # Sine / Square / Sawtooth / Triangle wave
+        wave = wavetable.render(waveform_type, frequency, length, sample_rate)
     elif waveform_type == 4:  # Custom wave with noise
-        sine_wave = np.sin(2 * np.pi * frequency * t)
-        noise = np.random.uniform(-0.5, 0.5, len(t)) * params['noise']
+        sine_wave = wavetable.render(wavetable.SINE, frequency, length, sample_rate)
+        noise = np.random.uniform(-0.5, 0.5, length) * params['noise']
         wave = sine_wave + noise
     
     # 音量調整
@@ -172,12 +169,9 @@ def generate_waveform(frequency, duration, volume, waveform_type, params):
     
     # LPF簡易フィルター (簡単な低域通過フィルター)
     if params['lpf'] > 0:
-        from scipy.signal import butter, filtfilt
-        nyquist = 0.5 * sample_rate
-        cutoff = params['lpf'] * 20000  # 0-1の値から0-20kHzに変換
-        normal_cutoff = cutoff / nyquist
-        b, a = butter(4, normal_cutoff, btype='low', analog=False)
-        wave = filtfilt(b, a, wave)
+        # 0-1の値から0-20kHzに変換 (1Hz単位に丸めて、スライダーの値ごとの設計をキャッシュで使い回す)
+        cutoff = max(1, round(params['lpf'] * 20000))
+        wave = filters.apply(wave, "low", 4, cutoff, sample_rate)
     
     # エンベロープ適用 (ADSR)
     attack = int(params['attack'] * sample_rate)
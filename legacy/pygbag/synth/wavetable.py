@@ -0,0 +1,152 @@
+"""帯域制限したウェーブテーブルによるオシレータ
+
+矩形波やのこぎり波を np.sign / np.floor でそのまま作ると、ナイキスト周波数を超える倍音が
+折り返して濁った音になる。ここでは波形ごとに、倍音の数を 1, 2, 4, ... と倍々に制限した
+1周期分のテーブル (ミップマップ) を最初に一度だけ作っておき、鳴らす周波数で折り返さない
+テーブルを選んで、32ビットの位相アキュムレータで線形補間しながら読み出す。
+1音の生成はテーブルからの読み出し (gather) だけになり、複数の音をまとめて作ることもできる。
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+TABLE_SIZE = 2048  # 1周期のサンプル数
+MAX_HARMONICS = TABLE_SIZE // 2
+PHASE_ONE = 2 ** 32  # 位相アキュムレータの1周期
+FRAC_BITS = 32 - int(np.log2(TABLE_SIZE))  # 位相のうち、テーブルの位置より下の (補間に使う) ビット数
+FRAC_MASK = (1 << FRAC_BITS) - 1
+
+# synthesizer の波形番号と同じ並び (4 のノイズ入りはサイン波に足す)
+SINE, SQUARE, SAW, TRIANGLE = range(4)
+WAVEFORMS = (SINE, SQUARE, SAW, TRIANGLE)
+
+
+def _harmonics(waveform, count):
+    """1〜count 次の倍音の (sin の係数, cos の係数)。naive な波形と同じ位相・振幅 (±1) になるようにする"""
+    k = np.arange(1, count + 1)
+    odd = k % 2 == 1
+    sin = np.zeros(count)
+    cos = np.zeros(count)
+    if waveform == SINE:
+        sin[0] = 1.0
+    elif waveform == SQUARE:
+        sin[odd] = 4 / (np.pi * k[odd])
+    elif waveform == SAW:
+        sin[:] = 2 / np.pi * (-1.0) ** (k + 1) / k
+    elif waveform == TRIANGLE:
+        cos[odd] = -8 / (np.pi ** 2 * k[odd] ** 2)
+    else:
+        raise ValueError(f"未対応の波形です: {waveform}")
+    return sin, cos
+
+
+@lru_cache(maxsize=None)
+def mipmaps(waveform):
+    """波形ごとのテーブル (値, 次のサンプルとの差)。どちらもレベル数 x TABLE_SIZE で、レベル i の倍音は 2**i 次まで
+
+    差のテーブルを持っておくと、線形補間が1回の読み出しと積和で済む。
+    ギブス現象で ±1 を少し超えるので、レベルごとにピークを 1 にそろえる。
+    """
+    levels = int(np.log2(MAX_HARMONICS)) + 1
+    values = np.empty((levels, TABLE_SIZE))
+    sin, cos = _harmonics(waveform, MAX_HARMONICS)
+    for level in range(levels):
+        count = 2 ** level
+        spectrum = np.zeros(TABLE_SIZE // 2 + 1, dtype=complex)
+        spectrum[1:count + 1] = (cos[:count] - 1j * sin[:count]) * TABLE_SIZE / 2
+        table = np.fft.irfft(spectrum, TABLE_SIZE)
+        values[level] = table / np.max(np.abs(table))
+    slopes = np.roll(values, -1, axis=1) - values
+    values.setflags(write=False)
+    slopes.setflags(write=False)
+    return values, slopes
+
+
+def mip_level(frequency, sample_rate=SAMPLE_RATE):
+    """その周波数で鳴らしても倍音がナイキスト周波数を超えないレベル"""
+    frequency = np.maximum(np.abs(np.asarray(frequency, dtype=np.float64)), 1e-9)
+    allowed = np.floor(sample_rate / 2 / frequency)
+    level = np.floor(np.log2(np.maximum(allowed, 1)))
+    return np.minimum(level, np.log2(MAX_HARMONICS)).astype(np.intp)
+
+
+def _increment(frequency, sample_rate):
+    """1サンプルあたりの位相の進み (1周期 = 2**32 の固定小数点)"""
+    cycles = np.mod(np.asarray(frequency, dtype=np.float64) / sample_rate, 1.0)
+    return np.round(cycles * PHASE_ONE).astype(np.uint64).astype(np.uint32)
+
+
+def _lookup(waveform, level, phase, out=None):
+    """uint32 の位相を、レベル level のテーブルから線形補間で読む"""
+    values, slopes = mipmaps(waveform)
+    index = (phase >> np.uint32(FRAC_BITS)).astype(np.intp)
+    frac = (phase & np.uint32(FRAC_MASK)).astype(np.float64)
+    frac *= 1.0 / (FRAC_MASK + 1)
+    out = np.take(values[level], index, out=out)
+    out += np.take(slopes[level], index) * frac
+    return out
+
+
+def _phase(phase):
+    """0〜1 の位相を固定小数点にする"""
+    return _wrap(round((phase % 1.0) * PHASE_ONE))
+
+
+def _wrap(phase):
+    return np.uint32(phase % PHASE_ONE)
+
+
+def _accumulate(frequency, length, sample_rate, phase):
+    """各サンプルの位相 (uint32) と、length サンプル後の位相を返す。uint32 の桁あふれがそのまま1周期の折り返しになる"""
+    if np.ndim(frequency):
+        increments = _increment(np.asarray(frequency, dtype=np.float64)[:length], sample_rate)
+        phases = np.empty(length, dtype=np.uint32)
+        phases[0] = phase
+        np.cumsum(increments[:-1], dtype=np.uint32, out=phases[1:])
+        phases[1:] += phase
+        return phases, _wrap(int(phases[-1]) + int(increments[-1]))
+    increment = _increment(frequency, sample_rate)
+    phases = np.arange(length, dtype=np.uint32)
+    phases *= increment
+    phases += phase
+    return phases, _wrap(int(phases[-1]) + int(increment))
+
+
+def render(waveform, frequency, length, sample_rate=SAMPLE_RATE, phase=0.0):
+    """1音分の波形 (float64, ±1)。frequency は定数か、サンプルごとの配列 (length 個)"""
+    return _render(waveform, frequency, length, sample_rate, _phase(phase))[0]
+
+
+def _render(waveform, frequency, length, sample_rate, phase):
+    if length <= 0:
+        return np.zeros(0), phase
+    phases, end = _accumulate(frequency, length, sample_rate, phase)
+    # 周波数が動くときは、一番高いところでも折り返さないレベルを使う
+    level = mip_level(np.max(np.abs(frequency)), sample_rate)
+    return _lookup(waveform, level, phases), end
+
+
+def render_notes(waveform, frequencies, length, sample_rate=SAMPLE_RATE):
+    """複数の音をまとめて作る。(音の数 x length) の配列を返す"""
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    out = np.empty((len(frequencies), length))
+    # 全部の音を1つの2次元配列で読むより、1音ずつ出力の行に書くほうがキャッシュに収まって速い
+    ramp = np.arange(length, dtype=np.uint32)
+    for row, increment, level in zip(out, _increment(frequencies, sample_rate), mip_level(frequencies, sample_rate)):
+        _lookup(waveform, level, ramp * increment, out=row)
+    return out
+
+
+class Oscillator:
+    """位相を持ち越して、続けて呼んでもつなぎ目のない波形を返すオシレータ"""
+
+    def __init__(self, waveform, sample_rate=SAMPLE_RATE):
+        self.waveform = waveform
+        self.sample_rate = sample_rate
+        self.phase = np.uint32(0)
+
+    def render(self, frequency, length):
+        wave, self.phase = _render(self.waveform, frequency, length, self.sample_rate, self.phase)
+        return wave
@@ -7,9 +7,11 @@ from unittest.mock import MagicMock
 # プロジェクトのルートディレクトリをパスに追加
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
 from game.game import Game
 from game.arena import Arena
 from game.player import Player
+from game.fonts import clear_fonts
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -23,6 +25,39 @@ def setup_pygame():
     pygame.quit()
 
 
+@pytest.fixture(scope="module", autouse=True)
+def restore_mixer_classes():
+    """Sound や Channel をモックに差し替えたままにするテストがあるので、モジュールごとに元に戻す"""
+    saved = {name: getattr(pygame.mixer, name) for name in ("Sound", "Channel")}
+    yield
+    for name, value in saved.items():
+        setattr(pygame.mixer, name, value)
+
+
+@pytest.fixture(autouse=True)
+def isolate_font_registry():
+    """テスト間でフォントレジストリを共有しない（モックされたFontが残らないように）"""
+    yield
+    clear_fonts()
+
+
+@pytest.fixture(autouse=True)
+def shutdown_games(monkeypatch):
+    """テストで作った Game の音声の読み込みスレッドを、テストの終わりに止める"""
+    games = []
+    original_init = Game.__init__
+
+    def init(self, *args, **kwargs):
+        games.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Game, "__init__", init)
+    yield
+    for game in games:
+        if hasattr(game, "audio"):
+            game.shutdown()
+
+
 @pytest.fixture
 def mock_screen():
     """モックスクリーンを提供"""
@@ -38,6 +73,12 @@ def game_instance(mock_screen):
     return game
 
 
+@pytest.fixture
+def game():
+    """音声・タイトル背景なしで画面サイズのゲームインスタンスを提供 (AI や画面のテスト用)"""
+    return Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_audio=False, enable_title_background=False)
+
+
 @pytest.fixture
 def arena_instance():
     """アリーナインスタンスを提供"""
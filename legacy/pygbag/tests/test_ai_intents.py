@@ -0,0 +1,77 @@
+import random
+
+from game.ai import AI_KEYS
+from game.projectile import BallisticProjectile
+
+
+def test_auto_test_control_reuses_per_player_buffers(game):
+    random.seed(3)
+    controller = game.ai_controller
+    keys1 = controller.auto_test_ai_control(game.player1, game.player2, True)
+    keys2 = controller.auto_test_ai_control(game.player2, game.player1, False)
+
+    assert keys1 is not keys2
+    assert tuple(keys1) == AI_KEYS
+    for _ in range(120):
+        game.ai_move_timer1 += 1
+        assert controller.auto_test_ai_control(game.player1, game.player2, True) is keys1
+
+
+def test_move_direction_lives_in_controller_buffer(game):
+    movement = game.ai_move_direction1
+    game.ai_move_timer1 = game.ai_move_interval
+
+    keys = game.ai_controller.auto_test_ai_control(game.player1, game.player2, True)
+
+    assert game.ai_move_direction1 is movement
+    assert game.ai_move_direction2 is not movement
+    for key in movement:
+        assert keys[key] == movement[key]
+
+    game.ai_move_direction1 = {"up": True, "down": False, "left": False, "right": False, "dash": False}
+    assert game.ai_move_direction1 is movement
+    assert movement["up"]
+
+
+def test_dodge_overwrites_every_key(game, mocker):
+    player = game.player1
+    keys = game.ai_controller.auto_test_ai_control(player, game.player2, True)
+    for key in keys:
+        keys[key] = True
+
+    proj = BallisticProjectile(player.x - 60, player.y, 0.0, 10, game.player2)
+    game.projectiles = [proj]
+    game.danger_field.refresh(game.projectiles)
+    mocker.patch.object(
+        game.ai_controller, "predict_projectile_collision", return_value=(proj, 30, player.x, player.y)
+    )
+    game.ai_controller.auto_test_ai_control(player, game.player2, True)
+
+    assert keys["dash"]
+    assert not keys["weapon_a"] and not keys["hyper"] and not keys["special"]
+    assert game.ai_move_direction1["up"] == keys["up"]
+    assert game.ai_move_direction1["down"] == keys["down"]
+
+
+def test_simple_and_search_controls_write_into_player2_buffer(game):
+    buffer = game.ai_controller.intents[False].keys
+
+    assert game.ai_controller.simple_ai_control() is buffer
+    assert game.ai_controller.search_ai_control() is buffer
+    assert tuple(buffer) == AI_KEYS
+
+
+def test_threat_table_is_reused(game):
+    controller = game.ai_controller
+    game.projectiles = [BallisticProjectile(game.player1.x - 60, game.player1.y, 0.0, 10, game.player2)]
+
+    first = controller.evaluate_threats(game.player1)
+    assert len(first) == 1
+    assert first.distances == [60.0]
+
+    game.projectiles = []
+    second = controller.evaluate_threats(game.player1)
+    assert second is first
+    assert len(second) == 0
+    assert second.distances == []
+    assert second.earliest() is None
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import pygame
+
+from game.ai_scheduler import AIScheduler
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.projectile import BeamProjectile
+
+
+def _make_scheduler(think_interval):
+    pygame.init()
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_audio=False, enable_title_background=False)
+    controller = MagicMock()
+    controller.game = game
+    controller.auto_test_ai_control.side_effect = lambda player, opponent, is_player1: {"p1": is_player1}
+    return game, controller, AIScheduler(controller, think_interval=think_interval)
+
+
+def _run_frames(game, scheduler, frames):
+    """フレームごとに思考したプレイヤーを記録する"""
+    thinks = []
+    for _ in range(frames):
+        before = scheduler.think_count
+        scheduler.control(game.player1, game.player2, is_player1=True)
+        p1 = scheduler.think_count > before
+        scheduler.control(game.player2, game.player1, is_player1=False)
+        p2 = scheduler.think_count > before + p1
+        thinks.append((p1, p2))
+    return thinks
+
+
+def test_scheduler_thinks_every_interval_and_staggers_players():
+    game, controller, scheduler = _make_scheduler(4)
+
+    thinks = _run_frames(game, scheduler, 12)
+
+    assert [i for i, (p1, _) in enumerate(thinks) if p1] == [0, 4, 8]
+    assert [i for i, (_, p2) in enumerate(thinks) if p2] == [0, 2, 6, 10]
+    # 初回以外は同じフレームで2人とも思考することはない
+    assert not any(p1 and p2 for p1, p2 in thinks[1:])
+
+
+def test_scheduler_replays_cached_intent_between_thinks():
+    game, controller, scheduler = _make_scheduler(3)
+
+    first = scheduler.control(game.player1, game.player2, True)
+    second = scheduler.control(game.player1, game.player2, True)
+
+    assert second is first
+    assert controller.auto_test_ai_control.call_count == 1
+
+
+def test_new_projectile_in_range_triggers_immediate_think():
+    game, controller, scheduler = _make_scheduler(30)
+    scheduler.control(game.player1, game.player2, True)
+
+    # 遠くの弾では思考し直さない
+    game.projectiles.append(BeamProjectile(game.player1.x + 500, game.player1.y, 0, 5, game.player2))
+    scheduler.control(game.player1, game.player2, True)
+    assert controller.auto_test_ai_control.call_count == 1
+
+    game.projectiles.append(BeamProjectile(game.player1.x + 60, game.player1.y, 0, 5, game.player2))
+    scheduler.control(game.player1, game.player2, True)
+    assert controller.auto_test_ai_control.call_count == 2
+
+    # 同じ弾では二度は割り込まない
+    scheduler.control(game.player1, game.player2, True)
+    assert controller.auto_test_ai_control.call_count == 2
+
+
+def test_interval_one_thinks_every_frame():
+    game, controller, scheduler = _make_scheduler(1)
+
+    _run_frames(game, scheduler, 5)
+
+    assert controller.auto_test_ai_control.call_count == 10
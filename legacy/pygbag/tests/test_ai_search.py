@@ -0,0 +1,80 @@
+import math
+
+from game.ai_search import DIRECTIONS, SearchAI, SearchSnapshot, rollout
+from game.projectile import BallisticProjectile
+
+
+def _shot_at(game, target, distance):
+    """target の左から真横に飛んでくる相手の弾"""
+    owner = game.player1 if target is game.player2 else game.player2
+    return BallisticProjectile(target.x - distance, target.y, 0.0, 20, owner)
+
+
+def test_rollout_scores_hit_and_dodge(game):
+    player = game.player2
+    snapshot = SearchSnapshot.capture(player, game.player1, [_shot_at(game, player, 80)])
+
+    stay_cost, stay_hit, frames = rollout(snapshot, (((0.0, 0.0), False, 24),), 24)
+    dodge_cost, dodge_hit, _ = rollout(snapshot, (((0.0, -1.0), True, 24),), 24)
+
+    assert frames == 24
+    assert stay_hit is not None and stay_hit <= 10
+    assert dodge_hit is None
+    assert dodge_cost < stay_cost
+
+
+def test_snapshot_ignores_own_and_stationary_projectiles(game):
+    own = BallisticProjectile(0, 0, 0.0, 10, game.player2)
+    stationary = _shot_at(game, game.player2, 50)
+    stationary.speed = 0
+
+    snapshot = SearchSnapshot.capture(game.player2, game.player1, [own, stationary])
+
+    assert snapshot.projectiles == ()
+
+
+def test_search_picks_dodge_and_reports_nodes(game):
+    ai = SearchAI(horizon=24, time_budget_ms=50)
+    player = game.player2
+    keys = ai.control(player, game.player1, [_shot_at(game, player, 80)])
+
+    # 真横から来る弾は上下に避ける
+    assert keys["up"] or keys["down"]
+    assert not keys["shield"]
+    assert ai.last_plans == len(ai.plans)
+    assert ai.last_nodes == ai.last_plans * 24
+    assert ai.nodes_per_second > 0
+
+
+def test_search_stops_at_time_budget(game):
+    ai = SearchAI(horizon=24, time_budget_ms=0)
+    ai.control(game.player2, game.player1, [_shot_at(game, game.player2, 200)])
+
+    assert ai.last_plans == 1
+
+
+def test_search_shields_when_hit_is_unavoidable(game):
+    player = game.player2
+    # 四方から同時に迫る弾はどちらに動いても避けきれない
+    projectiles = []
+    for direction in DIRECTIONS[1:]:
+        angle = math.atan2(-direction[1], -direction[0])
+        projectiles.append(BallisticProjectile(
+            player.x + direction[0] * 40, player.y + direction[1] * 40, angle, 20, game.player1
+        ))
+
+    keys = SearchAI(time_budget_ms=50).control(player, game.player1, projectiles)
+
+    assert keys["shield"]
+
+
+def test_hard_difficulty_drives_player2_with_search(game, mocker):
+    game.ai_difficulty = "hard"
+    search = mocker.spy(game.ai_controller, "search_ai_control")
+    simple = mocker.spy(game.ai_controller, "simple_ai_control")
+
+    game.update_gameplay_elements(use_simple_ai=True)
+
+    assert search.call_count == 1
+    assert simple.call_count == 0
+    assert game.ai_controller.search_ai.total_nodes > 0
@@ -0,0 +1,53 @@
+import pygame
+
+from game.arena import Arena
+from game.constants import ARENA_CENTER_X, ARENA_CENTER_Y, ORANGE, SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def test_static_layer_is_shared_between_draws_and_instances():
+    """静的レイヤーは一度だけ合成され、別インスタンスでも使い回される"""
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    arena = Arena()
+    arena.draw(screen)
+    layer = arena._get_static_layer()
+
+    arena.update()
+    arena.draw(screen)
+
+    assert arena._get_static_layer() is layer
+    assert Arena()._get_static_layer() is layer
+
+
+def test_ring_frames_are_bounded_by_tint_steps():
+    """点滅の全位相を回しても警告リングのフレーム数は RING_TINT_STEPS 以下"""
+    pygame.init()
+    arena = Arena()
+    frames = set()
+    for _ in range(200):
+        arena.update()
+        frames.add(id(arena._get_ring_frame(arena.border_alpha)))
+
+    assert len(frames) <= Arena.RING_TINT_STEPS
+
+
+def test_draw_output_matches_arena_layout():
+    """床・水分エリア・警告リング・外周が従来通りの位置と色で描かれる"""
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen.fill((5, 5, 5))
+    arena = Arena()
+    arena.draw(screen)
+
+    # アリーナ外は透過
+    assert screen.get_at((5, 5))[:3] == (5, 5, 5)
+    # 中央は床色と水色のブレンド（青が支配的）
+    center = screen.get_at((ARENA_CENTER_X, ARENA_CENTER_Y))
+    assert center[2] > center[0]
+    # 床（水分エリア外）
+    assert screen.get_at((ARENA_CENTER_X + 200, ARENA_CENTER_Y))[:3] == (20, 20, 40)
+    # 警告リングは border_alpha=255 でオレンジそのもの
+    ring = screen.get_at((ARENA_CENTER_X + arena.warning_radius - 1, ARENA_CENTER_Y))
+    assert ring[:3] == ORANGE
+    # 外周リング
+    assert screen.get_at((ARENA_CENTER_X + arena.radius - 1, ARENA_CENTER_Y))[:3] == (255, 0, 0)
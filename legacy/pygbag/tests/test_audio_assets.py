@@ -0,0 +1,148 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pygame
+import pytest
+
+from game.audio_assets import AudioAssets, LazySound
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+
+
+@pytest.fixture
+def fake_decode(mocker):
+    """pygame.mixer.Sound の代わりにデコードしたパスを記録する"""
+    decoded = []
+
+    def decode(path):
+        decoded.append(path)
+        return MagicMock(name=path)
+
+    mocker.patch("game.audio_assets.pygame.mixer.Sound", side_effect=decode)
+    mocker.patch("game.audio_assets.pygame.mixer.get_init", return_value=(44100, -16, 2))
+    return decoded
+
+
+def _touch(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b"")
+    return str(path)
+
+
+def test_missing_file_is_not_registered(tmp_path):
+    assets = AudioAssets()
+
+    assert assets.register("menu", str(tmp_path / "missing.ogg")) is None
+    assert assets.pending == 0
+
+
+def test_loads_in_priority_then_registration_order(tmp_path, fake_decode):
+    assets = AudioAssets()
+    shot = _touch(tmp_path, "shot.ogg")
+    menu = _touch(tmp_path, "menu.ogg")
+    bgm = _touch(tmp_path, "bgm.ogg")
+    hit = _touch(tmp_path, "hit.ogg")
+    assets.register("shot", shot, priority=2)
+    assets.register("menu", menu, priority=1)
+    assets.register("bgm", bgm, priority=0)
+    assets.register("hit", hit, priority=2)
+
+    assets.load_all()
+
+    assert fake_decode == [bgm, menu, shot, hit]
+    assert all(sound.ready for sound in assets.assets.values())
+
+
+def test_placeholder_is_silent_until_loaded(tmp_path, fake_decode):
+    sound = LazySound("menu", _touch(tmp_path, "menu.ogg"), volume=0.5)
+
+    assert sound.play() is None
+    assert sound.get_length() == 0.0
+    assert sound.get_volume() == 0.5
+
+    sound.load()
+    sound.play()
+    sound.sound.set_volume.assert_called_once_with(0.5)
+    sound.sound.play.assert_called_once_with(0, 0, 0)
+
+
+def test_loop_requested_before_load_starts_on_poll(tmp_path, fake_decode):
+    assets = AudioAssets()
+    bgm = assets.register("bgm", _touch(tmp_path, "bgm.ogg"))
+    shot = assets.register("shot", _touch(tmp_path, "shot.ogg"), priority=1)
+    bgm.play(-1)
+    shot.play()
+
+    assets.load_all()
+    assets.poll()
+
+    bgm.sound.play.assert_called_once_with(-1)
+    # 読み込み前の効果音は鳴らさない
+    shot.sound.play.assert_not_called()
+
+
+def test_stopped_loop_does_not_start_after_load(tmp_path, fake_decode):
+    assets = AudioAssets()
+    bgm = assets.register("bgm", _touch(tmp_path, "bgm.ogg"))
+    bgm.play(-1)
+    bgm.stop()
+
+    assets.load_all()
+    assets.poll()
+
+    bgm.sound.play.assert_not_called()
+
+
+def test_stop_ends_background_loading(tmp_path, mocker):
+    started = threading.Event()
+
+    def slow_decode(path):
+        started.set()
+        time.sleep(0.05)
+        return MagicMock(name=path)
+
+    mocker.patch("game.audio_assets.pygame.mixer.Sound", side_effect=slow_decode)
+    mocker.patch("game.audio_assets.pygame.mixer.get_init", return_value=(44100, -16, 2))
+    assets = AudioAssets()
+    for i in range(20):
+        assets.register(f"sound{i}", _touch(tmp_path, f"sound{i}.ogg"))
+    assets.start()
+    thread = assets._thread
+    assert started.wait(timeout=5)
+
+    assets.stop()
+
+    assert not thread.is_alive()
+    assert assets.pending == 0
+    # 読み込み中だった1つを除き、残りは読み込まない
+    assert sum(sound.ready for sound in assets.assets.values()) <= 2
+
+
+def test_game_decodes_audio_in_background():
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_title_background=False)
+
+    assert set(game.sounds) == {"menu", "special", "shot", "hit", "shield", "hyper"}
+    assert game.title_bgm is game.audio.assets["title_bgm"]
+    game.audio.wait(timeout=10)
+    assert game.audio.pending == 0
+    assert game.title_bgm.ready
+    assert all(sound.ready for sound in game.sounds.values())
+
+
+def test_game_shutdown_stops_the_loader():
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_title_background=False)
+    thread = game.audio._thread
+
+    game.shutdown()
+
+    assert thread is None or not thread.is_alive()
+    assert game.audio._thread is None
+
+
+def test_game_without_audio_registers_nothing():
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_audio=False, enable_title_background=False)
+
+    assert game.sounds == {}
+    assert game.title_bgm is None
+    assert game.audio.pending == 0
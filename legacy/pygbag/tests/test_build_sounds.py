@@ -0,0 +1,96 @@
+import filecmp
+import shutil
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "synth"))
+
+import build_sounds
+from build_sounds import Target, build, targets
+
+ASSET_DIR = ROOT / "assets" / "sounds"
+
+
+def test_every_target_is_a_shipped_asset():
+    outputs = [target.output for target in targets()]
+
+    assert len(outputs) == len(set(outputs))
+    for output in outputs:
+        assert (ASSET_DIR / output).exists()
+        assert (ASSET_DIR / output).with_suffix(".ogg").exists()
+
+
+def test_shipped_assets_are_reproduced_exactly(tmp_path):
+    picked = targets()
+
+    report = build(tmp_path, jobs=2, ogg=False, build_targets=picked)
+
+    assert len(report["rendered"]) == len(picked)
+    for target in picked:
+        assert filecmp.cmp(tmp_path / target.output, ASSET_DIR / target.output, shallow=False)
+
+
+def test_shipped_manifest_matches_the_shipped_assets():
+    # チェックアウト直後のビルドで何も作り直さない (生成スクリプトを変えたらアセットとマニフェストも更新する)
+    report = build(ASSET_DIR, dry_run=True, ogg=False, bundle=False)
+
+    assert report["rendered"] == []
+    assert report["ogg_pending"] == []
+    assert len(report["up_to_date"]) == len(targets())
+
+
+def test_rebuild_skips_unchanged_targets(tmp_path):
+    picked = [target for target in targets() if target.module == "save_sound_assets"]
+    assert len(build(tmp_path, jobs=2, ogg=False, build_targets=picked)["rendered"]) == len(picked)
+
+    again = build(tmp_path, jobs=2, ogg=False, build_targets=picked)
+    assert again["rendered"] == []
+    assert sorted(again["up_to_date"]) == sorted(target.output for target in picked)
+
+    # 引数を変えたものと、消えたものだけ作り直す
+    jump = next(target for target in picked if target.output == "jump.wav")
+    changed = [jump._replace(kwargs={**jump.kwargs, "volume": 0.2}) if target is jump else target for target in picked]
+    (tmp_path / "item.wav").unlink()
+    third = build(tmp_path, jobs=2, ogg=False, build_targets=changed)
+    assert sorted(third["rendered"]) == ["item.wav", "jump.wav"]
+
+
+def test_noise_effects_render_the_same_every_time(tmp_path):
+    hit = Target("hit.wav", "generate_sounds", "render_sound", {"effect_type": "hit"})
+    build_sounds.render_target(hit, tmp_path)
+    first = (tmp_path / "hit.wav").read_bytes()
+
+    build_sounds.render_target(hit, tmp_path)
+
+    assert (tmp_path / "hit.wav").read_bytes() == first
+
+
+def test_ogg_is_left_pending_without_soundfile(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "soundfile", None)
+    shutil.copy(ASSET_DIR / "battle_mode.wav", tmp_path)
+
+    report = build(tmp_path, jobs=1, build_targets=[])
+
+    assert report["ogg_pending"] == ["battle_mode.ogg"]
+    assert report["encoded"] == []
+
+
+def test_encode_ogg_writes_stereo_frames(tmp_path, monkeypatch):
+    written = {}
+
+    def fake_write(path, data, sample_rate, format, subtype):
+        written.update(shape=data.shape, sample_rate=sample_rate, format=format, subtype=subtype)
+        Path(path).write_bytes(b"OggS")
+
+    monkeypatch.setitem(sys.modules, "soundfile", types.SimpleNamespace(write=fake_write))
+    build_sounds.write_wav(tmp_path / "a.wav", np.zeros((100, 2), dtype=np.int16))
+
+    build_sounds.encode_ogg(tmp_path / "a.wav", tmp_path / "a.ogg")
+
+    assert written == {"shape": (100, 2), "sample_rate": 44100, "format": "OGG", "subtype": "VORBIS"}
+    assert (tmp_path / "a.ogg").read_bytes() == b"OggS"
+    assert not (tmp_path / "a.ogg.tmp").exists()
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import pygame
+
+from game.camera import Camera, ZOOM_BUCKET_STEP
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+
+
+def test_identity_camera_maps_world_to_screen_unchanged():
+    camera = Camera()
+    camera.look_at(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, 1.0)
+
+    assert camera.is_identity
+    assert camera.world_to_screen(100, 200) == (100, 200)
+
+
+def test_zoomed_camera_centres_view_and_stays_inside_world():
+    """注視点が画面中央に来て、ワールド端ではビューがはみ出さない"""
+    camera = Camera()
+    camera.look_at(640, 360, 1.5)
+    sx, sy = camera.world_to_screen(640, 360)
+    assert abs(sx - SCREEN_WIDTH / 2) < 1 and abs(sy - SCREEN_HEIGHT / 2) < 1
+    assert camera.scale(10) == 15
+
+    camera.look_at(0, 0, 1.5)
+    assert camera.world_to_screen(0, 0) == (0, 0)
+
+
+def test_zoom_is_quantized_to_buckets():
+    camera = Camera()
+    camera.look_at(640, 360, 1.2371)
+    assert abs(camera.zoom / ZOOM_BUCKET_STEP - round(camera.zoom / ZOOM_BUCKET_STEP)) < 1e-9
+
+
+def test_draw_to_surface_culls_offscreen_entities():
+    """ズーム中に画面外となった弾は描画されない"""
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(screen, enable_audio=False, enable_title_background=False)
+    game.player1.x, game.player1.y = 600, 360
+    game.player2.x, game.player2.y = 680, 360
+
+    visible = MagicMock()
+    visible.get_draw_rect.return_value = pygame.Rect(630, 350, 10, 10)
+    hidden = MagicMock()
+    hidden.get_draw_rect.return_value = pygame.Rect(20, 20, 10, 10)
+    game.projectiles = [visible, hidden]
+
+    game.draw_to_surface(screen)
+
+    assert game.current_zoom > 1.0
+    visible.draw.assert_called_once_with(screen, game.camera)
+    hidden.draw.assert_not_called()
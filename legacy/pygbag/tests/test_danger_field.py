@@ -0,0 +1,87 @@
+import math
+import random
+
+from game.constants import ARENA_CENTER_X, ARENA_CENTER_Y, ARENA_RADIUS
+from game.danger_field import OUTSIDE_DANGER, DangerField
+from game.projectile import BallisticProjectile
+from game.states import AutoTestState
+
+
+def test_projectile_path_is_dangerous_only_for_its_target(game):
+    field = DangerField(sweep_frames=10)
+    proj = BallisticProjectile(ARENA_CENTER_X - 100, ARENA_CENTER_Y, 0.0, 10, game.player2)
+    field.refresh([proj])
+
+    ahead = (ARENA_CENTER_X - 100 + proj.speed * 5, ARENA_CENTER_Y)
+    behind = (ARENA_CENTER_X - 150, ARENA_CENTER_Y)
+    assert field.danger_at(*ahead, player=game.player1) > 0
+    assert field.danger_at(*ahead, player=game.player2) == 0
+    assert field.danger_at(*behind, player=game.player1) == 0
+
+
+def test_border_and_outside_are_dangerous():
+    field = DangerField()
+
+    assert field.danger_at(ARENA_CENTER_X, ARENA_CENTER_Y) == 0
+    assert field.danger_at(ARENA_CENTER_X + ARENA_RADIUS - 5, ARENA_CENTER_Y) > 0
+    assert field.danger_at(ARENA_CENTER_X + ARENA_RADIUS + 50, ARENA_CENTER_Y) == OUTSIDE_DANGER
+
+
+def test_incremental_refresh_matches_full_rebuild(game):
+    """毎フレーム差分更新した結果が、その時点の弾から作り直したグリッドと一致する"""
+    random.seed(5)
+    game.test_duration = float("inf")
+    game.change_state(game.get_state(AutoTestState))
+    game.reset_players()
+
+    field = game.danger_field
+    refresh = field.refresh
+    checked = []
+
+    def checked_refresh(projectiles):
+        refresh(projectiles)
+        fresh = DangerField()
+        fresh.refresh(projectiles)
+        empty = [0] * len(fresh.border)
+        for owner in set(fresh.layers) | set(field.layers):
+            assert field.layers.get(owner, empty) == fresh.layers.get(owner, empty)
+        checked.append(len(projectiles))
+
+    field.refresh = checked_refresh
+    for _ in range(240):
+        game.update()
+
+    assert len(checked) == 240
+    assert max(checked) > 0
+
+
+def test_straight_projectile_is_advanced_not_restamped(game, mocker):
+    field = DangerField()
+    proj = BallisticProjectile(ARENA_CENTER_X, ARENA_CENTER_Y, 0.3, 10, game.player2)
+    field.refresh([proj])
+    stamp = mocker.spy(field, "_stamp")
+
+    proj.x += math.cos(proj.angle) * proj.speed
+    proj.y += math.sin(proj.angle) * proj.speed
+    field.refresh([proj])
+    assert stamp.call_count == 0
+
+    proj.angle += 0.1
+    field.refresh([proj])
+    assert stamp.call_count == 1
+
+    field.refresh([])
+    assert not any(field.layers[game.player2])
+
+
+def test_dodge_moves_off_the_projectile_path(game):
+    player = game.player1
+    player.x, player.y = ARENA_CENTER_X, ARENA_CENTER_Y
+    proj = BallisticProjectile(player.x - 120, player.y, 0.0, 10, game.player2)
+    game.projectiles = [proj]
+    game.danger_field.refresh(game.projectiles)
+
+    dir_x, dir_y = game.ai_controller.choose_dodge_direction(player, proj)
+
+    assert dir_y != 0
+    assert dir_x == 0
@@ -0,0 +1,91 @@
+import random
+
+import pygame
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.dirty_rects import DirtyRectTracker
+from game.game import Game
+from game.states import PauseState, SingleVersusGameState
+
+
+def _present_to(display, screen, tracker):
+    """pygame.display.update(rects) 相当: 変化領域だけを display へ写す"""
+    rects = tracker.flush()
+    if rects is None:
+        display.blit(screen, (0, 0))
+    else:
+        for rect in rects:
+            display.blit(screen, rect, rect)
+    return rects
+
+
+def test_tracker_reports_previous_and_current_rects():
+    """移動物の旧位置も消せるよう、前フレームの矩形も転送対象に含める"""
+    tracker = DirtyRectTracker()
+    assert tracker.flush() is None  # 初回は全画面
+
+    tracker.add((10, 10, 5, 5))
+    assert tracker.flush() == [pygame.Rect(10, 10, 5, 5)]
+
+    tracker.add((100, 100, 5, 5))
+    rects = tracker.flush()
+    assert pygame.Rect(10, 10, 5, 5) in rects
+    assert pygame.Rect(100, 100, 5, 5) in rects
+
+
+def test_tracker_falls_back_to_full_flip():
+    """invalidate() や広すぎる更新領域では全画面転送になる"""
+    tracker = DirtyRectTracker()
+    tracker.flush()
+
+    tracker.add((0, 0, 10, 10))
+    tracker.invalidate()
+    assert tracker.flush() is None
+
+    tracker.add((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+    assert tracker.flush() is None
+
+
+def test_versus_dirty_rects_keep_display_in_sync():
+    """変化領域だけを転送し続けても、全画面描画と同じ画面になる"""
+    pygame.init()
+    random.seed(1)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    display = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(screen, enable_audio=False, enable_title_background=False)
+    game.sounds = {}
+    game.change_state(SingleVersusGameState(game))
+
+    partial_frames = 0
+    for frame in range(120):
+        game.player1.key_states["right"] = frame % 40 < 20
+        game.player1.key_states["left"] = frame % 40 >= 20
+        game.player1.key_states["weapon_a"] = frame % 10 == 0
+        game.update()
+        screen.fill((0, 0, 0))
+        game.draw()
+        if _present_to(display, screen, game.dirty_rects) is not None:
+            partial_frames += 1
+
+    assert partial_frames > 0
+    assert pygame.image.tobytes(display, "RGB") == pygame.image.tobytes(screen, "RGB")
+
+
+def test_pause_menu_only_updates_on_selection_change():
+    """ポーズ中はカーソル移動時のメニュー領域だけが転送される"""
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(screen, enable_audio=False, enable_title_background=False)
+    versus = SingleVersusGameState(game)
+    game.change_state(PauseState(game, versus))
+
+    game.draw()
+    assert game.dirty_rects.flush() is None
+    game.draw()
+    game.dirty_rects.flush()
+    game.draw()
+    assert game.dirty_rects.flush() == []
+
+    game.current_state.handle_input(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_DOWN}))
+    game.draw()
+    assert game.dirty_rects.flush()
@@ -44,6 +44,7 @@ class TestEscKeyHandling(unittest.TestCase):
         pygame.display.set_mode = MagicMock(return_value=MagicMock())
         pygame.mixer.init = MagicMock(return_value=None)
         pygame.mixer.Sound = MagicMock(return_value=MagicMock())
+        pygame.mixer.Channel = MagicMock()
         
         # sys.exitをモック化してテストが終了しないようにする
         self.exit_patcher = patch('sys.exit')
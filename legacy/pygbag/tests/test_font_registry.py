@@ -0,0 +1,30 @@
+from unittest.mock import patch
+
+import pygame
+
+from game.constants import JP_FONT_PATH
+from game.fonts import get_font, preload_fonts
+from game.game import Game
+from game.states import OptionsState, TitleState
+
+
+def test_same_path_and_size_returns_same_font():
+    """(path, size) が同じなら同じ Font インスタンスを返す"""
+    pygame.init()
+    assert get_font(36) is get_font(36)
+    assert get_font(36) is get_font(36, JP_FONT_PATH)
+    assert get_font(36) is not get_font(24)
+    assert get_font(36, path=None) is get_font(36, path=None)
+
+
+def test_state_transitions_do_not_load_fonts_after_preload():
+    """プリロード後の状態遷移ではフォントファイルを読み込まない"""
+    pygame.init()
+    preload_fonts()
+    screen = pygame.Surface((1280, 720))
+    game = Game(screen, enable_audio=False, enable_title_background=False)
+
+    with patch("pygame.font.Font", side_effect=AssertionError("font reloaded")):
+        game.change_state(OptionsState(game))
+        game.change_state(TitleState(game))
+        assert game.hud._make_font(20) is game.make_font(20)
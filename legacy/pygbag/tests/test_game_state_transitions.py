@@ -23,6 +23,7 @@ def mock_pygame_init(mocker):
     mocker.patch("pygame.font.Font", return_value=MagicMock())
     mocker.patch("pygame.font.SysFont", return_value=MagicMock())
     mocker.patch("pygame.mixer.Sound", return_value=MagicMock())
+    mocker.patch("pygame.mixer.Channel", return_value=MagicMock())
     mocker.patch("pygame.mixer.music.load", return_value=None)
     mocker.patch("pygame.mixer.music.play", return_value=None)
     mocker.patch("pygame.mixer.music.set_volume", return_value=None)
@@ -0,0 +1,104 @@
+import itertools
+import sys
+import tracemalloc
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "synth"))
+
+import pattern_export
+from pattern_export import TruePeakLimiter, export_arrangement, limit_blocks, render_blocks
+
+TEMPO = 120
+
+
+def _voices(level=0.2):
+    rng = np.random.default_rng(0)
+    t = np.arange(6000) / 44100
+    kick = np.sin(2 * np.pi * 60 * t) * np.exp(-t * 20)
+    hat = rng.uniform(-1, 1, 2000) * np.exp(-np.arange(2000) / 300)
+    return {0: np.stack([kick, kick], axis=1) * level, 1: np.stack([hat, -hat], axis=1) * level}
+
+
+def _grid(bar=0):
+    return [[col % 4 == 0 for col in range(16)], [(col + bar) % 3 == 0 for col in range(16)]]
+
+
+def _offline_mix(grids, voices):
+    total = pattern_export.arrangement_length(len(grids), TEMPO)
+    out = np.zeros((total + 10000, 2))
+    for start, voice in pattern_export.pattern_hits(grids, TEMPO, voices):
+        out[start:start + len(voice)] += voice
+    return out[:total]
+
+
+def test_streaming_mix_matches_offline_mix():
+    grids = [_grid(bar) for bar in range(3)]
+    voices = _voices()
+
+    streamed = np.concatenate(list(render_blocks(iter(grids), TEMPO, voices, block_size=1000)))
+
+    assert len(streamed) == pattern_export.arrangement_length(3, TEMPO)
+    np.testing.assert_allclose(streamed, _offline_mix(grids, voices), atol=1e-6)
+
+
+def test_limiter_is_transparent_below_ceiling():
+    grids = [_grid(bar) for bar in range(2)]
+    voices = _voices(level=0.2)
+    limiter = TruePeakLimiter()
+
+    limited = np.concatenate(list(limit_blocks(render_blocks(grids, TEMPO, voices, block_size=777), limiter)))
+
+    assert limiter.peak_reduction == 1.0
+    np.testing.assert_allclose(limited, _offline_mix(grids, voices), atol=1e-6)
+
+
+def test_limiter_keeps_true_peak_below_ceiling():
+    grids = [[[True] * 16, [True] * 16]] * 2
+    voices = _voices(level=1.5)
+    limiter = TruePeakLimiter()
+
+    limited = np.concatenate(list(limit_blocks(render_blocks(grids, TEMPO, voices, block_size=512), limiter)))
+
+    assert len(limited) == pattern_export.arrangement_length(2, TEMPO)
+    assert limiter.peak_reduction < 0.5
+    oversampled = resample_poly(limited, 4, 1, axis=0)
+    assert np.abs(oversampled).max() <= pattern_export.TRUE_PEAK_CEILING * 1.02
+
+
+def test_export_honours_filename(tmp_path):
+    target = tmp_path / "songs" / "loop.wav"
+
+    frames = export_arrangement([_grid()] * 2, TEMPO, _voices(), target)
+
+    assert frames == pattern_export.arrangement_length(2, TEMPO)
+    with wave.open(str(target), "rb") as wav_file:
+        assert wav_file.getnchannels() == 2
+        assert wav_file.getnframes() == frames
+
+
+def test_long_arrangement_renders_in_constant_memory(tmp_path):
+    def peak_memory(bars):
+        tracemalloc.start()
+        export_arrangement(itertools.repeat(_grid(), bars), TEMPO, _voices(), tmp_path / f"{bars}.wav")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    short = peak_memory(4)
+    long = peak_memory(64)
+    # 64小節を一度に確保すると 64 * 22050 * 2 * 4 バイト (約11MB) になる
+    assert long < short * 1.5
+    assert long < 2 * 1024 * 1024
+
+
+def test_ogg_requires_soundfile(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "soundfile", None)
+
+    with pytest.raises(RuntimeError, match="soundfile"):
+        export_arrangement([_grid()], TEMPO, _voices(), tmp_path / "loop.ogg")
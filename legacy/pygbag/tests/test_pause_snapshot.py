@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pygame
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.states import PauseState, SingleVersusGameState
+
+
+def _paused_game():
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(screen, enable_audio=False, enable_title_background=False)
+    versus = game.get_state(SingleVersusGameState)
+    game.change_state(versus)
+    versus.handle_escape()
+    return game, versus
+
+
+def test_pause_draws_frozen_game_frame_once():
+    """ポーズ中はゲーム画面を毎フレーム描き直さず、enter 後に一度だけ合成する"""
+    game, versus = _paused_game()
+    versus.draw = MagicMock(wraps=versus.draw)
+
+    for _ in range(5):
+        game.screen.fill((0, 0, 0))
+        game.draw()
+
+    assert versus.draw.call_count == 1
+    assert isinstance(game.current_state, PauseState)
+
+
+def test_pause_snapshot_shows_dimmed_game():
+    game, _ = _paused_game()
+    game.draw()
+
+    x, y = int(game.player1.x), int(game.player1.y)
+    snapshot_pixel = game.current_state.snapshot.get_at((x, y))[:3]
+    assert snapshot_pixel != (0, 0, 0)
+    assert game.screen.get_at((x, y))[:3] == snapshot_pixel
+
+
+def test_pause_snapshot_is_recaptured_on_next_pause():
+    game, versus = _paused_game()
+    game.draw()
+    pause = game.current_state
+    pause.handle_escape()
+    game.player1.x += 50
+    versus.draw = MagicMock(wraps=versus.draw)
+
+    versus.handle_escape()
+    game.draw()
+
+    assert game.current_state is pause
+    versus.draw.assert_called_once_with(pause.snapshot)
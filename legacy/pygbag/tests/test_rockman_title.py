@@ -0,0 +1,40 @@
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "synth"))
+
+import rockman_title
+
+
+def test_render_matches_shipped_wav():
+    with wave.open(str(ROOT / "assets" / "sounds" / "rockman_title.wav"), "rb") as wav_file:
+        shipped = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+
+    rendered = rockman_title.generate_rockman_title()
+
+    assert rendered.dtype == np.int16
+    np.testing.assert_array_equal(rendered, shipped)
+
+
+def test_note_matches_per_sample_definition():
+    note = rockman_title.generate_note(329.63, 0.05, volume=0.3, duty=0.25)
+    period = int(44100 / 329.63)
+    expected = [int(32767 * 0.3) if i % period < period * 0.25 else int(-32767 * 0.3) for i in range(len(note))]
+
+    assert note.tolist() == expected
+
+
+def test_mix_saturates_after_each_part():
+    out = np.empty(3, dtype=np.int16)
+    loud = np.array([30000, 30000, -30000], dtype=np.int32)
+    quiet = np.array([-10000, 0], dtype=np.int32)
+
+    mixed = rockman_title.mix_samples(loud, loud, quiet, out=out)
+
+    assert mixed is out
+    # 1つ足すごとに飽和させるので、32767 から 10000 引いた値になる
+    assert mixed.tolist() == [22767, 32767, -32767]
@@ -0,0 +1,49 @@
+import pytest
+
+from game.ai import MOVEMENT_STYLE_WEIGHTS
+from game.selfplay import elo_table, parse_policy, play_match, policy_name, random_policy_specs
+
+
+def test_parse_policy_accepts_known_specs():
+    assert parse_policy("simple") == ("simple", MOVEMENT_STYLE_WEIGHTS)
+    assert parse_policy("auto_test:1,0,3,2") == ("auto_test", (1, 0, 3, 2))
+    assert policy_name("auto_test", (1, 0, 3, 2)) == "auto_test:1,0,3,2"
+    assert policy_name("auto_test", MOVEMENT_STYLE_WEIGHTS) == "auto_test"
+
+
+@pytest.mark.parametrize("spec", ["random", "hard:1,1,1,1", "auto_test:1,2", "auto_test:0,0,0,0", "auto_test:-1,2,2,2"])
+def test_parse_policy_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_policy(spec)
+
+
+def test_random_policy_specs_are_distinct_and_reproducible():
+    specs = random_policy_specs(20, seed=3)
+
+    assert len(set(specs)) == 20
+    assert "auto_test" not in specs
+    assert specs == random_policy_specs(20, seed=3)
+    for spec in specs:
+        parse_policy(spec)
+
+
+def test_play_match_is_reproducible():
+    first = play_match("auto_test", "simple", seed=7, max_frames=300)
+    second = play_match("auto_test", "simple", seed=7, max_frames=300)
+
+    assert first == second
+    assert first["score"] in (0.0, 0.5, 1.0)
+    assert 0 < first["frames"] <= 300
+
+
+def test_elo_table_ranks_stronger_policy_first():
+    results = [("a", "b", 1.0)] * 9 + [("a", "b", 0.0)] + [("b", "c", 1.0)] * 8 + [("c", "b", 1.0)] * 2
+
+    table = elo_table(results, bootstrap=100)
+
+    assert [row["name"] for row in table] == ["a", "b", "c"]
+    assert sum(row["elo"] for row in table) == pytest.approx(1500 * 3)
+    for row in table:
+        assert row["low"] <= row["elo"] <= row["high"]
+    assert table[0]["games"] == 10
+    assert table[0]["score"] == pytest.approx(0.9)
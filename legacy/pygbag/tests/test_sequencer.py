@@ -0,0 +1,193 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "synth"))
+
+import sequencer
+from pattern_export import arrangement_length, render_blocks
+from sequencer import Sequencer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeChannel:
+    """pygame.mixer.Channel の再生・予約の状態だけを真似る。時刻は FakeClock に従う"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.sound = None
+        self.queued = None
+        self.ends = 0.0
+        self.played = []  # 鳴り始めた順の Sound
+
+    def _advance(self):
+        while self.sound is not None and self.clock.now >= self.ends:
+            self.sound, self.queued = self.queued, None
+            if self.sound is not None:
+                self.played.append(self.sound)
+                self.ends += self.sound.get_length()
+
+    def play(self, sound):
+        self.sound, self.queued = sound, None
+        self.ends = self.clock.now + sound.get_length()
+        self.played.append(sound)
+
+    def queue(self, sound):
+        self._advance()
+        self.queued = sound
+
+    def get_busy(self):
+        self._advance()
+        return self.sound is not None
+
+    def get_queue(self):
+        self._advance()
+        return self.queued
+
+    def stop(self):
+        self.sound = self.queued = None
+
+
+class FakeSound:
+    def __init__(self, pcm):
+        self.pcm = pcm
+
+    def get_length(self):
+        return len(self.pcm) / 44100
+
+
+@pytest.fixture
+def rig(mocker):
+    mocker.patch.object(sequencer.pygame.sndarray, "make_sound", side_effect=FakeSound)
+    mocker.patch.object(sequencer.pygame.mixer, "get_init", return_value=(44100, -16, 2))
+    clock = FakeClock()
+    channel = FakeChannel(clock)
+    t = np.arange(9000) / 44100
+    voices = {0: (np.sin(2 * np.pi * 80 * t) * np.exp(-t * 8) * 0.3), 1: np.full(300, 0.2)}
+    seq = Sequencer(channel, voices, tempo=120, clock=clock)
+    seq.set_pattern([[col % 4 == 0 for col in range(16)], [col % 2 == 1 for col in range(16)]])
+    return seq, channel, clock
+
+
+def _run(seq, clock, seconds, frame=1 / 60):
+    end = clock.now + seconds
+    while clock.now < end:
+        seq.update()
+        clock.now += frame
+
+
+def _played_pcm(channel):
+    return np.concatenate([sound.pcm for sound in channel.played]).astype(np.float64) / 32767
+
+
+def test_keeps_next_bar_queued(rig):
+    seq, channel, clock = rig
+    seq.start()
+    seq.update()
+
+    assert channel.get_busy()
+    assert channel.get_queue() is not None
+    assert len(seq.scheduled) == 2
+    assert seq.scheduled[1].start == pytest.approx(seq.scheduled[0].duration)
+
+
+def test_playback_is_sample_accurate_despite_frame_jitter(rig):
+    seq, channel, clock = rig
+    seq.start()
+    rng = np.random.default_rng(1)
+    while clock.now < 8.5:
+        seq.update()
+        clock.now += rng.uniform(0.005, 0.2)  # 5ms〜200ms のばらついたフレーム
+
+    # 余韻が小節をまたいでつながり、一括でミックスしたものとサンプル単位で一致する
+    played = _played_pcm(channel)
+    offline = np.concatenate(list(render_blocks([seq.pattern] * 5, 120, seq.voices)))
+    # 最初の小節だけリミッタの先読みの分 (latency) 短い
+    assert len(played) >= 4 * arrangement_length(1, 120)
+    count = min(len(played), len(offline))
+    np.testing.assert_allclose(played[:count], offline[:count], atol=2 / 32767)
+    assert seq.stats["underruns"] == 0
+    assert seq.stats["max_refill_delay"] <= 0.2
+
+
+def test_tempo_change_applies_at_next_bar_boundary(rig):
+    seq, channel, clock = rig
+    seq.start()
+    _run(seq, clock, 0.5)
+    first, queued = seq.scheduled
+
+    seq.set_tempo(150)
+    seq.update()
+
+    assert seq.scheduled[0] is first
+    assert seq.scheduled[1] is not queued
+    assert seq.scheduled[1].start == pytest.approx(first.start + first.duration)
+    assert seq.scheduled[1].tempo == 150
+    assert channel.get_queue() is seq.scheduled[1].sound
+    # 作り直した小節の長さは新しいテンポの1小節分
+    assert len(seq.scheduled[1].sound.pcm) == arrangement_length(1, 150)
+
+
+def test_queued_bar_is_kept_right_before_boundary(rig):
+    seq, channel, clock = rig
+    seq.start()
+    seq.update()
+    queued = seq.scheduled[1]
+    clock.now = queued.start - sequencer.RESCHEDULE_MARGIN / 2
+
+    seq.set_tempo(90)
+    seq.update()
+
+    assert seq.scheduled[1] is queued
+    clock.now = queued.start + 0.01
+    seq.update()
+    assert seq.scheduled[1].tempo == 90
+
+
+def test_current_step_follows_audio_clock(rig):
+    seq, channel, clock = rig
+    seq.start()
+    seq.update()
+    start = seq.scheduled[0].start
+
+    clock.now = start + 0.125 * 5 + 0.01
+    assert seq.current_step() == 5
+    # 切り替わりに update() が気づく前でも次の小節の位置を返す
+    clock.now = seq.scheduled[1].start + 0.125 * 2 + 0.01
+    assert seq.current_step() == 2
+
+
+def test_underrun_is_counted_and_recovers(rig):
+    seq, channel, clock = rig
+    seq.start()
+    seq.update()
+    clock.now += 10.0  # 予約した小節も鳴り終わるほど止まっていた
+
+    seq.update()
+
+    assert seq.stats["underruns"] == 1
+    assert channel.get_busy()
+    assert len(seq.scheduled) == 2
+
+
+def test_stop_clears_schedule(rig):
+    seq, channel, clock = rig
+    seq.start()
+    seq.update()
+
+    seq.stop()
+
+    assert not channel.get_busy()
+    assert seq.current_step() is None
+    seq.update()
+    assert not channel.get_busy()
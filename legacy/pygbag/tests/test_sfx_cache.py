@@ -0,0 +1,73 @@
+import importlib
+
+import numpy as np
+import pygame
+
+from game import sound_effects
+
+
+def test_pcm_is_cached_on_disk_and_memory_mapped(tmp_path, mocker):
+    synth = mocker.spy(sound_effects, "synthesize_pcm")
+
+    first = sound_effects.load_pcm("shot", cache_dir=tmp_path)
+    second = sound_effects.load_pcm("shot", cache_dir=tmp_path)
+
+    assert synth.call_count == 1
+    assert isinstance(second, np.memmap)
+    assert second.dtype == np.int16 and second.shape[1] == 2
+    np.testing.assert_array_equal(first, second)
+    assert [p.name for p in tmp_path.iterdir()] == [sound_effects.cache_path("shot", cache_dir=tmp_path).name]
+
+
+def test_key_depends_on_effect_volume_and_version(tmp_path, monkeypatch):
+    path = sound_effects.cache_path("shot", 0.7, tmp_path)
+
+    assert sound_effects.cache_path("shot", 0.5, tmp_path) != path
+    assert sound_effects.cache_path("dash", 0.7, tmp_path) != path
+    monkeypatch.setattr(sound_effects, "SFX_CACHE_VERSION", sound_effects.SFX_CACHE_VERSION + 1)
+    assert sound_effects.cache_path("shot", 0.7, tmp_path) != path
+
+
+def test_new_version_replaces_stale_file(tmp_path, monkeypatch):
+    sound_effects.load_pcm("dash", cache_dir=tmp_path)
+    sound_effects.load_pcm("dash", 0.5, cache_dir=tmp_path)
+    old = sound_effects.cache_path("dash", cache_dir=tmp_path)
+
+    monkeypatch.setattr(sound_effects, "_generator_digest", "changed")
+    sound_effects.load_pcm("dash", cache_dir=tmp_path)
+
+    assert not old.exists()
+    assert sound_effects.cache_path("dash", cache_dir=tmp_path).exists()
+    # 音量違いのファイルは別物として残る
+    assert len(list(tmp_path.glob("dash-0.5-*.npy"))) == 1
+
+
+def test_corrupt_cache_is_regenerated(tmp_path, mocker):
+    path = sound_effects.cache_path("menu_move", cache_dir=tmp_path)
+    path.write_bytes(b"not a numpy file")
+    synth = mocker.spy(sound_effects, "synthesize_pcm")
+
+    pcm = sound_effects.load_pcm("menu_move", cache_dir=tmp_path)
+
+    assert synth.call_count == 1
+    np.testing.assert_array_equal(np.load(path), pcm)
+
+
+def test_unwritable_cache_dir_still_returns_pcm(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    pcm = sound_effects.load_pcm("menu_select", cache_dir=blocker / "sfx")
+
+    assert pcm.dtype == np.int16 and len(pcm) > 0
+
+
+def test_import_does_not_generate_or_write_sounds(mocker):
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    store = mocker.patch("numpy.save")
+
+    module = importlib.reload(sound_effects)
+
+    assert module.sound_cache == {}
+    store.assert_not_called()
@@ -0,0 +1,179 @@
+import pygame
+import pytest
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.states import OptionsState
+from game.voices import BGM_CHANNEL, SFX_CHANNELS, SFX_POLYPHONY, SFX_VOLUME, VoiceManager
+
+
+class FakeChannel:
+    def __init__(self, sound):
+        self.sound = sound
+        self.busy = True
+        self.volume = 1.0
+
+    def get_busy(self):
+        return self.busy
+
+    def get_sound(self):
+        return self.sound
+
+    def stop(self):
+        self.busy = False
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+
+class FakeSound:
+    """play() のたびに新しいチャンネルを返す。free が 0 になったら None (空きなし)"""
+
+    def __init__(self, name, free=None):
+        self.name = name
+        self.free = free
+        self.channels = []
+
+    def play(self):
+        if self.free is not None:
+            if self.free == 0:
+                return None
+            self.free -= 1
+        channel = FakeChannel(self)
+        self.channels.append(channel)
+        return channel
+
+
+@pytest.fixture
+def manager():
+    return VoiceManager(configure_mixer=False)
+
+
+def test_same_frame_requests_are_coalesced_with_stacked_volume(manager):
+    shot = FakeSound("shot")
+    for _ in range(4):
+        manager.request("shot", shot)
+
+    manager.flush()
+
+    assert len(shot.channels) == 1
+    assert shot.channels[0].volume == pytest.approx(min(1.0, SFX_VOLUME * 2))
+    assert manager.stats["coalesced"] == 3
+    assert manager.stats["played"] == 1
+
+
+def test_polyphony_limit_restarts_oldest_voice(manager):
+    shot = FakeSound("shot")
+    for _ in range(SFX_POLYPHONY["shot"] + 2):
+        manager.request("shot", shot)
+        manager.flush()
+
+    assert manager.active("shot") == SFX_POLYPHONY["shot"]
+    assert not shot.channels[0].busy and not shot.channels[1].busy
+    assert manager.stats["stolen"] == 2
+
+
+def test_hit_takes_channel_from_shot_but_not_the_reverse():
+    manager = VoiceManager(max_voices=2, configure_mixer=False)
+    shot, hit, special = FakeSound("shot"), FakeSound("hit"), FakeSound("special")
+    manager.request("hit", hit)
+    manager.request("special", special)
+    manager.flush()
+
+    manager.request("shot", shot)
+    manager.flush()
+    assert shot.channels == []
+    assert manager.stats["dropped"] == 1
+
+    manager.request("hit", hit)
+    manager.flush()
+    # 空きがないので、優先度の低い special を止めて hit を鳴らす
+    assert not special.channels[0].busy
+    assert manager.active("hit") == 2
+
+
+def test_higher_priority_is_served_first_within_a_frame():
+    manager = VoiceManager(max_voices=1, configure_mixer=False)
+    shot, hit = FakeSound("shot"), FakeSound("hit")
+    manager.request("shot", shot)
+    manager.request("hit", hit)
+
+    manager.flush()
+
+    assert manager.active("hit") == 1
+    assert manager.active("shot") == 0
+    assert manager.stats["dropped"] == 1
+
+
+def test_finished_voices_free_their_slot(manager):
+    shot = FakeSound("shot")
+    for _ in range(3):
+        manager.request("shot", shot)
+        manager.flush()
+    for channel in shot.channels:
+        channel.busy = False
+
+    manager.request("shot", shot)
+    manager.flush()
+
+    assert manager.stats["stolen"] == 0
+    assert manager.active() == 1
+
+
+def test_unloaded_sound_is_counted_as_dropped(manager):
+    manager.request("hit", FakeSound("hit", free=0))
+    manager.flush()
+
+    assert manager.stats["dropped"] == 1
+    assert manager.voices == []
+
+
+def test_bullet_spam_leaves_a_channel_for_bgm():
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_title_background=False)
+    game.audio.wait(timeout=10)
+    game.audio.poll()
+    assert pygame.mixer.get_num_channels() == SFX_CHANNELS + 1
+
+    for _ in range(30):
+        for name in ("shot", "hit", "shield", "hyper", "special"):
+            for _ in range(10):
+                game.play_sfx(name)
+        game.voices.flush()
+        assert game.voices.active() <= SFX_CHANNELS
+        for name, limit in SFX_POLYPHONY.items():
+            assert game.voices.active(name) <= limit
+
+    assert game.voices.stats["coalesced"] == 30 * 5 * 9
+    # タイトルの BGM は予約チャンネルで鳴り続けている
+    assert pygame.mixer.Channel(BGM_CHANNEL).get_sound() is game.title_bgm.sound
+
+
+def test_voice_whose_channel_was_reused_is_not_stolen(manager):
+    menu, bgm = FakeSound("menu"), FakeSound("bgm")
+    manager.play("menu", menu)
+    # 効果音が鳴り終わり、同じチャンネルで別の音 (BGM) が鳴り始めた
+    channel = menu.channels[0]
+    channel.sound = bgm
+
+    manager.play("menu", menu)
+
+    assert channel.busy
+    assert manager.stats["stolen"] == 0
+    assert manager.active("menu") == 1
+
+
+def test_menu_sound_does_not_stop_title_bgm():
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_title_background=False)
+    game.audio.wait(timeout=10)
+    game.audio.poll()
+    # オプション画面で操作音を鳴らし、鳴り終わってからタイトルに戻る
+    game.change_state(game.get_state(OptionsState))
+    game.handle_keydown(pygame.K_DOWN)
+    game.sounds["menu"].stop()
+    game.handle_keydown(pygame.K_ESCAPE)
+    assert game.title_bgm_playing
+
+    game.handle_keydown(pygame.K_DOWN)
+
+    assert game.title_bgm.sound.get_num_channels() == 1
+    assert pygame.mixer.Channel(BGM_CHANNEL).get_sound() is game.title_bgm.sound
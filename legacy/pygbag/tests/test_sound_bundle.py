@@ -0,0 +1,142 @@
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pygame
+
+from game.audio_assets import AudioAssets
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.sound_bundle import ALIGN, BUNDLE_NAME, BUNDLED_SOUNDS, SoundBundle, write_bundle
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "synth"))
+
+import build_sounds
+
+ASSET_DIR = ROOT / "assets" / "sounds"
+
+
+def _pcm(frames, value):
+    return np.full((frames, 2), value, dtype=np.int16)
+
+
+def _fake_mixer(mocker, init=(44100, -16, 2)):
+    created = []
+
+    def make(*args, **kwargs):
+        created.append(bytes(kwargs["buffer"]) if "buffer" in kwargs else args[0])
+        return MagicMock()
+
+    mocker.patch("game.audio_assets.pygame.mixer.Sound", side_effect=make)
+    mocker.patch("game.audio_assets.pygame.mixer.get_init", return_value=init)
+    return created
+
+
+def test_bundle_round_trip(tmp_path):
+    path = tmp_path / BUNDLE_NAME
+    write_bundle(path, {"menu": (_pcm(3, 7), 44100), "shot": (_pcm(10, -2), 22050)})
+
+    bundle = SoundBundle.open(path)
+
+    assert set(bundle.names()) == {"menu", "shot"}
+    assert bytes(bundle.buffer("menu")) == _pcm(3, 7).tobytes()
+    assert bytes(bundle.buffer("shot")) == _pcm(10, -2).tobytes()
+    assert bundle.entries["shot"]["frequency"] == 22050
+    assert all((bundle._base + entry["offset"]) % ALIGN == 0 for entry in bundle.entries.values())
+
+
+def test_without_mmap_each_sound_is_read_when_it_is_made(tmp_path, mocker):
+    path = tmp_path / BUNDLE_NAME
+    write_bundle(path, {"menu": (_pcm(3, 7), 44100), "shot": (_pcm(10, -2), 22050)})
+    mocker.patch("game.sound_bundle.mmap.mmap", side_effect=OSError)
+
+    bundle = SoundBundle.open(path)
+    # 開いた時点では PCM を読んでいない (書き換えた後の中身が読める)
+    write_bundle(path, {"menu": (_pcm(3, 5), 44100), "shot": (_pcm(10, -2), 22050)})
+
+    assert bundle.buffer("menu") == _pcm(3, 5).tobytes()
+    assert bundle.buffer("shot") == _pcm(10, -2).tobytes()
+
+
+def test_missing_or_broken_bundle_is_ignored(tmp_path):
+    assert SoundBundle.open(tmp_path / "missing.bundle") is None
+    (tmp_path / "broken.bundle").write_bytes(b"not a bundle")
+    assert SoundBundle.open(tmp_path / "broken.bundle") is None
+    (tmp_path / "empty.bundle").write_bytes(b"")
+    assert SoundBundle.open(tmp_path / "empty.bundle") is None
+
+
+def test_assets_are_made_from_the_bundle_without_opening_files(tmp_path, mocker):
+    write_bundle(tmp_path / BUNDLE_NAME, {"menu": (_pcm(4, 1), 44100)})
+    created = _fake_mixer(mocker)
+    assets = AudioAssets(SoundBundle.open(tmp_path / BUNDLE_NAME))
+
+    # ファイルがなくても、バンドルに入っていれば登録できる
+    menu = assets.register("menu", str(tmp_path / "menu.ogg"))
+    assert assets.register("shot", str(tmp_path / "shot.ogg")) is None
+    assets.load_all()
+
+    assert menu.ready
+    assert created == [_pcm(4, 1).tobytes()]
+
+
+def test_mixer_format_mismatch_falls_back_to_the_file(tmp_path, mocker):
+    write_bundle(tmp_path / BUNDLE_NAME, {"menu": (_pcm(4, 1), 44100)})
+    (tmp_path / "menu.ogg").write_bytes(b"")
+    created = _fake_mixer(mocker, init=(48000, -16, 2))
+    assets = AudioAssets(SoundBundle.open(tmp_path / BUNDLE_NAME))
+
+    assets.register("menu", str(tmp_path / "menu.ogg"))
+    assets.load_all()
+
+    assert created == [str(tmp_path / "menu.ogg")]
+
+
+def test_build_bundles_the_game_sounds_once(tmp_path):
+    for name in ("menu.wav", "rockman_title.wav", "battle_mode.wav"):
+        shutil.copy(ASSET_DIR / name, tmp_path)
+
+    report = build_sounds.build(tmp_path, jobs=1, ogg=False, build_targets=[])
+
+    # ゲームで使わない battle_mode は入れない
+    assert report["bundled"] == ["menu.wav", "rockman_title.wav"]
+    bundle = SoundBundle.open(tmp_path / BUNDLE_NAME)
+    assert set(bundle.names()) == {"menu", "rockman_title"}
+    stereo, _ = build_sounds.read_wav(ASSET_DIR / "menu.wav")
+    assert bytes(bundle.buffer("menu")) == stereo.tobytes()
+    mono, _ = build_sounds.read_wav(ASSET_DIR / "rockman_title.wav")
+    assert bytes(bundle.buffer("rockman_title")) == np.repeat(mono, 2, axis=1).tobytes()
+    assert bundle.entries["rockman_title"]["channels"] == 2
+
+    assert build_sounds.build(tmp_path, jobs=1, ogg=False, build_targets=[])["bundled"] == []
+
+
+def test_bundle_build_leaves_the_committed_manifest_alone(tmp_path):
+    shutil.copy(ASSET_DIR / "menu.wav", tmp_path)
+    shutil.copy(ASSET_DIR / build_sounds.MANIFEST_NAME, tmp_path)
+    manifest = (tmp_path / build_sounds.MANIFEST_NAME).read_bytes()
+
+    assert build_sounds.build(tmp_path, jobs=1, ogg=False, build_targets=[])["bundled"] == ["menu.wav"]
+    assert build_sounds.build(tmp_path, jobs=1, ogg=False, build_targets=[])["bundled"] == []
+
+    assert (tmp_path / build_sounds.MANIFEST_NAME).read_bytes() == manifest
+
+
+def test_bundle_sounds_can_be_chosen_at_build_time(tmp_path):
+    for name in ("menu.wav", "rockman_title.wav"):
+        shutil.copy(ASSET_DIR / name, tmp_path)
+
+    report = build_sounds.build(tmp_path, jobs=1, ogg=False, build_targets=[], bundle_sounds=["menu"])
+
+    assert report["bundled"] == ["menu.wav"]
+    assert SoundBundle.open(tmp_path / BUNDLE_NAME).names() == ["menu"]
+
+
+def test_bundled_sounds_are_the_game_sounds():
+    game = Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_title_background=False)
+
+    keys = {sound.key for sound in list(game.sounds.values()) + [game.title_bgm]}
+    assert keys == set(BUNDLED_SOUNDS)
@@ -0,0 +1,119 @@
+import pygame
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.states import (
+    PREWARM_STATE_CLASSES,
+    KeyConfigState,
+    OptionsState,
+    PauseState,
+    SingleVersusGameState,
+    TitleState,
+)
+
+
+def _make_game():
+    pygame.init()
+    return Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_audio=False, enable_title_background=False)
+
+
+def _press(game, key):
+    game.current_state.handle_input(pygame.event.Event(pygame.KEYDOWN, {"key": key}))
+
+
+def test_get_state_returns_same_instance_per_class():
+    game = _make_game()
+    title = game.current_state
+
+    assert game.get_state(TitleState) is title
+    options = game.get_state(OptionsState)
+    assert game.get_state(OptionsState) is options
+    assert options.previous_state is title
+
+
+def test_title_to_options_and_back_reuses_instances():
+    """タイトル ⇔ オプションを往復しても状態は作り直されず、カーソルは enter で初期化される"""
+    game = _make_game()
+    title = game.current_state
+    title.selected_item = title.menu_items.index("オプション")
+
+    _press(game, pygame.K_RETURN)
+    options = game.current_state
+    assert isinstance(options, OptionsState)
+
+    _press(game, pygame.K_ESCAPE)
+    assert game.current_state is title
+    assert title.selected_item == 0
+
+    title.selected_item = title.menu_items.index("オプション")
+    _press(game, pygame.K_RETURN)
+    assert game.current_state is options
+
+
+def test_options_cursor_resets_from_title_but_not_after_key_config():
+    game = _make_game()
+    title = game.current_state
+    title.selected_item = title.menu_items.index("オプション")
+    _press(game, pygame.K_RETURN)
+    options = game.current_state
+    _press(game, pygame.K_DOWN)
+    _press(game, pygame.K_z)  # プレイヤー2設定
+    assert isinstance(game.current_state, KeyConfigState)
+
+    game.current_state.handle_escape()
+    assert game.current_state is options
+    assert options.selected_item == 1
+
+    _press(game, pygame.K_ESCAPE)
+    assert game.current_state is title
+    title.selected_item = title.menu_items.index("オプション")
+    _press(game, pygame.K_RETURN)
+    assert game.current_state is options
+    assert options.selected_item == 0
+
+
+def test_pause_is_reused_and_reset_on_each_visit():
+    game = _make_game()
+    versus = game.get_state(SingleVersusGameState)
+    game.change_state(versus)
+
+    versus.handle_escape()
+    pause = game.current_state
+    assert isinstance(pause, PauseState)
+    assert pause.previous_state is versus
+    _press(game, pygame.K_DOWN)
+
+    _press(game, pygame.K_ESCAPE)
+    assert game.current_state is versus
+    versus.handle_escape()
+    assert game.current_state is pause
+    assert pause.selected_item == 0
+
+
+def test_key_config_syncs_selected_player_on_enter():
+    game = _make_game()
+    options = game.get_state(OptionsState)
+    game.key_config_player = 1
+    game.change_state(game.get_state(KeyConfigState, previous_state=options))
+    key_config = game.current_state
+
+    game.change_state(options)
+    game.key_config_player = 2
+    game.change_state(game.get_state(KeyConfigState, previous_state=options))
+
+    assert game.current_state is key_config
+    assert key_config.player == 2
+
+
+def test_title_prewarms_one_state_per_idle_frame():
+    game = _make_game()
+    created = len(game.states)
+
+    game.update()
+    assert len(game.states) == created + 1
+
+    for _ in range(len(PREWARM_STATE_CLASSES)):
+        game.update()
+    assert all(state_class in game.states for state_class in PREWARM_STATE_CLASSES)
+    assert game.prewarm_state() is False
+    assert isinstance(game.current_state, TitleState)
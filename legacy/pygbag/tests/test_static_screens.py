@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+import pygame
+import pytest
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.i18n import get_language, set_language
+from game.states import InstructionsState, KeyConfigState, OptionsState
+
+
+@pytest.fixture
+def restore_language():
+    language = get_language()
+    yield
+    set_language(language)
+
+
+def _enter(game, state_class):
+    state = game.get_state(state_class)
+    game.change_state(state)
+    state.compose = MagicMock(wraps=state.compose)
+    return state
+
+
+@pytest.mark.parametrize("state_class", [InstructionsState, OptionsState, KeyConfigState])
+def test_static_screen_is_composed_once(game, state_class):
+    state = _enter(game, state_class)
+
+    for _ in range(5):
+        game.draw()
+
+    assert state.compose.call_count == 1
+
+
+def test_options_recomposes_after_input_only(game):
+    state = _enter(game, OptionsState)
+    game.draw()
+    game.dirty_rects.flush()
+    game.draw()
+    assert game.dirty_rects.flush() == []
+
+    state.handle_input(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_DOWN}))
+    game.draw()
+
+    assert state.compose.call_count == 2
+    assert game.dirty_rects.flush() is None
+    # カーソル位置の変化が画面に反映されている
+    fresh = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    OptionsState.compose(state, fresh)
+    assert pygame.image.tobytes(fresh, "RGB") == pygame.image.tobytes(game.screen, "RGB")
+
+
+def test_key_remap_invalidates_key_config_screen(game):
+    game.key_config_player = 1
+    game.key_config_selected_item = 0
+    game.waiting_for_key_input = False
+    state = _enter(game, KeyConfigState)
+    game.draw()
+
+    state.waiting_for_input = True
+    state.handle_input(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_p}))
+    game.draw()
+
+    assert state.compose.call_count == 2
+
+
+def test_language_switch_recomposes(game, restore_language):
+    state = _enter(game, InstructionsState)
+    game.draw()
+
+    set_language("en" if get_language() != "en" else "ja")
+    game.draw()
+
+    assert state.compose.call_count == 2
@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+import pygame
+
+from game.game import Game
+from game.i18n import get_language, set_language
+from game.text_cache import TextSurfaceCache, get_text_cache
+
+
+def _counting_font():
+    font = MagicMock()
+    font.render.side_effect = lambda text, aa, color: pygame.Surface((len(text) + 1, 10))
+    return font
+
+
+def test_same_text_is_rendered_once():
+    """同じ (フォント, 文字列, 色) は一度しかラスタライズされない"""
+    cache = TextSurfaceCache()
+    font = _counting_font()
+
+    first = cache.render(font, "ヒート: 10%", (255, 255, 255))
+    second = cache.render(font, "ヒート: 10%", (255, 255, 255))
+
+    assert first is second
+    assert font.render.call_count == 1
+    assert cache.hits == 1 and cache.misses == 1
+
+    cache.render(font, "ヒート: 11%", (255, 255, 255))
+    cache.render(font, "ヒート: 10%", (255, 0, 0))
+    assert font.render.call_count == 3
+
+
+def test_language_is_part_of_the_key():
+    """言語を切り替えると同じ文字列でも別エントリになる"""
+    cache = TextSurfaceCache()
+    font = _counting_font()
+    original = get_language()
+    try:
+        set_language("ja")
+        cache.render(font, "OVERHEAT", (255, 165, 0))
+        set_language("en")
+        cache.render(font, "OVERHEAT", (255, 165, 0))
+    finally:
+        set_language(original)
+
+    assert font.render.call_count == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    """上限を超えると最も古く使われたエントリから捨てられる"""
+    cache = TextSurfaceCache(max_entries=2)
+    font = _counting_font()
+
+    cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "b", (0, 0, 0))
+    cache.render(font, "a", (0, 0, 0))  # a を最近使用にする
+    cache.render(font, "c", (0, 0, 0))  # b が追い出される
+
+    assert len(cache) == 2
+    cache.render(font, "a", (0, 0, 0))
+    assert font.render.call_count == 3
+    cache.render(font, "b", (0, 0, 0))
+    assert font.render.call_count == 4
+
+
+def test_hud_reuses_surfaces_while_values_are_unchanged():
+    """HUD は数値が変わらない限り2フレーム目以降ラスタライズしない"""
+    pygame.init()
+    screen = pygame.Surface((1280, 720))
+    game = Game(screen, enable_audio=False, enable_title_background=False)
+    cache = get_text_cache()
+
+    game.hud.draw(screen)
+    misses = cache.misses
+    game.hud.draw(screen)
+    assert cache.misses == misses
+
+    game.player1.heat += 5
+    game.hud.draw(screen)
+    assert cache.misses == misses + 1
@@ -0,0 +1,87 @@
+import math
+import random
+
+import pytest
+
+from game.projectile import BallisticProjectile, BeamProjectile, MeleeProjectile
+from game.threats import THREAT_VECTORIZE_MIN, evaluate_threats
+
+
+def _reference_prediction(player, projectiles):
+    """弾ごとに二次方程式を解く従来のスカラー版 (比較用)"""
+    closest_hit_time = float("inf")
+    closest = None
+    for proj in projectiles:
+        if proj.owner == player:
+            continue
+        proj_vx = math.cos(proj.angle) * proj.speed
+        proj_vy = math.sin(proj.angle) * proj.speed
+        dx = player.x - proj.x
+        dy = player.y - proj.y
+        a = proj_vx * proj_vx + proj_vy * proj_vy
+        b = 2 * (proj_vx * dx + proj_vy * dy)
+        c = dx * dx + dy * dy - (player.radius + proj.radius) * (player.radius + proj.radius)
+        discriminant = b * b - 4 * a * c
+        if discriminant < 0 or a <= 0:
+            continue
+        t1 = (-b - math.sqrt(discriminant)) / (2 * a)
+        t2 = (-b + math.sqrt(discriminant)) / (2 * a)
+        hit_time = t1 if t1 > 0 else (t2 if t2 > 0 else None)
+        if hit_time is not None and hit_time < closest_hit_time and hit_time < 60:
+            closest_hit_time = hit_time
+            closest = (proj, hit_time, proj.x + proj_vx * hit_time, proj.y + proj_vy * hit_time)
+    return closest
+
+
+def _random_projectiles(game, count, seed):
+    rng = random.Random(seed)
+    kinds = (BeamProjectile, BallisticProjectile, MeleeProjectile)
+    projectiles = []
+    for _ in range(count):
+        owner = game.player2 if rng.random() < 0.8 else game.player1
+        # 半分はプレイヤー1を狙う弾にする
+        x, y = rng.uniform(200, 1000), rng.uniform(100, 600)
+        if rng.random() < 0.5:
+            angle = math.atan2(game.player1.y - y, game.player1.x - x) + rng.uniform(-0.05, 0.05)
+        else:
+            angle = rng.uniform(0, 2 * math.pi)
+        projectiles.append(rng.choice(kinds)(x, y, angle, 5, owner))
+    return projectiles
+
+
+@pytest.mark.parametrize("count", [0, 3, THREAT_VECTORIZE_MIN - 1, THREAT_VECTORIZE_MIN, 200])
+@pytest.mark.parametrize("seed", range(5))
+def test_threat_table_matches_scalar_prediction(game, count, seed):
+    """配列演算・スカラーどちらの経路でも従来版と同じ弾・着弾時間・着弾位置になる"""
+    projectiles = _random_projectiles(game, count, seed)
+    expected = _reference_prediction(game.player1, projectiles)
+
+    actual = evaluate_threats(game.player1, projectiles).earliest()
+
+    if expected is None:
+        assert actual is None
+    else:
+        assert actual[0] is expected[0]
+        assert actual[1:] == pytest.approx(expected[1:], abs=1e-9)
+
+
+@pytest.mark.parametrize("count", [5, THREAT_VECTORIZE_MIN + 5])
+def test_threat_table_lists_every_hostile_projectile(game, count):
+    projectiles = _random_projectiles(game, count, seed=7)
+    table = evaluate_threats(game.player1, projectiles)
+
+    hostile = [proj for proj in projectiles if proj.owner is not game.player1]
+    assert table.projectiles == hostile
+    assert len(table.hit_times) == len(table.distances) == len(hostile)
+    nearest = min(math.hypot(p.x - game.player1.x, p.y - game.player1.y) for p in hostile)
+    assert table.any_within(nearest + 1e-6)
+    assert not table.any_within(nearest - 1e-6)
+
+
+def test_controller_helpers_share_one_table(game):
+    game.projectiles = _random_projectiles(game, 10, seed=3)
+    table = game.ai_controller.evaluate_threats(game.player1)
+
+    assert game.ai_controller.predict_projectile_collision(game.player1, table) == table.earliest()
+    assert game.predict_projectile_collision(game.player1) == table.earliest()
+    assert game.is_projectile_nearby(game.player1, 70) == table.any_within(70)
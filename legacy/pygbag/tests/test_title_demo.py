@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+
+import pygame
+
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.states import AutoTestState, OptionsState, TitleState
+from game.title_demo import TitleDemo
+
+
+def _make_game():
+    pygame.init()
+    return Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), enable_audio=False)
+
+
+def test_title_demo_is_reused_across_title_visits():
+    """タイトルに戻っても背景デモの Game は作り直されない"""
+    game = _make_game()
+    demo = game.current_state.demo
+    assert isinstance(demo, TitleDemo)
+    assert isinstance(demo.game.current_state, AutoTestState)
+
+    game.change_state(OptionsState(game))
+    game.change_state(TitleState(game))
+
+    assert game.current_state.demo is demo
+
+
+def test_title_demo_simulates_at_reduced_rate():
+    """update_interval フレームに1回だけシミュレーションを進める"""
+    game = _make_game()
+    demo = TitleDemo(game, update_interval=3)
+    demo.game.update = MagicMock()
+
+    for _ in range(9):
+        demo.update()
+
+    assert demo.game.update.call_count == 3
+
+
+def test_title_demo_renders_low_res_only_on_new_frames():
+    """新しいシミュレーションフレームがあるときだけ縮小バッファに描き直す"""
+    game = _make_game()
+    demo = TitleDemo(game, update_interval=2, resolution_scale=0.5)
+    assert demo.low_res_surface.get_size() == (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    demo.game.draw_to_surface = MagicMock(wraps=demo.game.draw_to_surface)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    demo.draw(screen)
+    demo.update()  # 1フレーム目: シミュレーションなし
+    demo.draw(screen)
+    demo.update()  # 2フレーム目: シミュレーションあり
+    demo.draw(screen)
+
+    assert demo.game.draw_to_surface.call_count == 2
+    assert screen.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))[:3] != (0, 0, 0)
+
+
+def test_title_demo_restarts_after_configured_time():
+    game = _make_game()
+    demo = TitleDemo(game, update_interval=1, restart_seconds=1)
+    for _ in range(59):
+        demo.update()
+    demo.game.reset_players = MagicMock()
+
+    demo.update()
+
+    demo.game.reset_players.assert_called_once()
+    assert demo.frame_count == 0
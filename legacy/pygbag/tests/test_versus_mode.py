@@ -32,6 +32,7 @@ class TestVersusMode(unittest.TestCase):
         pygame.display.set_mode = MagicMock(return_value=cls.mock_screen)
         pygame.mixer.init = MagicMock()
         pygame.mixer.Sound = MagicMock(return_value=MagicMock(play=MagicMock()))
+        pygame.mixer.Channel = MagicMock()
         pygame.quit = MagicMock()
 
     @classmethod
@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "synth"))
+
+import wavetable
+
+SAMPLE_RATE = wavetable.SAMPLE_RATE
+
+
+def naive(waveform, frequency, length):
+    """synthesizer がもともと使っていた式"""
+    t = np.arange(length) / SAMPLE_RATE
+    if waveform == wavetable.SINE:
+        return np.sin(2 * np.pi * frequency * t)
+    if waveform == wavetable.SQUARE:
+        return np.sign(np.sin(2 * np.pi * frequency * t))
+    if waveform == wavetable.SAW:
+        return 2 * (t * frequency - np.floor(0.5 + t * frequency))
+    return 2 * np.abs(2 * (t * frequency - np.floor(t * frequency + 0.5))) - 1
+
+
+def alias_ratio(wave, frequency):
+    """倍音以外の周波数に出ている成分の割合 (dB)"""
+    spectrum = np.abs(np.fft.rfft(wave * np.hanning(len(wave)))) ** 2
+    freqs = np.fft.rfftfreq(len(wave), 1 / SAMPLE_RATE)
+    harmonic = np.zeros(len(freqs), dtype=bool)
+    for k in range(1, int(SAMPLE_RATE / 2 / frequency) + 1):
+        harmonic |= np.abs(freqs - k * frequency) < 6
+    return 10 * np.log10(spectrum[~harmonic].sum() / spectrum[harmonic].sum())
+
+
+@pytest.mark.parametrize("waveform", [wavetable.SQUARE, wavetable.SAW])
+def test_high_notes_do_not_alias(waveform):
+    frequency = 3001.0
+
+    wave = wavetable.render(waveform, frequency, SAMPLE_RATE)
+
+    assert alias_ratio(wave, frequency) < -80
+    assert alias_ratio(naive(waveform, frequency, SAMPLE_RATE), frequency) > -20
+
+
+@pytest.mark.parametrize("waveform", wavetable.WAVEFORMS)
+def test_low_notes_keep_the_original_shape(waveform):
+    wave = wavetable.render(waveform, 110.0, 4410)
+
+    assert np.corrcoef(wave, naive(waveform, 110.0, 4410))[0, 1] > 0.99
+    assert np.max(np.abs(wave)) <= 1.0 + 1e-12
+
+
+def test_tables_stay_below_nyquist_for_their_level():
+    values, _ = wavetable.mipmaps(wavetable.SAW)
+    frequency = 1000.0
+    level = wavetable.mip_level(frequency)
+
+    harmonics = np.nonzero(np.abs(np.fft.rfft(values[level])) > 1e-9)[0]
+
+    assert harmonics.max() * frequency < SAMPLE_RATE / 2
+    assert 2 * harmonics.max() * frequency >= SAMPLE_RATE / 2  # 1つ上のレベルでは超える
+
+
+def test_batch_matches_single_notes():
+    frequencies = [55.0, 440.0, 2500.0]
+
+    batch = wavetable.render_notes(wavetable.SQUARE, frequencies, 1000)
+
+    for row, frequency in zip(batch, frequencies):
+        np.testing.assert_array_equal(row, wavetable.render(wavetable.SQUARE, frequency, 1000))
+
+
+def test_oscillator_continues_phase_across_calls():
+    oscillator = wavetable.Oscillator(wavetable.SAW)
+    sweep = np.linspace(300.0, 320.0, 3000)
+
+    parts = [oscillator.render(440.0, 1000), oscillator.render(440.0, 777), oscillator.render(sweep, 3000)]
+
+    whole = np.concatenate([
+        wavetable.render(wavetable.SAW, 440.0, 1777),
+        wavetable.render(wavetable.SAW, sweep, 3000, phase=1777 * 440.0 / SAMPLE_RATE),
+    ])
+    np.testing.assert_allclose(np.concatenate(parts), whole, atol=1e-4)
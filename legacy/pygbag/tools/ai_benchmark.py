@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+自動テスト AI の思考間隔ごとのコスト計測スクリプト
+使用方法: python tools/ai_benchmark.py [--frames 1800] [--intervals 1 2 4]
+
+各思考間隔で同じシードの自動テスト対戦をヘッドレスで回し、
+1フレーム (update + draw) のうち AI 入力の決定に使った時間の割合を表示する。
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pygame
+
+from game.ai_scheduler import AIScheduler
+from game.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.game import Game
+from game.states import AutoTestState
+
+
+def run(think_interval, frames, seed):
+    """1つの思考間隔で対戦を回し、(AI 時間, フレーム時間, 思考回数) を返す"""
+    random.seed(seed)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(screen, enable_audio=False, enable_title_background=False)
+    game.sounds = {}
+    game.test_duration = float("inf")
+    game.ai_scheduler = AIScheduler(game.ai_controller, think_interval=think_interval)
+    game.change_state(game.get_state(AutoTestState))
+    game.reset_players()
+
+    ai_time = 0.0
+    control = game.ai_scheduler.control
+
+    def timed_control(player, opponent, is_player1=True):
+        nonlocal ai_time
+        start = time.perf_counter()
+        keys = control(player, opponent, is_player1)
+        ai_time += time.perf_counter() - start
+        return keys
+
+    game.ai_scheduler.control = timed_control
+
+    frame_time = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.update()
+        game.draw()
+        frame_time += time.perf_counter() - start
+        if not isinstance(game.current_state, AutoTestState):
+            # 決着したら同じ条件で続行する
+            game.change_state(game.get_state(AutoTestState))
+            game.reset_players()
+
+    return ai_time, frame_time, game.ai_scheduler.think_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 思考間隔ごとのフレーム時間に占める AI の割合")
+    parser.add_argument("--frames", type=int, default=1800)
+    parser.add_argument("--intervals", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{'間隔':>4} {'思考回数':>8} {'AI ms/frame':>12} {'frame ms':>9} {'AI 割合':>8}")
+    for interval in args.intervals:
+        ai_time, frame_time, thinks = run(interval, args.frames, args.seed)
+        print(
+            f"{interval:>3}x {thinks:>10} {ai_time * 1000 / args.frames:>12.3f} "
+            f"{frame_time * 1000 / args.frames:>9.3f} {ai_time / frame_time:>8.1%}"
+        )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
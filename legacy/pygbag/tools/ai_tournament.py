@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+AI 方策同士の総当たり自己対戦と Elo レーティング集計スクリプト
+使用方法:
+    python tools/ai_tournament.py --variants auto_test simple hard
+    python tools/ai_tournament.py --random-variants 61 --variants auto_test simple hard --games 2
+
+方策の表記: auto_test / simple / hard / auto_test:接近,周回,中央,ランダム (移動スタイルの重み)
+各組み合わせを先手・後手入れ替えて --games 回ずつ、全コアのワーカープロセスで並列に戦わせる。
+結果は1試合ごとに --checkpoint (JSON Lines) へ追記するので、中断しても同じコマンドで再開できる。
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import zlib
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# SDL が SIGINT/SIGTERM を横取りすると、中断時に terminate() でワーカーを止められない
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+
+# 一度にプールへ渡す試合数 (ワーカー数あたり)。中断したときに捨てる試合がこれ以上にならない
+BATCH_PER_WORKER = 4
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.selfplay import MATCH_FRAMES, elo_table, parse_policy, play_match, random_policy_specs
+
+
+def schedule(variants, games, base_seed):
+    """総当たりの全試合を (キー, 先手, 後手, シード) で列挙する"""
+    matches = []
+    for i, first in enumerate(variants):
+        for second in variants[i + 1:]:
+            for game_index in range(games):
+                for p1, p2 in ((first, second), (second, first)):
+                    key = f"{p1}|{p2}|{game_index}"
+                    seed = zlib.crc32(f"{base_seed}:{key}".encode())
+                    matches.append((key, p1, p2, seed))
+    return matches
+
+
+def load_checkpoint(path):
+    """チェックポイントから済んだ試合の結果を読む (途中で切れた最終行は無視する)"""
+    done = {}
+    if not path.exists():
+        return done
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[record["key"]] = record
+    return done
+
+
+def _run_match(match, max_frames):
+    key, p1, p2, seed = match
+    result = play_match(p1, p2, seed, max_frames=max_frames)
+    result.update({"key": key, "p1": p1, "p2": p2, "seed": seed})
+    return result
+
+
+def _run_match_task(args):
+    return _run_match(*args)
+
+
+def _ignore_interrupt():
+    """ワーカーは Ctrl-C を無視し、中断の処理は親プロセスに任せる"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def print_table(table):
+    print(f"{'順位':>4}  {'方策':<28} {'Elo':>7} {'95% CI':>17} {'試合':>5} {'得点率':>7}")
+    for rank, row in enumerate(table, 1):
+        ci = f"{row['low']:.0f} - {row['high']:.0f}"
+        print(
+            f"{rank:>4}  {row['name']:<28} {row['elo']:>7.0f} {ci:>17} "
+            f"{row['games']:>5} {row['score']:>7.1%}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 方策の総当たり自己対戦と Elo 集計")
+    parser.add_argument("--variants", nargs="*", default=["auto_test", "simple", "hard"])
+    parser.add_argument("--random-variants", type=int, default=0, help="移動スタイルの重みをランダムに振った auto_test を追加する数")
+    parser.add_argument("--games", type=int, default=1, help="組み合わせごと・先後ごとの試合数")
+    parser.add_argument("--frames", type=int, default=MATCH_FRAMES, help="1試合の上限フレーム数")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--checkpoint", type=Path, default=Path("tournament_results.jsonl"))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bootstrap", type=int, default=200, help="信頼区間のブートストラップ回数")
+    args = parser.parse_args()
+
+    variants = list(dict.fromkeys(args.variants + random_policy_specs(args.random_variants, args.seed)))
+    for spec in variants:
+        parse_policy(spec)  # 表記の誤りは対戦を始める前に報告する
+    if len(variants) < 2:
+        parser.error("方策は2つ以上必要です")
+
+    matches = schedule(variants, args.games, args.seed)
+    done = load_checkpoint(args.checkpoint)
+    pending = [match for match in matches if match[0] not in done]
+    print(f"方策 {len(variants)} 個, 全 {len(matches)} 試合 (済み {len(matches) - len(pending)}, 残り {len(pending)})")
+
+    start = time.time()
+    if pending:
+        pool = multiprocessing.Pool(args.workers, initializer=_ignore_interrupt, maxtasksperchild=50)
+        batch_size = args.workers * BATCH_PER_WORKER
+        finished = 0
+        try:
+            with args.checkpoint.open("a", encoding="utf-8") as checkpoint:
+                # 全試合を一度に渡すと、中断しても残りの試合をワーカーが最後まで続けてしまうので少しずつ渡す
+                for offset in range(0, len(pending), batch_size):
+                    tasks = [(match, args.frames) for match in pending[offset:offset + batch_size]]
+                    for record in pool.imap_unordered(_run_match_task, tasks):
+                        checkpoint.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        checkpoint.flush()
+                        done[record["key"]] = record
+                        finished += 1
+                        if finished % 50 == 0 or finished == len(pending):
+                            elapsed = time.time() - start
+                            remaining = elapsed / finished * (len(pending) - finished)
+                            print(f"  {finished}/{len(pending)} 試合 ({elapsed:.0f}秒経過, 残り約{remaining:.0f}秒)")
+        except KeyboardInterrupt:
+            # 済んだ試合はチェックポイントに書いてあるので、途中の試合は捨ててすぐ止める
+            pool.terminate()
+            pool.join()
+            print(f"中断しました ({finished}/{len(pending)} 試合済み)。同じコマンドで再開できます")
+            return 130
+        pool.close()
+        pool.join()
+
+    keys = {match[0] for match in matches}
+    results = [(r["p1"], r["p2"], r["score"]) for key, r in done.items() if key in keys]
+    print_table(elo_table(results, variants, bootstrap=args.bootstrap, seed=args.seed))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
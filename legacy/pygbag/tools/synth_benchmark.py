@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+タイトル BGM (synth/rockman_title.py) のレンダリング速度の計測スクリプト
+使用方法: python tools/synth_benchmark.py [--repeat 5]
+
+同じ楽譜を、NumPy の配列演算による現行の生成関数と、
+1サンプルずつ Python でループする旧実装の生成関数でレンダリングし、
+所要時間・速度比と、assets/sounds/rockman_title.wav との最大誤差 (LSB) を表示する。
+"""
+
+import argparse
+import sys
+import time
+import wave
+from array import array
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT / "synth"))
+
+import rockman_title
+
+
+# --- 旧実装 (1サンプルずつのループ)。比較のためだけに残す ---
+
+def reference_note(freq, duration, volume=0.5, duty=0.25):
+    samples = array('h', [0] * int(44100 * duration))
+    period = 44100 / freq
+    for i in range(len(samples)):
+        if (i % int(period)) < (int(period) * duty):
+            samples[i] = int(32767 * volume)
+        else:
+            samples[i] = int(-32767 * volume)
+    return samples
+
+
+def reference_drum_hit(freq, duration, volume=0.7):
+    samples = array('h', [0] * int(44100 * duration))
+    period = 44100 / freq
+    for i in range(len(samples)):
+        decay = np.exp(-(i / 44100) * 30)
+        if (i % int(period)) < (int(period) * 0.5):
+            samples[i] = int(32767 * volume * decay)
+        else:
+            samples[i] = int(-32767 * volume * decay)
+    return samples
+
+
+def reference_add_at(track, samples, start):
+    start_idx = int(start * rockman_title.SAMPLE_RATE)
+    for i in range(len(samples)):
+        if start_idx + i < len(track):
+            track[start_idx + i] += samples[i]
+
+
+def reference_mix(*sample_arrays):
+    mixed = array('h', [0] * max(len(arr) for arr in sample_arrays))
+    for samples in sample_arrays:
+        for i in range(len(samples)):
+            mixed[i] = max(min(mixed[i] + int(samples[i]), 32767), -32767)
+    return np.frombuffer(mixed, dtype=np.int16)
+
+
+class _ArrayTrackNumpy:
+    """generate_rockman_title 内の np.zeros だけを array('h') に置き換える"""
+
+    def __getattr__(self, name):
+        return getattr(np, name)
+
+    @staticmethod
+    def zeros(length, dtype=None):
+        return array('h', [0] * length)
+
+
+def render_reference():
+    """楽譜は現行のものを使い、生成・配置・ミックスとパートのバッファだけ旧実装に差し替える"""
+    with mock.patch.multiple(
+        rockman_title,
+        generate_note=reference_note,
+        generate_drum_hit=reference_drum_hit,
+        add_at=reference_add_at,
+        mix_samples=reference_mix,
+        np=_ArrayTrackNumpy(),
+    ):
+        return rockman_title.generate_rockman_title()
+
+
+def best_time(render, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = render()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="タイトル BGM のレンダリング速度 (配列演算 vs 旧実装)")
+    parser.add_argument("--repeat", type=int, default=5, help="現行実装の計測回数 (最速値を使う)")
+    args = parser.parse_args()
+
+    vectorized_time, vectorized = best_time(rockman_title.generate_rockman_title, args.repeat)
+    reference_time, reference = best_time(render_reference, 1)
+
+    with wave.open(str(ROOT / "assets" / "sounds" / "rockman_title.wav"), "rb") as wav_file:
+        shipped = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+
+    def max_error(samples):
+        if len(samples) != len(shipped):
+            return f"長さ不一致 ({len(samples)} / {len(shipped)})"
+        return f"{int(np.max(np.abs(samples.astype(np.int32) - shipped)))} LSB"
+
+    print(f"{'実装':<10} {'時間 ms':>10} {'WAV との最大誤差':>18}")
+    print(f"{'旧実装':<10} {reference_time * 1000:>10.1f} {max_error(reference):>18}")
+    print(f"{'配列演算':<10} {vectorized_time * 1000:>10.1f} {max_error(vectorized):>18}")
+    print(f"速度比: {reference_time / vectorized_time:.0f}倍")
+
+
+if __name__ == "__main__":
+    main()